@@ -7,6 +7,7 @@ from typing import Optional
 from PyQt5 import QtCore, QtWidgets
 
 from wagom_player import diagnostics
+from wagom_player.infrastructure.vlc_backend import preload_vlc_instance
 from wagom_player.logger import log_message
 from wagom_player.single_instance import (
     SingleInstanceServer,
@@ -186,6 +187,8 @@ def main(argv: list[str]) -> int:
 
     # ホストである限り mutex を保持し続ける必要があるため、app に紐付けて生かす。
     app._single_instance_lock = instance_lock
+    # 転送で終わる二次プロセスには不要なので、ホストに決まってから読み込みを始める
+    preload_vlc_instance()
 
     apply_dark_theme(app)
     apply_windows_app_user_model_id("wagom-player")
@@ -12,10 +12,19 @@ class FakeMedia:
         self.parsed = False
         self.duration = 125_000
         self.meta = {}
+        self.released = False
 
     def parse(self):
         self.parsed = True
 
+    def parse_with_options(self, flags, timeout):
+        self.parsed = True
+        self.parse_timeout = timeout
+        return 0
+
+    def release(self):
+        self.released = True
+
     def get_duration(self):
         return self.duration
 
@@ -155,8 +164,16 @@ class FakeVlc:
     class EventType:
         MediaPlayerEndReached = "ended"
         MediaPlayerPlaying = "playing"
+        MediaPlayerPaused = "paused"
+        MediaPlayerStopped = "stopped"
+        MediaPlayerTimeChanged = "time_changed"
+
+    class MediaParseFlag:
+        local = 0
 
     class State:
+        NothingSpecial = "NothingSpecial"
+        Paused = "Paused"
         Stopped = "Stopped"
         Ended = "Ended"
         Error = "Error"
@@ -1,3 +1,5 @@
+import errno
+import os
 from pathlib import Path
 
 import pytest
@@ -5,6 +7,8 @@ import pytest
 from wagom_player.file_actions import (
     InvalidMoveTargetError,
     TargetFileExistsError,
+    move_file,
+    move_file_no_clobber,
     move_file_to_path,
     move_file_to_subfolder,
     move_file_to_subfolder_as_unique,
@@ -38,6 +42,109 @@ def test_unique_target_path_avoids_existing_names(tmp_path: Path):
     assert unique_target_path_for_subfolder(str(source), "_ok") == str(target_dir / "movie (2).mp4")
 
 
+def test_move_file_renames_within_filesystem(tmp_path: Path):
+    source = tmp_path / "movie.mp4"
+    source.write_text("video", encoding="utf-8")
+    (tmp_path / "_ok").mkdir()
+    target = tmp_path / "_ok" / "movie.mp4"
+
+    assert move_file(str(source), str(target)) == str(target)
+
+    assert not source.exists()
+    assert target.read_text(encoding="utf-8") == "video"
+
+
+def test_move_file_copies_across_devices(tmp_path: Path, monkeypatch):
+    source = tmp_path / "movie.mp4"
+    source.write_bytes(b"x" * 3_000_000)
+    target = tmp_path / "movie-copy.mp4"
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(os, "replace", cross_device)
+
+    move_file(str(source), str(target))
+
+    assert not source.exists()
+    assert target.read_bytes() == b"x" * 3_000_000
+
+
+def test_move_file_across_devices_keeps_target_when_source_cannot_be_read(
+    tmp_path: Path, monkeypatch
+):
+    source = tmp_path / "unreadable.mp4"
+    source.mkdir()  # 開こうとすると失敗する
+    target = tmp_path / "taken.mp4"
+    target.write_text("existing", encoding="utf-8")
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(os, "replace", cross_device)
+
+    with pytest.raises(OSError):
+        move_file(str(source), str(target))
+
+    assert target.read_text(encoding="utf-8") == "existing"
+
+
+def test_move_file_no_clobber_refuses_existing_target(tmp_path: Path):
+    source = tmp_path / "movie.mp4"
+    source.write_text("source", encoding="utf-8")
+    target = tmp_path / "taken.mp4"
+    target.write_text("existing", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        move_file_no_clobber(str(source), str(target))
+
+    assert source.read_text(encoding="utf-8") == "source"
+    assert target.read_text(encoding="utf-8") == "existing"
+
+    free = tmp_path / "free.mp4"
+    assert move_file_no_clobber(str(source), str(free)) == str(free)
+    assert not source.exists()
+    assert free.read_text(encoding="utf-8") == "source"
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="hard link is required")
+def test_move_file_no_clobber_removes_link_when_source_unlink_fails(tmp_path: Path, monkeypatch):
+    source = tmp_path / "movie.mp4"
+    source.write_text("source", encoding="utf-8")
+    target = tmp_path / "moved.mp4"
+    monkeypatch.setattr("sys.platform", "linux")
+    original_unlink = os.unlink
+
+    def locked_source(path, *args, **kwargs):
+        if path == str(source):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), path)
+        return original_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "unlink", locked_source)
+
+    with pytest.raises(PermissionError):
+        move_file_no_clobber(str(source), str(target))
+
+    assert source.read_text(encoding="utf-8") == "source"
+    assert not target.exists()
+
+
+def test_move_file_to_path_reports_target_created_after_validation(tmp_path: Path):
+    source = tmp_path / "movie.mp4"
+    source.write_text("source", encoding="utf-8")
+    target = tmp_path / "_ok" / "movie.mp4"
+
+    def racing_move(src: str, dst: str) -> str:
+        Path(dst).write_text("sneaked-in", encoding="utf-8")
+        return move_file_no_clobber(src, dst)
+
+    with pytest.raises(TargetFileExistsError):
+        move_file_to_path(str(source), str(target), move_func=racing_move, retry_delays=(0.01,))
+
+    assert source.read_text(encoding="utf-8") == "source"
+    assert target.read_text(encoding="utf-8") == "sneaked-in"
+
+
 def test_move_file_to_path_moves_to_explicit_target(tmp_path: Path):
     source = tmp_path / "movie.mp4"
     source.write_text("video", encoding="utf-8")
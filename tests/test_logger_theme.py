@@ -31,6 +31,18 @@ def test_configure_session_log_and_log_message_write_files(monkeypatch, tmp_path
     assert (log_dir / "session-abc.txt").read_text(encoding="utf-8").endswith("hello\n")
 
 
+def test_log_message_formats_lazy_arguments(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    monkeypatch.setattr(logger, "_session_log_path", None)
+
+    logger.log_message("index=%d path=%s", 3, "a%b.mp4")
+    logger.log_message("no args keeps 100%")
+
+    text = (tmp_path / "wagom-player" / "logs" / "last-run.txt").read_text(encoding="utf-8")
+    assert "index=3 path=a%b.mp4\n" in text
+    assert text.endswith("no args keeps 100%\n")
+
+
 def test_configure_session_log_is_best_effort(monkeypatch):
     monkeypatch.setattr(logger, "logs_dir", lambda: "")
     monkeypatch.setattr(logger, "_session_log_path", "old")
@@ -70,6 +82,7 @@ def test_apply_dark_theme_and_app_icon(qapp):
     assert qapp.palette().color(QtGui.QPalette.Highlight) == QtGui.QColor(0, 120, 215)
     assert "QToolTip" in qapp.styleSheet()
     assert not icon.isNull()
+    assert theme.apply_app_icon(qapp) is icon
     assert isinstance(QtWidgets.QApplication.windowIcon(), QtGui.QIcon)
 
 
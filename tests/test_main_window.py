@@ -1,5 +1,7 @@
 import importlib
 import os
+import time
+import types
 
 import pytest
 
@@ -13,6 +15,12 @@ QtWidgets = pytest.importorskip("PyQt5.QtWidgets", exc_type=ImportError)
 main_window = importlib.import_module("wagom_player.ui.main_window")
 
 
+@pytest.fixture(autouse=True)
+def _isolated_vlc_instances(monkeypatch):
+    # Instance はプロセス内で共有されるため、テストごとに別の FakeVlc から作り直す
+    monkeypatch.setattr(main_window.vlc_backend, "_shared_instances", {})
+
+
 @pytest.fixture
 def player(qapp, monkeypatch, tmp_path):
     fake_vlc = FakeVlc()
@@ -45,16 +53,41 @@ def test_create_vlc_instance_passes_plugin_path(monkeypatch, tmp_path):
     assert instance.args == [f"--plugin-path={tmp_path}", "--audio-time-stretch"]
 
 
+def test_preloaded_vlc_instance_is_handed_to_the_first_create(monkeypatch):
+    fake_vlc = FakeVlc()
+    monkeypatch.setattr(main_window, "vlc", fake_vlc)
+    monkeypatch.setattr(main_window.vlc_backend, "vlc", fake_vlc)
+    monkeypatch.setattr(main_window.vlc_backend, "_preloaded_instance", None)
+
+    main_window.vlc_backend.preload_vlc_instance()
+    preloaded = main_window.vlc_backend._preloaded_instance.result(timeout=5)
+
+    assert main_window._create_vlc_instance() is preloaded
+    # 2 回目以降も同じ Instance を共有し、作り直しのときだけ別の Instance になる
+    assert main_window._create_vlc_instance() is preloaded
+    assert main_window._create_vlc_instance(fresh=True) is not preloaded
+    assert main_window._create_vlc_instance() is preloaded
+
+
 def test_video_player_initializes_ui_and_vlc_events(player):
     assert player.windowTitle() == "wagom-player"
     assert player.volume_slider.value() == 80
-    assert len(player.player.events.attached) == 2
+    assert len(player.player.events.attached) == 5
     attached_event_types = [event_type for event_type, _callback in player.player.events.attached]
-    assert attached_event_types == ["ended", "playing"]
+    assert attached_event_types == ["ended", "playing", "paused", "stopped", "time_changed"]
     assert player.btn_repeat.isCheckable()
     assert player.btn_shuffle.isCheckable()
 
 
+def test_deferred_settings_restore_repeat_state(player):
+    player.settings.setValue("repeat", True)
+
+    player._load_settings_deferred()
+
+    assert player.repeat_enabled
+    assert player.btn_repeat.isChecked()
+
+
 def test_vlc_end_generation_ignores_stale_events(player, monkeypatch):
     calls = []
     monkeypatch.setattr(player, "_on_vlc_end", lambda event: calls.append(event))
@@ -66,10 +99,18 @@ def test_vlc_end_generation_ignores_stale_events(player, monkeypatch):
 
 
 def test_create_fresh_vlc_player_rebinds_video_surface(player):
+    old_instance = player.vlc_instance
     player._create_fresh_vlc_player()
 
+    assert player.vlc_instance is not old_instance
+
     assert player.player.surface is not None
-    assert len(player.player.events.attached) == 2
+    assert len(player.player.events.attached) == 5
+
+    # 同じ player への再設定は省く
+    player.player.surface = None
+    player._bind_video_surface()
+    assert player.player.surface is None
 
 
 def test_stale_vlc_event_callback_is_ignored_after_fresh_player(player, monkeypatch):
@@ -84,7 +125,202 @@ def test_stale_vlc_event_callback_is_ignored_after_fresh_player(player, monkeypa
     assert calls == ["current"]
 
 
-def test_load_file_and_directory_collects_playlist_and_plays(player, tmp_path):
+def test_update_window_title_skips_unchanged_title(player, monkeypatch):
+    player.directory_playlist = ["a.mp4"]
+    player.current_index = 0
+    player._update_window_title()
+    titles = []
+    monkeypatch.setattr(player, "setWindowTitle", titles.append)
+
+    player._update_window_title()
+    assert titles == []
+
+    player._media_length = 65_000
+    player._update_window_title()
+    assert len(titles) == 1
+
+
+def test_update_window_title_skips_file_size_for_unchanged_inputs(player, monkeypatch):
+    player.directory_playlist = ["a.mp4", "b.mp4"]
+    player.current_index = 0
+    sizes = []
+    monkeypatch.setattr(player, "_current_file_size_bytes", lambda path: sizes.append(path) or 1)
+
+    player._update_window_title()
+    player._update_window_title()
+    assert sizes == ["a.mp4"]
+
+    player._invalidate_title_cache()
+    player._update_window_title()
+    assert sizes == ["a.mp4", "a.mp4"]
+
+
+def test_playlist_length_tracks_assignment_and_removal(player):
+    player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4"]
+    assert player._playlist_len == 3
+
+    player._remove_playlist_entry(1)
+    assert player.directory_playlist == ["a.mp4", "c.mp4"]
+    assert player._playlist_len == 2
+
+
+def test_playlist_removal_keeps_position_index_in_sync(player):
+    player.directory_playlist = ["a.mp4", "b.mp4", "a.mp4", "c.mp4"]
+
+    player._remove_playlist_entry(0)
+    assert player._path_to_index == {"b.mp4": 0, "a.mp4": 1, "c.mp4": 2}
+
+    player._remove_playlist_entry(1)
+    assert player._path_to_index == {"b.mp4": 0, "c.mp4": 1}
+
+
+def test_find_playlist_index_tolerates_unnormalized_paths(player, tmp_path):
+    player.directory_playlist = [str(tmp_path / "a.mp4"), str(tmp_path / "b.mp4")]
+
+    assert player._find_playlist_index(str(tmp_path / "b.mp4")) == 1
+    assert player._find_playlist_index(os.path.join(str(tmp_path), ".", "b.mp4")) == 1
+    assert player._find_playlist_index(str(tmp_path / "c.mp4")) == -1
+
+    # 正規化の対応表はリストを差し替えたら作り直す
+    player.directory_playlist = [str(tmp_path / "c.mp4")]
+    assert player._find_playlist_index(os.path.join(str(tmp_path), ".", "c.mp4")) == 0
+
+
+def test_vlc_state_events_drive_play_button_without_polling(player):
+    callbacks = dict(player.player.events.attached)
+
+    callbacks["playing"]("event")
+    assert player._last_playing_state is True
+    assert player.btn_play.toolTip() == "一時停止"
+
+    callbacks["paused"]("event")
+    assert player._last_playing_state is False
+    assert player.btn_play.toolTip() == "再生"
+
+    # ステータス更新タイマーはボタン表示を問い合わせ直さない
+    player.player.playing = True
+    player._update_status_time()
+    assert player._last_playing_state is False
+
+
+def test_vlc_time_events_update_position_without_polling(player, monkeypatch):
+    callbacks = dict(player.player.events.attached)
+    player.player.length = 120_000
+    monkeypatch.setattr(
+        player.vlc_player,
+        "get_time",
+        lambda *args, **kwargs: pytest.fail("position must come from the event"),
+    )
+
+    callbacks["time_changed"](types.SimpleNamespace(u=types.SimpleNamespace(new_time=30_000)))
+    assert player._media_length == 120_000
+    assert player.seek_slider.value() == 30_000
+
+    # 間隔未満の変化は UI スレッドへ送らない
+    callbacks["time_changed"](types.SimpleNamespace(u=types.SimpleNamespace(new_time=30_100)))
+    assert player._last_time_event_ms == 30_000
+    assert player.seek_slider.value() == 30_000
+
+
+def test_vlc_time_event_throttle_resets_on_track_switch_and_seek(player):
+    player.directory_playlist = ["a.mp4", "b.mp4"]
+    player.play_at(0)
+    emitted = []
+    player.vlc_events.time_changed.connect(emitted.append)
+    callbacks = dict(player.player.events.attached)
+
+    def time_event(ms):
+        callbacks["time_changed"](types.SimpleNamespace(u=types.SimpleNamespace(new_time=ms)))
+
+    time_event(100)
+    assert emitted == [100]
+
+    # 次の曲の先頭付近の位置も、前の曲の位置に近いからといって捨てない
+    player.play_at(1)
+    time_event(150)
+    assert emitted == [100, 150]
+
+    # シーク直後も同じ
+    player._apply_seek(200)
+    time_event(210)
+    assert emitted == [100, 150, 210]
+
+
+def test_status_tick_polls_vlc_once_per_value(player, monkeypatch):
+    player.player.length = 120_000
+    player.player.time = 5_000
+    player.player.state = "Playing"
+    calls = []
+    for name in ("get_state", "get_time", "get_length"):
+        original = getattr(player.vlc_player, name)
+        monkeypatch.setattr(
+            player.vlc_player,
+            name,
+            lambda *args, _name=name, _original=original: calls.append(_name) or _original(*args),
+        )
+
+    player._update_status_time()
+
+    assert sorted(calls) == ["get_length", "get_state", "get_time"]
+
+
+def test_open_files_dialog_opens_without_blocking_and_loads_selection(
+    player, monkeypatch, tmp_path
+):
+    opened = []
+    loaded = []
+    monkeypatch.setattr(main_window.QtWidgets.QFileDialog, "open", lambda self: opened.append(self))
+    monkeypatch.setattr(player, "_load_file_and_directory", loaded.append)
+
+    player.open_files_dialog()
+
+    assert len(opened) == 1
+    dialog = opened[0]
+    assert dialog.nameFilters()[0].startswith("動画ファイル (")
+
+    # 開いている間は重ねて開かない
+    player.open_files_dialog()
+    assert opened == [dialog]
+    assert "*.mkv" in main_window._VIDEO_FILE_FILTER
+
+    selected = str(tmp_path / "movie.mp4")
+    dialog.fileSelected.emit(selected)
+    assert loaded == [selected]
+    assert player.settings.value("last_dir") == str(tmp_path)
+
+    dialog.finished.emit(QtWidgets.QDialog.Accepted)
+    assert player._open_file_dialog is None
+
+
+def test_move_and_resize_coalesce_overlay_geometry_updates(player, monkeypatch):
+    updates = []
+    monkeypatch.setattr(player.overlay, "update_geometry", lambda: updates.append(True))
+    monkeypatch.setattr(player.duration_overlay_label, "isVisible", lambda: True)
+
+    for _ in range(3):
+        player.moveEvent(QtGui.QMoveEvent(QtCore.QPoint(1, 1), QtCore.QPoint(0, 0)))
+        player.resizeEvent(QtGui.QResizeEvent(QtCore.QSize(800, 600), QtCore.QSize(640, 480)))
+
+    assert updates == []
+    assert player._overlay_geometry_timer.isActive()
+    player._overlay_geometry_timer.stop()
+    player._overlay_geometry_timer.timeout.emit()
+    assert updates == [True]
+
+
+def test_slider_styles_are_scoped_to_the_sliders(player):
+    assert player.styleSheet() == ""
+    assert "#VolumeSlider" in player.volume_slider.styleSheet()
+    assert "#SeekSlider" in player.seek_slider.styleSheet()
+
+
+def test_toggled_icons_are_prerendered_pixmaps(player):
+    for icon in (player._icon_play, player._icon_pause, player._icon_repeat_on):
+        assert not icon.isNull()
+        assert icon.availableSizes() == [QtCore.QSize(18, 18)]
+
+
+def test_load_file_and_directory_collects_playlist_and_plays(player, qapp, tmp_path):
     first = tmp_path / "clip2.mp4"
     second = tmp_path / "clip10.mp4"
     first.write_text("", encoding="utf-8")
@@ -92,6 +328,15 @@ def test_load_file_and_directory_collects_playlist_and_plays(player, tmp_path):
 
     player._load_file_and_directory(str(second))
 
+    # 走査を待たずに指定ファイルの再生を始める
+    assert player.player.played == 1
+    assert player.directory_playlist == [str(second)]
+
+    deadline = time.monotonic() + 5
+    while player._pending_scan_file and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+
     assert [os.path.basename(path) for path in player.directory_playlist] == [
         "clip2.mp4",
         "clip10.mp4",
@@ -101,6 +346,21 @@ def test_load_file_and_directory_collects_playlist_and_plays(player, tmp_path):
     assert player.windowTitle().startswith("[2/2] clip10.mp4")
 
 
+def test_directory_scan_result_ignored_when_stale_or_playlist_changed(player, tmp_path):
+    target = str(tmp_path / "b.mp4")
+    scanned = [str(tmp_path / "a.mp4"), target]
+    player._pending_scan_file = target
+    player.directory_playlist = [target]
+    player.current_index = 0
+
+    player._on_directory_scanned(-1, str(tmp_path), scanned, None)
+    assert player.directory_playlist == [target]
+
+    player.directory_playlist = [str(tmp_path / "other.mp4")]
+    player._on_directory_scanned(player.directory_scanner._token, str(tmp_path), scanned, None)
+    assert player.directory_playlist == [str(tmp_path / "other.mp4")]
+
+
 def test_open_external_file_ignores_missing_and_duplicate(player, tmp_path, monkeypatch):
     loaded = []
     file_path = tmp_path / "movie.mp4"
@@ -168,6 +428,8 @@ def test_playback_controls_seek_rate_volume_and_mute(player):
     player.seek_by(20_000)
     assert player.player.time == 110_000
     player.seek_by(-200_000)
+    # 直後のキーリピートは SEEK_COALESCE_MS 後にまとめて反映される
+    player._flush_pending_seek()
     assert player.player.time == 0
 
     player.player.fps = 25.0
@@ -193,10 +455,74 @@ def test_playback_controls_seek_rate_volume_and_mute(player):
     player.volume_slider.setValue(95)
     player._adjust_volume(10)
     assert player.volume_slider.value() == 100
+    player._adjust_volume(-30)
+    assert player.volume_slider.value() == 70
     player._toggle_mute()
     assert player._muted
 
 
+def test_repeated_seek_uses_recent_target_instead_of_stale_player_time(player):
+    player._media_length = 120_000
+    player.player.length = 120_000
+    player.player.time = 10_000
+
+    player.seek_by(10_000)
+    # libVLC 側の位置更新が追いつく前に次のキーリピートが来た想定
+    player.player.time = 10_000
+    player.seek_by(10_000)
+    player._flush_pending_seek()
+
+    assert player.player.time == 30_000
+
+
+def test_seek_by_coalesces_key_repeat_and_skips_tiny_moves(player, monkeypatch):
+    player._media_length = 120_000
+    player.player.length = 120_000
+    player.player.time = 10_000
+    calls = []
+    original = player.player.set_time
+    monkeypatch.setattr(player.player, "set_time", lambda t: calls.append(t) or original(t))
+
+    player.seek_by(10_000)
+    player.seek_by(10_000)
+    player.seek_by(10_000)
+    assert calls == [20_000]
+
+    player._flush_pending_seek()
+    assert calls == [20_000, 40_000]
+
+    # 先頭付近で戻っても 0 のままなら libVLC には渡さない
+    player._cancel_pending_seek()
+    player._remember_time(100)
+    player.seek_by(-10_000)
+    assert calls == [20_000, 40_000]
+
+
+def test_volume_drag_is_applied_once_with_latest_value(player):
+    player.volume_slider.setValue(50)
+    player.volume_slider.setValue(40)
+    player.volume_slider.setValue(30)
+
+    assert player.volume_label.text() == "音量: 30%"
+    assert player._volume_apply_timer.isActive()
+    assert player.player.volume != 30
+
+    player._apply_pending_volume()
+
+    assert player.player.volume == 30
+    assert not player._volume_apply_timer.isActive()
+
+
+def test_volume_drag_release_applies_pending_volume_immediately(player):
+    player.volume_slider.setValue(25)
+    assert player._volume_apply_timer.isActive()
+
+    player.volume_slider.sliderReleased.emit()
+
+    assert player.player.volume == 25
+    assert not player._volume_apply_timer.isActive()
+
+
 def test_frame_step_falls_back_when_fps_is_unavailable(player):
     player.player.fps = 0
     player.player.time = 1_000
@@ -395,6 +721,7 @@ def test_menu_bar_contains_common_player_menus(player):
 def test_status_time_updates_slider_warning_and_snapshot(player):
     player.directory_playlist = ["a.mp4"]
     player.current_index = 0
+    player.player.state = "Playing"
     player.player.time = 119_000
     player.player.length = 120_000
 
@@ -404,10 +731,155 @@ def test_status_time_updates_slider_warning_and_snapshot(player):
     assert player.seek_slider.value() == 119_000
     assert player._media_length == 120_000
     assert player._is_seek_bar_warning
+    assert player.seek_slider.property("warning") is True
 
     player.player.time = 1_000
     player._update_status_time()
     assert not player._is_seek_bar_warning
+    assert player.seek_slider.property("warning") is False
+
+
+def test_duration_overlay_shown_once_per_media(player, monkeypatch):
+    shown = []
+    monkeypatch.setattr(player, "_show_overlay", lambda text, *args: shown.append(text))
+    player.player.state = "Playing"
+    player.player.time = 1_000
+    player.player.length = 120_000
+    player._update_status_time()
+
+    # メタデータ確定で長さが少し変わっても再表示しない
+    player.player.length = 121_000
+    player._update_status_time()
+
+    assert shown == ["02:00"]
+    assert player.seek_slider.maximum() == 121_000
+
+
+def test_status_time_does_not_poll_is_playing(player, monkeypatch):
+    player.player.state = "Playing"
+
+    def fail():
+        raise AssertionError("is_playing polled from status tick")
+
+    monkeypatch.setattr(player.player, "is_playing", fail)
+    player._set_play_state(True)
+    player._update_status_time()
+
+    assert main_window.diagnostics._state_snapshot["playing"] is True
+
+
+def test_status_time_skips_polling_while_paused_but_seek_updates_slider(player):
+    player.player.state = "Paused"
+    player._media_length = 120_000
+    player.seek_slider.setRange(0, 120_000)
+    player.player.time = 30_000
+    player.player.length = 120_000
+
+    player._update_status_time()
+    assert player.seek_slider.value() == 0
+
+    player.seek_by(10_000)
+    assert player.seek_slider.value() == 40_000
+
+
+def test_seek_drag_uses_precise_short_status_interval(player):
+    player._on_seek_pressed()
+    assert player.timer.timerType() == QtCore.Qt.PreciseTimer
+    assert player.timer.interval() == player.STATUS_SEEKING_INTERVAL_MS
+
+    player._on_seek_released()
+    assert player.timer.timerType() == QtCore.Qt.CoarseTimer
+    assert player.timer.interval() == player.STATUS_INTERVAL_MS
+
+
+def test_status_timer_runs_only_while_playing_and_visible(player):
+    player.show()
+    assert not player.timer.isActive()
+
+    player.vlc_events.playing_state_changed.emit(True)
+    assert player.timer.isActive()
+
+    player.vlc_events.playing_state_changed.emit(False)
+    assert not player.timer.isActive()
+
+    player.vlc_events.playing_state_changed.emit(True)
+    player.hide()
+    assert not player.timer.isActive()
+
+
+def test_status_time_skips_sub_pixel_slider_updates(player):
+    player.player.state = "Playing"
+    player.player.length = 3_600_000
+    player.seek_slider.resize(360, 22)
+    player.player.time = 100_000
+    player._update_status_time()
+    assert player.seek_slider.value() == 100_000
+
+    # 1px = 10 秒のスライダーで 0.2 秒進んでも値は据え置く
+    player.player.time = 100_200
+    player._update_status_time()
+    assert player.seek_slider.value() == 100_000
+
+    player.player.time = 110_000
+    player._update_status_time()
+    assert player.seek_slider.value() == 110_000
+
+
+def test_status_time_reuses_total_string_and_skips_same_message(player, monkeypatch):
+    player.player.state = "Playing"
+    player.player.length = 125_000
+    player.player.time = 1_000
+    formatted = []
+    original = player._format_ms
+    monkeypatch.setattr(player, "_format_ms", lambda ms: formatted.append(ms) or original(ms))
+    shown = []
+    monkeypatch.setattr(player.time_label, "setText", shown.append)
+
+    player._update_status_time()
+    player.player.time = 1_200
+    player._update_status_time()
+
+    assert formatted.count(125_000) == 1
+    # 同じ秒の再生位置は整形もしない
+    assert 1_200 not in formatted
+    assert shown == ["00:01 / 02:05"]
+
+
+def test_persistent_status_message_keeps_priority_message(player):
+    player._show_persistent_status_message("再生中: b.mp4")
+    assert player.status.currentMessage() == "再生中: b.mp4"
+
+    player._show_status_message("移動完了: a.mp4", 5000)
+    player._show_persistent_status_message("再生中: c.mp4")
+    assert player.status.currentMessage() == "移動完了: a.mp4"
+
+
+def test_playback_position_updates_seek_slider_without_signals(player):
+    changed = []
+    player.seek_slider.valueChanged.connect(changed.append)
+    player.seek_slider.setRange(0, 120_000)
+
+    player._show_playback_position(60_000, 120_000)
+
+    assert player.seek_slider.value() == 60_000
+    assert changed == []
+    assert not player.seek_slider.signalsBlocked()
+
+
+def test_playback_position_goes_to_the_time_label(player):
+    player._media_length = 120_000
+
+    player._on_slider_moved(20_000)
+    assert player.time_label.text() == "00:20 / 02:00"
+
+    # 優先メッセージの表示中も再生位置は別の欄なので更新できる
+    player._show_status_message("移動完了: a.mp4", 5000)
+    player._on_slider_moved(30_000)
+    assert player.time_label.text() == "00:30 / 02:00"
+    assert player.status.currentMessage() == "移動完了: a.mp4"
+
+    player._apply_stopped_ui_state()
+    assert player.time_label.text() == ""
 
 
 def test_slider_handlers_set_player_time_and_status(player):
@@ -426,7 +898,7 @@ def test_slider_handlers_set_player_time_and_status(player):
 def test_repeat_and_shuffle_toggles(player, monkeypatch):
     player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4"]
     player.current_index = 1
-    monkeypatch.setattr("random.shuffle", lambda items: items.reverse())
+    monkeypatch.setattr(player._random, "shuffle", lambda items: items.reverse())
 
     player._on_repeat_toggled(True)
     assert player.repeat_enabled
@@ -441,13 +913,32 @@ def test_repeat_and_shuffle_toggles(player, monkeypatch):
     assert player.shuffled_playlist == []
 
 
-def test_play_next_previous_and_media_end_schedule_expected_indices(player, monkeypatch):
-    calls = []
+def test_toggle_icons_are_swapped_only_on_state_change(player):
+    swaps = []
+    player.btn_shuffle.setIcon = swaps.append
+    player.btn_repeat.setIcon = swaps.append
+
+    player._update_shuffle_button()
+    player._update_repeat_button()
+    assert swaps == []
+
+    player.shuffle_enabled = True
+    player._update_shuffle_button()
+    player._update_shuffle_button()
+    assert swaps == [player._icon_shuffle_on]
+
+
+def _flush_next_track_immediately(player, monkeypatch):
     monkeypatch.setattr(
-        main_window.QtCore.QTimer,
-        "singleShot",
-        lambda _delay, callback: callback(),
+        player._next_track_timer,
+        "start",
+        lambda _delay: player._flush_next_track(),
     )
+
+
+def test_play_next_previous_and_media_end_schedule_expected_indices(player, monkeypatch):
+    calls = []
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
     player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4"]
     player.current_index = 1
@@ -467,11 +958,29 @@ def test_play_next_previous_and_media_end_schedule_expected_indices(player, monk
     assert end_calls == [(2, "from_end")]
 
 
+def test_adjacent_index_follows_shuffle_order_and_removals(player):
+    player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4", "d.mp4"]
+    player.shuffle_enabled = True
+    player.shuffled_playlist = ["c.mp4", "a.mp4", "d.mp4", "b.mp4"]
+    player.current_index = 0
+
+    assert player._adjacent_index(1) == 3
+    assert player._adjacent_index(-1) == 2
+
+    player._remove_shuffled_entry("d.mp4")
+    player._remove_playlist_entry(3)
+    assert player._adjacent_index(1) == 1
+    assert player._find_playlist_index("c.mp4") == 2
+
+    player.current_index = 1
+    assert player._adjacent_index(1) is None
+
+
 def test_media_end_repeat_reloads_current_media(player, monkeypatch):
     monkeypatch.setattr(
         main_window.QtCore.QTimer,
         "singleShot",
-        lambda _delay, callback: callback(),
+        lambda *args: args[-1](),
     )
     player.directory_playlist = ["a.mp4", "b.mp4"]
     player.current_index = 0
@@ -484,11 +993,81 @@ def test_media_end_repeat_reloads_current_media(player, monkeypatch):
 
     assert player.vlc_instance.created_media[-1].path == "a.mp4"
     assert player.vlc_instance.created_media[-1].parsed
+    assert player.vlc_instance.created_media[-1].parse_timeout == player.MEDIA_PARSE_TIMEOUT_MS
     assert player.player.media.path == "a.mp4"
     assert player.player.playing
     assert player.seek_slider.maximum() == 0
 
 
+def test_play_at_skips_stop_when_idle_and_releases_previous_media(player):
+    player.directory_playlist = ["a.mp4", "b.mp4"]
+    player.player.state = "Stopped"
+
+    player.play_at(0)
+    first = player.vlc_instance.created_media[-1]
+    assert player.player.stopped == 0
+    assert first.parsed
+
+    player.play_at(1)
+    assert player.player.stopped == 1
+    assert first.released
+    assert player.player.media.path == "b.mp4"
+    assert not player.player.media.released
+
+
+def test_player_needs_stop_only_outside_idle_states(player):
+    player.player.state = "Stopped"
+    assert not player._player_needs_stop()
+    idle_states = player._idle_vlc_states
+
+    player.player.state = "Paused"
+    assert player._player_needs_stop()
+    # 待機状態の集合は一度解決したら使い回す
+    assert player._idle_vlc_states is idle_states
+    assert idle_states[1] == frozenset({"NothingSpecial", "Stopped", "Ended"})
+
+
+def test_play_at_uses_media_prepared_for_next_track(player):
+    player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4"]
+    player.shuffle_enabled = False
+
+    player.play_at(0)
+    assert player._next_media_timer.isActive()
+    player._prepare_next_media()
+    prepared = player.vlc_instance.created_media[-1]
+    assert prepared.path == "b.mp4"
+    assert prepared.parsed
+
+    created = len(player.vlc_instance.created_media)
+    player.play_at(1)
+    assert len(player.vlc_instance.created_media) == created
+    assert player.player.media is prepared
+
+    # 予測が外れたら用意したメディアは解放し、新しく作る
+    player._prepare_next_media()
+    stale = player.vlc_instance.created_media[-1]
+    player.play_at(0)
+    assert stale.released
+    assert player.player.media.path == "a.mp4"
+
+
+def test_replaying_same_path_reuses_current_media(player):
+    player.directory_playlist = ["a.mp4", "b.mp4"]
+    player.shuffle_enabled = False
+
+    player.play_at(0)
+    current = player.player.media
+    created = len(player.vlc_instance.created_media)
+
+    player.play_at(0)
+    player._repeat_restart_path = "a.mp4"
+    player._restart_current()
+
+    assert len(player.vlc_instance.created_media) == created
+    assert player.player.media is current
+    assert not current.released
+
+
 def test_move_current_file_updates_playlist_without_real_play(player, tmp_path, monkeypatch):
     first = tmp_path / "a.mp4"
     second = tmp_path / "b.mp4"
@@ -497,11 +1076,7 @@ def test_move_current_file_updates_playlist_without_real_play(player, tmp_path,
     player.directory_playlist = [str(first), str(second)]
     player.current_index = 0
     calls = []
-    monkeypatch.setattr(
-        main_window.QtCore.QTimer,
-        "singleShot",
-        lambda _delay, callback: callback(),
-    )
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
 
     player._move_current_file_and_play_next("_ok")
@@ -514,6 +1089,33 @@ def test_move_current_file_updates_playlist_without_real_play(player, tmp_path,
     assert not player._file_operation_in_progress
 
 
+def test_move_current_file_relocates_entry_after_playlist_replaced(player, tmp_path, monkeypatch):
+    first = tmp_path / "b.mp4"
+    first.write_text("b", encoding="utf-8")
+    player.directory_playlist = [str(first)]
+    player.current_index = 0
+    calls = []
+    _flush_next_track_immediately(player, monkeypatch)
+    monkeypatch.setattr(player, "play_at", calls.append)
+    run_io = player._run_file_io_without_blocking_ui
+    scanned = [str(tmp_path / "a.mp4"), str(first), str(tmp_path / "c.mp4")]
+
+    def _run_io_while_scan_finishes(func):
+        # 移動の待ち時間中にディレクトリ走査の結果が反映された状況
+        if player.directory_playlist == [str(first)]:
+            player.directory_playlist = list(scanned)
+            player.current_index = 1
+        return run_io(func)
+
+    monkeypatch.setattr(player, "_run_file_io_without_blocking_ui", _run_io_while_scan_finishes)
+
+    player._move_current_file_and_play_next("_ok")
+
+    assert (tmp_path / "_ok" / "b.mp4").exists()
+    assert player.directory_playlist == [scanned[0], scanned[2]]
+    assert calls == [1]
+
+
 def test_move_current_file_target_exists_cancel_keeps_playlist_and_playback(player, tmp_path):
     first = tmp_path / "a.mp4"
     second = tmp_path / "b.mp4"
@@ -554,11 +1156,7 @@ def test_move_current_file_target_exists_delete_sends_source_to_trash(
     trashed = []
     player.trash_service = TrashService(lambda path: trashed.append(path))
     calls = []
-    monkeypatch.setattr(
-        main_window.QtCore.QTimer,
-        "singleShot",
-        lambda _delay, callback: callback(),
-    )
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
 
     player._move_current_file_and_play_next("_ok")
@@ -587,6 +1185,7 @@ def test_move_current_file_target_exists_delete_keeps_playlist_when_trash_fails(
         lambda path: (_ for _ in ()).throw(RuntimeError("trash failed"))
     )
     calls = []
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
 
     player._move_current_file_and_play_next("_ok")
@@ -632,6 +1231,7 @@ def test_move_current_file_release_timeout_aborts_operation(player, tmp_path, mo
     trashed = []
     player.trash_service = TrashService(lambda path: trashed.append(path))
     calls = []
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
 
     player._move_current_file_and_play_next("_ok")
@@ -705,11 +1305,7 @@ def test_move_current_file_target_exists_rename_saves_with_unique_name(
     player.current_index = 0
     player._prompt_target_file_exists = lambda *args, **kwargs: "rename"
     calls = []
-    monkeypatch.setattr(
-        main_window.QtCore.QTimer,
-        "singleShot",
-        lambda _delay, callback: callback(),
-    )
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
 
     player._move_current_file_and_play_next("_ok")
@@ -733,11 +1329,7 @@ def test_move_current_file_shuffle_uses_remembered_next_path(player, tmp_path, m
     player.shuffle_enabled = True
     player.shuffled_playlist = [str(second), str(first), str(third)]
     calls = []
-    monkeypatch.setattr(
-        main_window.QtCore.QTimer,
-        "singleShot",
-        lambda _delay, callback: callback(),
-    )
+    _flush_next_track_immediately(player, monkeypatch)
     monkeypatch.setattr(player, "play_at", calls.append)
 
     player._move_current_file_and_play_next("_ok")
@@ -746,6 +1338,19 @@ def test_move_current_file_shuffle_uses_remembered_next_path(player, tmp_path, m
     assert calls == [0]
 
 
+def test_file_io_runs_off_the_ui_thread_and_reraises(player):
+    import threading
+
+    main_thread = threading.get_ident()
+    assert player._run_file_io_without_blocking_ui(threading.get_ident) != main_thread
+
+    def fail():
+        raise OSError("locked")
+
+    with pytest.raises(OSError, match="locked"):
+        player._run_file_io_without_blocking_ui(fail)
+
+
 def test_media_end_ignored_during_file_operation(player, monkeypatch):
     player.directory_playlist = ["a.mp4", "b.mp4"]
     player.current_index = 0
@@ -803,6 +1408,36 @@ def test_mute_state_updates_only_when_vlc_toggle_succeeds(player):
     assert "ミュート切替に失敗" in player.status.currentMessage()
 
 
+def test_volume_change_with_same_value_is_ignored(player):
+    player.volume_slider.setValue(42)
+    player._apply_pending_volume()
+    texts = []
+    original = player.volume_label.setText
+    player.volume_label.setText = lambda text: texts.append(text) or original(text)
+
+    player._on_volume_changed(42)
+    player._update_volume_label()
+
+    assert not player._volume_apply_timer.isActive()
+    assert texts == []
+
+
+def test_volume_icon_pixmap_is_swapped_only_when_mute_changes(player):
+    swaps = []
+    original = player.volume_icon.setPixmap
+    player.volume_icon.setPixmap = lambda pixmap: swaps.append(pixmap) or original(pixmap)
+    player._muted = False
+
+    player.volume_slider.setValue(40)
+    player.volume_slider.setValue(35)
+    assert swaps == []
+
+    player._muted = True
+    player._update_volume_label()
+    player._update_volume_label()
+    assert swaps == [player._pix_mute]
+
+
 def test_vlc_adapter_coerces_invalid_numeric_results(player, monkeypatch):
     errors = []
     monkeypatch.setattr(
@@ -933,6 +1568,23 @@ def test_ctrl_arrow_long_seek_bound_as_application_shortcut(player):
     )
 
 
+def test_arrow_shortcuts_call_bound_slots_with_auto_repeat(player, monkeypatch):
+    seeks = []
+    volumes = []
+    monkeypatch.setattr(player, "seek_by", seeks.append)
+    monkeypatch.setattr(player, "_adjust_volume", volumes.append)
+
+    player._short_seek_backward()
+    player._short_seek_forward()
+    player._volume_up()
+    player._volume_down()
+
+    assert seeks == [-player.SEEK_SHORT_MS, player.SEEK_SHORT_MS]
+    assert volumes == [10, -10]
+    assert player._sc_left.autoRepeat()
+    assert player._sc_up.autoRepeat()
+
+
 def test_ctrl_arrow_long_seek_throttles_autorepeat(player, monkeypatch):
     seeks = []
     monkeypatch.setattr(player, "seek_by", seeks.append)
@@ -961,6 +1613,7 @@ def test_ctrl_arrow_long_seek_throttles_autorepeat(player, monkeypatch):
 def test_status_time_does_not_overwrite_priority_message(player):
     player.directory_playlist = ["a.mp4"]
     player.current_index = 0
+    player.player.state = "Playing"
     player.player.time = 5_000
     player.player.length = 60_000
 
@@ -975,11 +1628,7 @@ def test_status_time_does_not_overwrite_priority_message(player):
 
 def test_media_end_ending_flag_stays_true_until_end_after(player, monkeypatch):
     scheduled = []
-    monkeypatch.setattr(
-        main_window.QtCore.QTimer,
-        "singleShot",
-        lambda _, cb: scheduled.append(cb),
-    )
+    monkeypatch.setattr(player._next_track_timer, "start", scheduled.append)
     player.directory_playlist = ["a.mp4", "b.mp4"]
     player.current_index = 0
     player.repeat_enabled = False
@@ -997,11 +1646,44 @@ def test_media_end_ending_flag_stays_true_until_end_after(player, monkeypatch):
     # timer 発火: _end_after が _ending をリセット
     play_calls = []
     monkeypatch.setattr(player, "play_at", play_calls.append)
-    scheduled[0]()
+    player._flush_next_track()
     assert not player._ending
     assert play_calls == [1]
 
 
+def test_next_track_requests_share_one_timer_and_keep_the_latest(player, monkeypatch):
+    player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4"]
+    player.current_index = 1
+    play_calls = []
+    monkeypatch.setattr(player, "play_at", play_calls.append)
+
+    player._on_media_end()
+    assert player._ending
+    player.play_previous()
+    assert player._next_track_timer.isActive()
+
+    player._next_track_timer.stop()
+    player._flush_next_track()
+    assert play_calls == [0]
+    assert not player._ending
+    # 予約は一度きり
+    player._flush_next_track()
+    assert play_calls == [0]
+
+
+def test_scheduled_track_switch_prefetches_the_target_file(player, monkeypatch):
+    prefetched = []
+    monkeypatch.setattr(main_window, "prefetch_in_background", prefetched.append)
+    player.directory_playlist = ["a.mp4", "b.mp4", "c.mp4"]
+    player.current_index = 0
+    player.shuffle_enabled = False
+
+    player.play_next()
+
+    assert prefetched == ["b.mp4"]
+    player._next_track_timer.stop()
+
+
 def test_end_after_resets_ending_even_on_play_at_exception(player, monkeypatch):
     player.directory_playlist = ["a.mp4", "b.mp4"]
     player.current_index = 0
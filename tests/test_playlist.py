@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from wagom_player import playlist
@@ -7,6 +8,18 @@ def test_is_supported_video_file_is_case_insensitive():
     assert playlist.is_supported_video_file("sample.MP4")
     assert playlist.is_supported_video_file("sample.m2ts")
     assert not playlist.is_supported_video_file("sample.txt")
+    assert not playlist.is_supported_video_file(os.path.join("dir.mp4", "noext"))
+    assert not playlist.is_supported_video_file(".mp4")
+
+
+def test_split_digits_keeps_numbers_at_odd_positions():
+    assert playlist._split_digits("a10b2") == ["a", "10", "b", "2", ""]
+
+
+def test_natural_key_alternates_text_and_numbers():
+    assert playlist.natural_key("/tmp/Ep10b2.mkv") == ("ep", 10, "b", 2, ".mkv")
+    # \d にかからない数字風の文字(上付き)は文字列として扱う
+    assert playlist.natural_key("/tmp/x²") == ("x²",)
 
 
 def test_collect_video_files_filters_and_sorts(tmp_path: Path):
@@ -20,3 +33,14 @@ def test_collect_video_files_filters_and_sorts(tmp_path: Path):
         "clip2.mp4",
         "clip10.mp4",
     ]
+
+
+def test_collect_video_files_skips_directories_and_dotfiles(tmp_path: Path):
+    (tmp_path / "folder.mp4").mkdir()
+    (tmp_path / ".mp4").write_text("", encoding="utf-8")
+    (tmp_path / "mp4").write_text("", encoding="utf-8")
+    (tmp_path / "clip.mp4").write_text("", encoding="utf-8")
+
+    files = playlist.collect_video_files(str(tmp_path))
+
+    assert files == [str(tmp_path / "clip.mp4")]
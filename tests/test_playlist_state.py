@@ -62,3 +62,5 @@ def test_next_index_after_removal_for_shuffle_order():
     assert next_index_after_removal(directory, 1, True, "c.mp4") == 1
     assert next_index_after_removal(directory, 1, True, "missing.mp4") is None
     assert next_index_after_removal(directory, 1, True, None) is None
+    assert next_index_after_removal(directory, 1, True, "c.mp4", {"c.mp4": 1}) == 1
+    assert next_index_after_removal(directory, 1, True, "missing.mp4", {"c.mp4": 1}) is None
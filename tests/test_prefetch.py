@@ -0,0 +1,14 @@
+from wagom_player.infrastructure.prefetch import prefetch_file_head
+
+
+def test_prefetch_file_head_reads_without_error(tmp_path):
+    target = tmp_path / "movie.mp4"
+    target.write_bytes(b"x" * 1024)
+
+    prefetch_file_head(str(target), size=512)
+
+    assert target.read_bytes() == b"x" * 1024
+
+
+def test_prefetch_file_head_ignores_missing_file(tmp_path):
+    prefetch_file_head(str(tmp_path / "missing.mp4"))
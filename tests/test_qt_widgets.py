@@ -33,6 +33,8 @@ def test_metadata_dialog_copy_to_clipboard(qapp):
 
     assert QtWidgets.QApplication.clipboard().text() == "name: movie.mp4"
     assert dialog.copy_button.text() == "コピーしました！"
+    assert not dialog.text_edit.isUndoRedoEnabled()
+    assert dialog.text_edit.lineWrapMode() == QtWidgets.QPlainTextEdit.NoWrap
 
 
 def test_shortcut_list_dialog_populates_table(qapp):
@@ -53,10 +55,19 @@ def test_overlay_label_show_hide_and_geometry(qapp):
     overlay = OverlayLabel(window, frame)
 
     overlay.show("12:34", duration_ms=50)
-    assert overlay.label.text() == "12:34"
+    assert overlay.text() == "12:34"
+    assert not overlay.label.pixmap().isNull()
     assert overlay.label.isVisible()
     assert overlay.timer.interval() == 50
 
+    # 表示中の再表示は文字と期限だけ更新する
+    raised = []
+    overlay.label.raise_ = lambda: raised.append(True)
+    overlay.show("12:35", duration_ms=80)
+    assert overlay.text() == "12:35"
+    assert overlay.timer.interval() == 80
+    assert raised == []
+
     # 表示中のリサイズ: update_geometry() が呼ばれラベルは表示されたまま
     overlay.resize_to_frame_rect()
     assert overlay.label.isVisible()
@@ -65,6 +76,26 @@ def test_overlay_label_show_hide_and_geometry(qapp):
     assert not overlay.label.isVisible()
 
 
+def test_overlay_skips_unchanged_geometry_until_hidden(qapp):
+    window = QtWidgets.QWidget()
+    frame = QtWidgets.QFrame(window)
+    frame.setGeometry(10, 20, 200, 100)
+    window.show()
+    overlay = OverlayLabel(window, frame)
+    applied = []
+    original = overlay.label.setGeometry
+    overlay.label.setGeometry = lambda rect: applied.append(rect) or original(rect)
+
+    overlay.update_geometry()
+    overlay.update_geometry()
+    assert len(applied) == 1
+
+    overlay.hide()
+    overlay.update_geometry()
+    assert len(applied) == 2
+    window.hide()
+
+
 def test_overlay_resize_to_frame_rect_does_nothing_when_hidden(qapp):
     window = QtWidgets.QWidget()
     frame = QtWidgets.QFrame(window)
@@ -116,6 +147,27 @@ def test_seek_slider_mouse_events_emit_values(qapp):
     assert slider.value() == 750
 
 
+def test_seek_slider_coalesces_drag_moves(qapp):
+    slider = SeekSlider(QtCore.Qt.Horizontal)
+    slider.resize(100, 20)
+    slider.setRange(0, 1000)
+    moved = []
+    slider.sliderMoved.connect(moved.append)
+
+    slider.mousePressEvent(_mouse_event(QtCore.QEvent.MouseButtonPress, QtCore.QPointF(10, 10)))
+    for x in (20, 30, 40):
+        slider.mouseMoveEvent(_mouse_event(QtCore.QEvent.MouseMove, QtCore.QPointF(x, 10)))
+
+    # 移動は溜めておき、タイマー満了でまとめて 1 回だけ反映する
+    assert set(moved) == {100}
+    assert slider.value() == 100
+    assert slider._coalesce_timer.isActive()
+
+    slider._coalesce_timer.timeout.emit()
+    assert set(moved) == {100, 400}
+    assert slider.value() == 400
+
+
 def test_seek_slider_vertical_position_is_clamped(qapp):
     slider = SeekSlider(QtCore.Qt.Vertical)
     slider.resize(20, 100)
@@ -142,4 +194,51 @@ def test_seek_slider_paint_event_handles_empty_and_ticked_ranges(qapp):
     slider.setRange(0, 180_000)
     slider.render(image)
 
+    # 一部だけの再描画(目盛り範囲の絞り込み)でも描画できる
+    exposed = QtCore.QRect(slider.width() // 3 - 6, 0, 12, slider.height())
+    slider.render(image, QtCore.QPoint(), QtGui.QRegion(exposed))
+
     assert image.size() == slider.size()
+    groove_x = slider._tick_key[2].x()
+    assert slider._tick_xs == [groove_x + 80, groove_x + 160]
+
+    # 範囲が変わらなければ目盛り座標は計算し直さない
+    cached = slider._tick_xs
+    slider.render(image)
+    assert slider._tick_xs is cached
+
+    slider.setRange(0, 240_000)
+    slider.render(image)
+    assert len(slider._tick_xs) == 3
+
+    # 大きさが変わったら溝の矩形を取り直す
+    slider.resize(480, 24)
+    assert slider._groove_rect is None
+    slider.render(QtGui.QImage(slider.size(), QtGui.QImage.Format_ARGB32))
+    assert slider._tick_xs[0] == slider._groove_rect.x() + slider._groove_rect.width() // 4
+
+
+def test_seek_slider_skips_repaint_when_handle_does_not_move(qapp, monkeypatch):
+    slider = SeekSlider(QtCore.Qt.Horizontal)
+    slider.resize(240, 24)
+    slider.setRange(0, 180_000)
+    slider.show()
+    qapp.processEvents()
+    image = QtGui.QImage(slider.size(), QtGui.QImage.Format_ARGB32)
+    slider.render(image)
+
+    changes = []
+    original = QtWidgets.QSlider.sliderChange
+    monkeypatch.setattr(
+        QtWidgets.QSlider,
+        "sliderChange",
+        lambda self, change: changes.append(change) or original(self, change),
+    )
+
+    # 1px に満たない値の変化ではハンドルが動かないので再描画しない
+    slider.setValue(1)
+    assert changes == []
+
+    slider.setValue(90_000)
+    assert changes == [QtWidgets.QAbstractSlider.SliderValueChange]
+    assert slider.value() == 90_000
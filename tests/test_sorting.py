@@ -44,6 +44,9 @@ class WindowsLogicalKeyTest(unittest.TestCase):
 
         self.assertEqual(expected, [os.path.basename(p) for p in sorted_files])
 
+    def test_fallback_key_is_natural_key_itself(self):
+        self.assertIs(playlist.natural_key, playlist._create_windows_logical_key(None))
+
     def test_cmp_to_key_path_uses_basename_and_comparer(self):
         calls = []
 
@@ -59,6 +62,26 @@ class WindowsLogicalKeyTest(unittest.TestCase):
         compared_names = {name for call in calls for name in call}
         self.assertEqual({"A.mp4", "b.mp4"}, compared_names)
 
+    def test_name_key_orders_like_path_key(self):
+        files = ["/tmp/File10.mp4", "/tmp/file2.mp4", "/tmp/file-3.mp4", "/tmp/File1.mp4"]
+        path_key = playlist._create_windows_logical_key(None)
+        name_key = playlist._create_windows_logical_name_key(None)
+
+        by_name = sorted(files, key=lambda p: name_key(os.path.basename(p)))
+
+        self.assertEqual(sorted(files, key=path_key), by_name)
+
+    def test_sort_key_takes_precedence_over_comparer(self):
+        def failing_comparer(a: str, b: str) -> int:
+            raise AssertionError("comparer must not be used when a sort key is given")
+
+        key = playlist._create_windows_logical_key(failing_comparer, sort_key=str.casefold)
+        files = ["/tmp/b.mp4", "/tmp/C.mp4", "/tmp/A.mp4"]
+
+        sorted_files = sorted(files, key=key)
+
+        self.assertEqual(["A.mp4", "b.mp4", "C.mp4"], [os.path.basename(p) for p in sorted_files])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,3 +31,14 @@ def test_build_window_title_omits_size_when_unknown():
         file_size_bytes=-1,
     )
     assert title == "[1/1] a.mp4"
+
+
+def test_build_window_title_uses_given_position():
+    title = build_window_title(
+        playlist=["/v/a.mp4", "/v/b.mp4"],
+        current_path="/v/b.mp4",
+        shuffle_enabled=True,
+        media_length_ms=0,
+        position=0,
+    )
+    assert title == "[S] [1/2] b.mp4"
@@ -1,8 +1,14 @@
+import errno
 import ntpath
 import os
 import shutil
+import sys
 import time
 from collections.abc import Callable
+from typing import Optional
+
+# 別デバイス間の移動でコピーするときのバッファサイズ
+_CROSS_DEVICE_COPY_BUFSIZE = 1 << 20
 
 
 class TargetFileExistsError(FileExistsError):
@@ -19,8 +25,7 @@ class InvalidMoveTargetError(ValueError):
 
 def target_path_for_subfolder(file_path: str, subfolder_name: str) -> str:
     validate_subfolder_name(subfolder_name)
-    file_name = os.path.basename(file_path)
-    source_dir = os.path.dirname(file_path)
+    source_dir, file_name = os.path.split(file_path)
     return os.path.join(source_dir, subfolder_name, file_name)
 
 
@@ -49,6 +54,79 @@ def unique_target_path_for_subfolder(
         counter += 1
 
 
+def move_file(file_path: str, target_file_path: str) -> str:
+    """ファイルを移動する。同一ファイルシステムなら rename 1 回で済ませる。
+
+    別デバイス(EXDEV)のときだけ、1 MiB 単位のコピーと元ファイルの削除に切り替える。
+    """
+    try:
+        os.replace(file_path, target_file_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_across_devices(file_path, target_file_path)
+    return target_file_path
+
+
+def move_file_no_clobber(file_path: str, target_file_path: str) -> str:
+    """移動先が既にあれば ``FileExistsError`` を送出するファイル移動。
+
+    存在確認と移動を別の呼び出しに分けず、移動そのものを失敗させる(EAFP)。
+    Windows の rename は移動先があれば失敗し、POSIX では hard link の作成が
+    同じ役割を果たす。hard link を作れないファイルシステムでだけ、事前確認付きの
+    rename に戻す。
+    """
+    try:
+        if sys.platform.startswith("win"):
+            os.rename(file_path, target_file_path)
+            return target_file_path
+        os.link(file_path, target_file_path)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            _copy_across_devices(file_path, target_file_path, exclusive=True)
+            return target_file_path
+        if sys.platform.startswith("win"):
+            raise
+        # FAT/exFAT や一部のネットワーク共有は hard link を作れない
+        if os.path.lexists(target_file_path):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), target_file_path) from e
+        os.rename(file_path, target_file_path)
+        return target_file_path
+    try:
+        os.unlink(file_path)
+    except OSError:
+        # 自分で作った hard link を残すと、再試行が「移動先が既にある」で失敗する
+        try:
+            os.unlink(target_file_path)
+        except OSError:
+            pass
+        raise
+    return target_file_path
+
+
+def _copy_across_devices(file_path: str, target_file_path: str, exclusive: bool = False) -> None:
+    # 移動先を自分で作ったあとの失敗だけ後始末する。作る前の失敗(元ファイルを
+    # 開けないなど)で消すと、移動先に元からあった別のファイルを消してしまう
+    created = False
+    try:
+        with open(file_path, "rb") as src:
+            with open(target_file_path, "xb" if exclusive else "wb") as dst:
+                created = True
+                shutil.copyfileobj(src, dst, _CROSS_DEVICE_COPY_BUFSIZE)
+        shutil.copystat(file_path, target_file_path)
+    except BaseException:
+        # 途中までコピーしたファイルを残さない
+        if created:
+            try:
+                os.unlink(target_file_path)
+            except OSError:
+                pass
+        raise
+    os.unlink(file_path)
+
+
 def validate_subfolder_name(subfolder_name: str) -> None:
     if not subfolder_name or subfolder_name in (".", ".."):
         raise InvalidMoveTargetError("subfolder name must be a plain directory name")
@@ -84,7 +162,7 @@ def move_file_to_subfolder(
     subfolder_name: str,
     *,
     retry_delays: tuple[float, ...] = (0.1, 0.25, 0.5),
-    move_func: Callable[[str, str], object] = shutil.move,
+    move_func: Optional[Callable[[str, str], object]] = None,
     sleep_func: Callable[[float], None] = time.sleep,
 ) -> str:
     target_file_path = validate_move_to_subfolder(file_path, subfolder_name)
@@ -103,16 +181,17 @@ def move_file_to_path(
     *,
     overwrite: bool = False,
     retry_delays: tuple[float, ...] = (0.1, 0.25, 0.5),
-    move_func: Callable[[str, str], object] = shutil.move,
+    move_func: Optional[Callable[[str, str], object]] = None,
     sleep_func: Callable[[float], None] = time.sleep,
-    exists_func: Callable[[str], bool] = os.path.exists,
+    exists_func: Optional[Callable[[str], bool]] = None,
 ) -> str:
     """明示的なパスへファイルを移動する（別名保存などで利用）。
 
     汎用ユーティリティとして誤用されないよう、移動直前にも最低限の検証を行う:
-    source が実在すること、target がディレクトリを含む有効なパスであること、
-    そして ``overwrite=False`` の場合は target が未存在であること（移動直前の
-    再確認で TOCTOU 窓を狭める）。
+    source が実在すること、target がディレクトリを含む有効なパスであること。
+    ``overwrite=False`` の場合は既定で ``move_file_no_clobber`` を使い、移動先が
+    既にあれば移動自体が失敗する(存在確認と移動の間に TOCTOU 窓を作らない)。
+    ``exists_func`` を渡したときだけ、各試行の前に追加で存在確認を行う。
     """
     if not os.path.isfile(file_path):
         raise FileNotFoundError(file_path)
@@ -122,14 +201,20 @@ def move_file_to_path(
     if os.path.abspath(file_path) == os.path.abspath(target_file_path):
         raise InvalidMoveTargetError("source and target paths must be different")
     os.makedirs(target_dir, exist_ok=True)
+    if move_func is None:
+        move_func = move_file if overwrite else move_file_no_clobber
 
     attempts = len(retry_delays) + 1
     for attempt in range(attempts):
-        if not overwrite and exists_func(target_file_path):
+        if not overwrite and exists_func is not None and exists_func(target_file_path):
             raise TargetFileExistsError(target_file_path)
         try:
             move_func(file_path, target_file_path)
             break
+        except FileExistsError as e:
+            if overwrite or isinstance(e, TargetFileExistsError):
+                raise
+            raise TargetFileExistsError(target_file_path) from e
         except OSError:
             if attempt >= len(retry_delays):
                 raise
@@ -143,15 +228,14 @@ def move_file_to_subfolder_as_unique(
     *,
     max_collision_retries: int = 5,
     retry_delays: tuple[float, ...] = (0.1, 0.25, 0.5),
-    move_func: Callable[[str, str], object] = shutil.move,
+    move_func: Optional[Callable[[str, str], object]] = None,
     sleep_func: Callable[[float], None] = time.sleep,
-    exists_func: Callable[[str], bool] = os.path.exists,
+    exists_func: Optional[Callable[[str], bool]] = None,
 ) -> str:
     """衝突しない別名を採番してサブフォルダへ移動する。
 
     採番（``unique_target_path_for_subfolder``）と実際の移動の間に同名パスが
-    作られる TOCTOU を考慮し、移動直前の存在チェックで衝突を検知したら採番から
-    やり直す。
+    作られる TOCTOU を考慮し、移動が衝突で失敗したら採番からやり直す。
     """
     validate_subfolder_name(subfolder_name)
     if not os.path.isfile(file_path):
@@ -162,7 +246,7 @@ def move_file_to_subfolder_as_unique(
         target_file_path = unique_target_path_for_subfolder(
             file_path,
             subfolder_name,
-            exists_func=exists_func,
+            exists_func=exists_func or os.path.exists,
         )
         try:
             return move_file_to_path(
@@ -1,4 +1,4 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 
 from ..domain.playlist import (
     active_playlist,
@@ -41,12 +41,14 @@ class PlaylistController:
         removed_index: int,
         shuffle_enabled: bool,
         remembered_next_path: str | None,
+        index_of: Mapping[str, int] | None = None,
     ) -> int | None:
         return next_index_after_removal(
             directory_playlist,
             removed_index,
             shuffle_enabled,
             remembered_next_path,
+            index_of,
         )
 
     def next_path(self, active: Sequence[str], current_path: str) -> str | None:
@@ -65,6 +65,8 @@ def start_heartbeat_timer(parent: Any) -> Any:
         return None
     global _heartbeat_timer
     timer = QtCore.QTimer(parent)
+    # 応答なしの検出には数十 ms の揺れは影響しないので、省電力な CoarseTimer にする
+    timer.setTimerType(QtCore.Qt.CoarseTimer)
     timer.setInterval(500)
     timer.timeout.connect(heartbeat)
     timer.start()
@@ -10,9 +10,13 @@ class MetadataDialog(QtWidgets.QDialog):
         self.setMinimumSize(500, 400)
 
         self.text_edit = QtWidgets.QPlainTextEdit(self)
-        self.text_edit.setPlainText(metadata_text)
+        # 読み取り専用なので undo 履歴は不要。折り返しも切ってレイアウト計算を軽くする。
+        # 書式とフォントは本文を入れる前に決め、レイアウトを 1 回で済ませる
+        self.text_edit.setUndoRedoEnabled(False)
+        self.text_edit.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
         self.text_edit.setReadOnly(True)
         self.text_edit.setFont(QtGui.QFont("Courier New", 10))
+        self.text_edit.setPlainText(metadata_text)
 
         self.copy_button = QtWidgets.QPushButton("クリップボードにコピー")
         self.close_button = QtWidgets.QPushButton("閉じる")
@@ -33,7 +37,10 @@ class MetadataDialog(QtWidgets.QDialog):
         clipboard = QtWidgets.QApplication.clipboard()
         clipboard.setText(self.text_edit.toPlainText())
         self.copy_button.setText("コピーしました！")
-        QtCore.QTimer.singleShot(1500, lambda: self.copy_button.setText("クリップボードにコピー"))
+        QtCore.QTimer.singleShot(1500, QtCore.Qt.CoarseTimer, self._reset_copy_button)
+
+    def _reset_copy_button(self):
+        self.copy_button.setText("クリップボードにコピー")
 
 
 class ShortcutListDialog(QtWidgets.QDialog):
@@ -1,8 +1,16 @@
+from functools import lru_cache
+
+
 def format_ms(ms: int) -> str:
     """Format milliseconds as MM:SS or HH:MM:SS."""
     if ms <= 0:
         return "00:00"
-    seconds = ms // 1000
+    return _format_seconds(ms // 1000)
+
+
+@lru_cache(maxsize=8192)
+def _format_seconds(seconds: int) -> str:
+    """Format whole seconds; cached because playback positions repeat every tick."""
     minutes, seconds = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
     if hours > 0:
@@ -13,12 +13,17 @@ def build_window_title(
     media_length_ms: int,
     filename: Optional[str] = None,
     file_size_bytes: int = -1,
+    position: Optional[int] = None,
 ) -> str:
     name = filename or (os.path.basename(current_path) if current_path else "")
-    try:
-        index = playlist.index(current_path) + 1 if current_path else 0
-    except ValueError:
-        index = 0
+    # 呼び出し側が playlist 内の位置(0 始まり)を知っていれば探索を省く
+    if position is not None:
+        index = position + 1
+    else:
+        try:
+            index = playlist.index(current_path) + 1 if current_path else 0
+        except ValueError:
+            index = 0
 
     prefix = f"[{index}/{len(playlist)}] " if playlist else ""
     shuffle_indicator = "[S] " if shuffle_enabled else ""
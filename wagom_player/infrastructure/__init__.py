@@ -1,4 +1,5 @@
 __all__ = [
+    "prefetch",
     "settings_store",
     "trash",
     "vlc_backend",
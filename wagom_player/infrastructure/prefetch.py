@@ -0,0 +1,43 @@
+import os
+import threading
+
+# 先読みする先頭部分の大きさ。VLC が最初のフレームを出すまでに読む範囲をおおむね覆う
+PREFETCH_BYTES = 2 << 20
+_READ_CHUNK = 256 << 10
+
+
+def prefetch_file_head(path: str, size: int = PREFETCH_BYTES) -> None:
+    """ファイル先頭を OS のページキャッシュへ読み込ませる。失敗しても何もしない。
+
+    ``posix_fadvise`` がある環境ではカーネルに先読みを依頼するだけで済ませ、
+    ない環境(Windows)では先頭を実際に読んで捨てる。
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return
+    try:
+        fadvise = getattr(os, "posix_fadvise", None)
+        if fadvise is not None:
+            fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+            return
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, min(remaining, _READ_CHUNK))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def prefetch_in_background(path: str) -> None:
+    """UI スレッドを止めないよう、先読みを使い捨てのデーモンスレッドで行う。"""
+    threading.Thread(
+        target=prefetch_file_head,
+        args=(path,),
+        name="wagom-prefetch",
+        daemon=True,
+    ).start()
@@ -8,6 +8,9 @@ class SettingsStore:
 
     def __init__(self, settings: QtCore.QSettings):
         self.settings = settings
+        # 設定はユーザー単位でしか書かないので、未設定キーの読み出しで組織・システム
+        # 全体のスコープまで探しに行かない
+        self.settings.setFallbacksEnabled(False)
 
     def volume(self, default: int = 80) -> int:
         try:
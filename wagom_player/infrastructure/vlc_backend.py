@@ -1,5 +1,7 @@
 import os
-from typing import Any
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional
 
 from PyQt5 import QtCore
 
@@ -14,19 +16,84 @@ except (FileNotFoundError, ImportError, OSError):
 class VlcEvents(QtCore.QObject):
     media_ended = QtCore.pyqtSignal()
     media_playing = QtCore.pyqtSignal()
+    playing_state_changed = QtCore.pyqtSignal(bool)
+    time_changed = QtCore.pyqtSignal(int)
 
 
-def create_vlc_instance() -> Any:
+# preload_vlc_instance() で先に作り始めた Instance。最初の create_vlc_instance() が受け取る
+_preloaded_instance: Optional[Future] = None
+# 起動引数ごとに共有する Instance。libVLC の初期化(プラグイン走査)はプロセスで 1 回にする
+_shared_instances: dict[tuple[str, ...], Any] = {}
+
+
+def preload_vlc_instance() -> None:
+    """libVLC とプラグインの読み込みをバックグラウンドスレッドで先に始める。
+
+    起動直後のウィンドウ準備と並行させ、VideoPlayer の構築で待つ時間を縮める。
+    失敗した場合は create_vlc_instance() がメインスレッドで作り直し、通常どおり
+    例外を報告する。
+    """
+    global _preloaded_instance
+    if _preloaded_instance is not None or vlc is None:
+        return
+    future: Future = Future()
+
+    def _run() -> None:
+        try:
+            future.set_result(_new_vlc_instance())
+        except BaseException as e:
+            future.set_exception(e)
+
+    _preloaded_instance = future
+    threading.Thread(target=_run, name="wagom-vlc-preload", daemon=True).start()
+
+
+def create_vlc_instance(*, fresh: bool = False) -> Any:
+    """起動引数が同じ Instance を共有して返す。
+
+    ``fresh=True`` のときは共有分を使わずに新しく作る(古い player が止まらない
+    ときの作り直し用)。新しく作った Instance で共有分は置き換えない。
+    """
+    global _preloaded_instance
+    args = _vlc_instance_args()
+    if not fresh and args in _shared_instances:
+        return _shared_instances[args]
+    future, _preloaded_instance = _preloaded_instance, None
+    instance = None
+    if future is not None:
+        try:
+            instance = future.result()
+        except Exception:
+            pass
+    if instance is None:
+        instance = _new_vlc_instance(args)
+    if not fresh:
+        _shared_instances[args] = instance
+    return instance
+
+
+def _vlc_instance_args() -> tuple[str, ...]:
+    lib_path = os.environ.get("PYTHON_VLC_LIB_PATH")
+    if lib_path and os.path.isdir(lib_path):
+        return (f"--plugin-path={lib_path}", "--audio-time-stretch")
+    return ("--audio-time-stretch",)
+
+
+def _new_vlc_instance(args: Optional[tuple[str, ...]] = None) -> Any:
     if vlc is None:
         raise RuntimeError(
             "VLC が見つかりません。VLC 本体をインストールするか、"
             "PYTHON_VLC_LIB_PATH に libvlc.dll のディレクトリを設定してください。"
         )
-
-    lib_path = os.environ.get("PYTHON_VLC_LIB_PATH")
-    if lib_path and os.path.isdir(lib_path):
-        return vlc.Instance([f"--plugin-path={lib_path}", "--audio-time-stretch"])
-    return vlc.Instance(["--audio-time-stretch"])
+    if args is None:
+        args = _vlc_instance_args()
+    return vlc.Instance(list(args))
 
 
-__all__ = ["VlcEvents", "VlcPlayerAdapter", "create_vlc_instance", "vlc"]
+__all__ = [
+    "VlcEvents",
+    "VlcPlayerAdapter",
+    "create_vlc_instance",
+    "preload_vlc_instance",
+    "vlc",
+]
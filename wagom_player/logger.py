@@ -34,13 +34,18 @@ def _truncate_last_run_if_too_large(base: str) -> None:
         pass
 
 
-def log_message(msg: str) -> None:
+def log_message(msg: str, *args: object) -> None:
     """
     アプリケーションの動作ログをファイルに記録するグローバル関数
+
+    args を渡した場合は logging と同じく ``msg % args`` で整形する。整形は実際に
+    書き込むときだけ行うため、呼び出し側で f-string を組み立てるより安い。
     """
     try:
         base = logs_dir()
         if base:
+            if args:
+                msg = msg % args
             os.makedirs(base, exist_ok=True)
             ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             with open(
@@ -1,4 +1,11 @@
-from PyQt5 import QtCore, QtWidgets
+from typing import Optional
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+_FONT_PIXEL_SIZE = 48
+_PADDING = 10
+# 縁取りの太さ。白文字の周りを黒で囲み、明るい映像の上でも読めるようにする
+_OUTLINE_WIDTH = 4
 
 
 class OverlayLabel:
@@ -12,52 +19,79 @@ class OverlayLabel:
         self.label.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         self.label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
         self.label.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
-        self.label.setStyleSheet(
-            """
-            background-color: transparent;
-            border: none;
-            color: white;
-            font-size: 48px;
-            font-weight: bold;
-            padding: 10px;
-            text-shadow:
-                2px 0px 3px #000, -2px 0px 3px #000,
-                0px 2px 3px #000, 0px -2px 3px #000,
-                1px 1px 3px #000, -1px -1px 3px #000,
-                1px -1px 3px #000, -1px 1px 3px #000;
-        """
-        )
+        self.label.setStyleSheet("background-color: transparent; border: none;")
         self.label.hide()
+        # 文字は縁取り付きで QPixmap に描き、文言が変わったときだけ描き直す
+        self._text = ""
+        self._font = QtGui.QFont(self.label.font())
+        self._font.setPixelSize(_FONT_PIXEL_SIZE)
+        self._font.setBold(True)
+        # 最後に setGeometry した矩形。同じなら再設定せず move/resize イベントを省く
+        self._last_rect: Optional[QtCore.QRect] = None
 
         self.timer = QtCore.QTimer(window)
         self.timer.setSingleShot(True)
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
         self.timer.setInterval(1500)
-        self.timer.timeout.connect(self.label.hide)
+        self.timer.timeout.connect(self.hide)
 
     def show(self, text: str, duration_ms: int = 1500) -> None:
-        self.label.setText(text)
-        self.update_geometry()
-        self.label.show()
-        self.label.raise_()
-        self.timer.stop()
-        self.timer.setInterval(duration_ms)
-        self.timer.start()
+        # VLC のネイティブ描画面より上に出すため、ラベルはトップレベルのままにする。
+        # 表示中の連続呼び出し(シーク連打など)では文字と期限だけ更新し、
+        # ウィンドウの再表示・最前面化の往復を省く。
+        if self._text != text:
+            self._text = text
+            self.label.setPixmap(self._render_text(text))
+        if not self.label.isVisible():
+            self.update_geometry()
+            self.label.show()
+            self.label.raise_()
+        self.timer.start(duration_ms)
+
+    def text(self) -> str:
+        return self._text
+
+    def _render_text(self, text: str) -> QtGui.QPixmap:
+        """縁取り(黒)と塗り(白)の 2 回の描画で文字の画像を作る。"""
+        path = QtGui.QPainterPath()
+        metrics = QtGui.QFontMetrics(self._font)
+        margin = _PADDING + _OUTLINE_WIDTH
+        path.addText(margin, margin + metrics.ascent(), self._font, text)
+        bounds = path.boundingRect()
+        width = int(bounds.right()) + margin + 1
+        height = margin * 2 + metrics.height()
+
+        ratio = self.label.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        try:
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            pen = QtGui.QPen(QtCore.Qt.black, _OUTLINE_WIDTH)
+            pen.setJoinStyle(QtCore.Qt.RoundJoin)
+            painter.strokePath(path, pen)
+            painter.fillPath(path, QtCore.Qt.white)
+        finally:
+            painter.end()
+        return pixmap
 
     def hide(self) -> None:
         self.label.hide()
+        # 非表示の間に外から動かされても、次の表示で必ず合わせ直す
+        self._last_rect = None
 
     def update_geometry(self) -> None:
         if not self.video_frame.isVisible():
             return
 
-        global_pos = self.video_frame.mapToGlobal(QtCore.QPoint(0, 0))
-        frame_size = self.video_frame.size()
-        self.label.setGeometry(
-            global_pos.x(),
-            global_pos.y(),
-            frame_size.width(),
-            frame_size.height(),
+        rect = QtCore.QRect(
+            self.video_frame.mapToGlobal(QtCore.QPoint(0, 0)), self.video_frame.size()
         )
+        if rect == self._last_rect:
+            return
+        self._last_rect = rect
+        self.label.setGeometry(rect)
 
     def resize_to_frame_rect(self) -> None:
         """表示中の overlay のみ video_frame のグローバル位置に追従させる。非表示時は何もしない。"""
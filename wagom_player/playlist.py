@@ -26,12 +26,34 @@ SUPPORTED_VIDEO_EXTENSIONS = (
     ".webm",
 )
 
+# 拡張子の照合用。小文字化するのは名前全体ではなく最後のドット以降だけにする
+_SUPPORTED_EXTENSION_SET = frozenset(SUPPORTED_VIDEO_EXTENSIONS)
 
-def natural_key(path: str):
+# 数字列で分割する。キー生成のたびにパターン -> メソッドの解決をしないよう束縛しておく
+_split_digits = re.compile(r"(\d+)").split
+
+
+if os.altsep is None:
+    # 区切り文字が "/" だけの環境では、posixpath.basename と同じ結果を rpartition 1 回で得る
+    def _basename(path: str) -> str:
+        return path.rpartition(os.sep)[2]
+
+else:
+    # Windows はドライブ指定や "/" 混在を扱う必要があるので ntpath に任せる
+    _basename = os.path.basename
+
+
+@functools.lru_cache(maxsize=4096)
+def _natural_key_name(name: str) -> tuple:
+    """ファイル名(basename 済み)の自然順ソートキー。"""
+    parts = _split_digits(name)
+    # キャプチャ付き split なので、奇数番目が必ず数字列・偶数番目が文字列になる
+    return tuple(int(p) if i % 2 else p.casefold() for i, p in enumerate(parts))
+
+
+def natural_key(path: str) -> tuple:
     """ファイル名を自然順ソートするためのキーを生成する (例: 2.mp4 < 10.mp4)"""
-    name = os.path.basename(path)
-    parts = re.split(r"(\d+)", name)
-    return [int(p) if p.isdigit() else p.casefold() for p in parts]
+    return _natural_key_name(_basename(path))
 
 
 def _load_windows_logical_comparer():
@@ -55,35 +77,111 @@ def _load_windows_logical_comparer():
 
 _STRCMP_LOGICALW = _load_windows_logical_comparer()
 
+# LCMapStringEx のフラグ。数字列を数値として並べ、大文字小文字を区別しない
+# (StrCmpLogicalW と同じ並び)
+_LCMAP_SORTKEY = 0x00000400
+_SORT_DIGITSASNUMBERS = 0x00000008
+_NORM_IGNORECASE = 0x00000001
+
+
+def _load_windows_logical_sort_key():
+    """StrCmpLogicalW と同じ順序になるバイト列のソートキー関数を返す。
+
+    比較関数を cmp_to_key で包むと比較のたびに Win32 API を呼ぶことになるため、
+    要素ごとに 1 回だけ LCMapStringEx でキーを作り、以降の比較は bytes 同士で行う。
+    """
+    if not sys.platform.startswith("win"):
+        return None
+
+    try:
+        from ctypes import wintypes
+
+        lcmap = ctypes.windll.kernel32.LCMapStringEx
+        lcmap.argtypes = [
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.LPCWSTR,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            wintypes.LPARAM,
+        ]
+        lcmap.restype = ctypes.c_int
+    except Exception:
+        return None
+
+    flags = _LCMAP_SORTKEY | _SORT_DIGITSASNUMBERS | _NORM_IGNORECASE
+
+    @functools.lru_cache(maxsize=4096)
+    def _sort_key(name: str) -> bytes:
+        # ロケールはユーザー既定(NULL)。長さ -1 は NUL 終端まで
+        size = lcmap(None, flags, name, -1, None, 0, None, None, 0)
+        if size > 0:
+            buffer = ctypes.create_string_buffer(size)
+            if lcmap(None, flags, name, -1, buffer, size, None, None, 0) > 0:
+                return buffer.raw
+        # 変換できない名前は大文字小文字を無視した符号順で並べる
+        return name.casefold().encode("utf-16-be")
+
+    return _sort_key
 
-def _create_windows_logical_key(comparer=_STRCMP_LOGICALW):
-    """Windowsの論理順比較に基づくキーを生成する。"""
 
+_LCMAP_LOGICAL_SORT_KEY = _load_windows_logical_sort_key()
+
+
+def _create_windows_logical_name_key(comparer=_STRCMP_LOGICALW, sort_key=None):
+    """_create_windows_logical_key のファイル名(basename 済み)版。
+
+    sort_key があれば最優先で使い、なければ comparer を cmp_to_key で包む。
+    """
+    if sort_key:
+        return sort_key
     if comparer:
+        return functools.cmp_to_key(comparer)
+    return _natural_key_name
+
+
+def _create_windows_logical_key(comparer=_STRCMP_LOGICALW, sort_key=None):
+    """Windowsの論理順比較に基づくキーを生成する。"""
+    name_key = _create_windows_logical_name_key(comparer, sort_key)
+    if name_key is _natural_key_name:
+        # Windows 以外ではモジュール関数をそのまま返し、クロージャ経由の呼び出しを省く
+        return natural_key
 
-        def _cmp(a: str, b: str) -> int:
-            return comparer(os.path.basename(a), os.path.basename(b))
+    # basename はキー生成時に要素ごと 1 回だけ取り、比較のたびには取り直さない
+    def _key(path: str):
+        return name_key(_basename(path))
 
-        return functools.cmp_to_key(_cmp)
+    return _key
 
-    def _fallback_key(path: str):
-        return natural_key(path)
 
-    return _fallback_key
+windows_logical_key = _create_windows_logical_key(sort_key=_LCMAP_LOGICAL_SORT_KEY)
+_windows_logical_name_key = _create_windows_logical_name_key(sort_key=_LCMAP_LOGICAL_SORT_KEY)
 
 
-windows_logical_key = _create_windows_logical_key()
+def _has_supported_extension(name: str) -> bool:
+    # ディレクトリ走査のホットループ用。拡張子は 1 つのドットで始まるものだけなので、
+    # 最後のドット以降を集合で引けば足りる
+    dot = name.rfind(".")
+    if dot < 0 or name[dot:].lower() not in _SUPPORTED_EXTENSION_SET:
+        return False
+    # splitext と同じく、先頭がドットだけの名前(".mp4" など)は拡張子なしとみなす
+    return bool(name[:dot].strip("."))
 
 
 def is_supported_video_file(path: str) -> bool:
-    return os.path.splitext(path)[1].lower() in SUPPORTED_VIDEO_EXTENSIONS
+    return _has_supported_extension(os.path.basename(path))
 
 
 def collect_video_files(directory: str) -> list[str]:
-    video_files = [
-        os.path.join(directory, name)
-        for name in os.listdir(directory)
-        if is_supported_video_file(name)
-    ]
-    video_files.sort(key=windows_logical_key)
-    return video_files
+    with os.scandir(directory) as entries:
+        named_files = [
+            (entry.name, entry.path)
+            for entry in entries
+            if _has_supported_extension(entry.name) and entry.is_file()
+        ]
+    # entry.name は basename 済みなので、キー計算で basename を取り直さない
+    named_files.sort(key=lambda named: _windows_logical_name_key(named[0]))
+    return [path for _name, path in named_files]
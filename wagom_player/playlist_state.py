@@ -1,4 +1,4 @@
-from collections.abc import Callable, MutableSequence, Sequence
+from collections.abc import Callable, Mapping, MutableSequence, Sequence
 from typing import Optional
 
 
@@ -18,11 +18,11 @@ def create_shuffled_playlist(
     if not (0 <= current_index < len(directory_playlist)):
         return []
 
-    current_path = directory_playlist[current_index]
-    remaining = list(directory_playlist)
-    remaining.remove(current_path)
+    # 現在の位置は分かっているので、remove() で探さずにスライスで前後をつなぐ
+    remaining = [*directory_playlist[:current_index], *directory_playlist[current_index + 1 :]]
     shuffle_func(remaining)
-    return [current_path, *remaining]
+    remaining.insert(0, directory_playlist[current_index])
+    return remaining
 
 
 def adjacent_index(
@@ -59,14 +59,21 @@ def next_index_after_removal(
     removed_index: int,
     shuffle_enabled: bool,
     remembered_next_path: Optional[str],
+    index_of: Optional[Mapping[str, int]] = None,
 ) -> Optional[int]:
     if not directory_playlist:
         return None
 
     if shuffle_enabled:
-        if remembered_next_path in directory_playlist:
+        if remembered_next_path is None:
+            return None
+        # 位置の対応表があればリストを走査しない
+        if index_of is not None:
+            return index_of.get(remembered_next_path)
+        try:
             return directory_playlist.index(remembered_next_path)
-        return None
+        except ValueError:
+            return None
 
     if removed_index < len(directory_playlist):
         return removed_index
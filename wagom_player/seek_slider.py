@@ -1,3 +1,6 @@
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
@@ -6,11 +9,68 @@ class SeekSlider(QtWidgets.QSlider):
 
     clickedValue = QtCore.pyqtSignal(int)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 目盛り線の色とスタイル (白の半透明)。描画のたびに作らず使い回す
+        pen_color = QtGui.QColor(255, 255, 255, 100)  # RGBA (A=100で半透明)
+        self._tick_pen = QtGui.QPen(pen_color)
+        self._tick_pen.setWidth(4)  # 線の太さ
+        # 目盛りの X 座標一覧とその縦線、それらを計算したときの (最小, 最大, 溝の矩形)。
+        # 範囲や大きさが変わらない限り、再描画のたびに座標を計算し直さない。
+        self._tick_xs: list[int] = []
+        self._tick_lines: list[QtCore.QLine] = []
+        self._tick_key: Optional[tuple[int, int, QtCore.QRect]] = None
+        # 最後に描画したハンドルの矩形。値が変わってもハンドルが 1px も動かなければ
+        # 再描画を要求しない(再生中は 1 秒間に何度も setValue される)
+        self._painted_handle_rect: Optional[QtCore.QRect] = None
+        # 溝の矩形はウィジェットの大きさとスタイルだけで決まるので、変わるまで使い回す
+        self._groove_rect: Optional[QtCore.QRect] = None
+        # ドラッグ中のマウス移動は多いときで毎秒数百回届くため、値の反映と
+        # sliderMoved の通知は 16ms(約 60Hz)に 1 回へまとめる
+        self._pending_value: Optional[int] = None
+        self._coalesce_timer = QtCore.QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(16)
+        self._coalesce_timer.timeout.connect(self._flush_pending_value)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._groove_rect = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.StyleChange:
+            self._groove_rect = None
+        super().changeEvent(event)
+
+    def sliderChange(self, change: QtWidgets.QAbstractSlider.SliderChange) -> None:
+        if (
+            change == QtWidgets.QAbstractSlider.SliderValueChange
+            and self._painted_handle_rect is not None
+            and self._handle_rect(self._style_option()) == self._painted_handle_rect
+        ):
+            return
+        super().sliderChange(change)
+
+    def _style_option(self) -> QtWidgets.QStyleOptionSlider:
+        opt = QtWidgets.QStyleOptionSlider()
+        self.initStyleOption(opt)
+        return opt
+
+    def _handle_rect(self, opt: QtWidgets.QStyleOptionSlider) -> QtCore.QRect:
+        return self.style().subControlRect(
+            QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderHandle, self
+        )
+
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         """スライダーの背景に1分ごとの目盛り線を描画する"""
         # 最初に、スライダーのデフォルト描画（溝、ハンドルなど）を実行する
         super().paintEvent(event)
 
+        # QStyleOptionSliderを使って、スライダーの描画に必要な情報を取得する
+        # これにより、異なるOSやテーマでも正確な位置に描画できる
+        opt = self._style_option()
+        self._painted_handle_rect = self._handle_rect(opt)
+
         # 動画の総時間（ミリ秒）を取得。動画が読み込まれていなければ何もしない。
         duration = self.maximum()
         if duration <= 0:
@@ -18,46 +78,54 @@ class SeekSlider(QtWidgets.QSlider):
 
         # --- 描画準備 ---
         painter = QtGui.QPainter(self)
-
-        # 目盛り線の色とスタイルを設定 (白の半透明)
-        pen_color = QtGui.QColor(255, 255, 255, 100)  # RGBA (A=100で半透明)
-        pen = QtGui.QPen(pen_color)
-        pen.setWidth(4)  # 線の太さ
+        pen = self._tick_pen
         painter.setPen(pen)
 
         # --- 目盛り線の位置を計算して描画 ---
 
-        # QStyleOptionSliderを使って、スライダーの描画に必要な情報を取得する
-        # これにより、異なるOSやテーマでも正確な位置に描画できる
-        opt = QtWidgets.QStyleOptionSlider()
-        self.initStyleOption(opt)
-
         # スライダーの「溝」部分の矩形領域を取得する
-        groove_rect = self.style().subControlRect(
-            QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderGroove, self
-        )
-
-        tick_interval_ms = 60 * 1000  # 1分 = 60000ミリ秒
-
-        # 1分から、動画の長さを超えない範囲でループ
-        current_ms = tick_interval_ms
-        while current_ms < duration:
-            # 現在の時間（ミリ秒）が、スライダーの溝の中でどのX座標に対応するかを計算
-            x = (
-                self.style().sliderPositionFromValue(
-                    self.minimum(),
-                    self.maximum(),
-                    current_ms,
-                    groove_rect.width(),
-                )
-                + groove_rect.x()
+        if self._groove_rect is None:
+            self._groove_rect = self.style().subControlRect(
+                QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderGroove, self
             )
-
-            # 計算したX座標に縦線を描画
-            painter.drawLine(x, groove_rect.top(), x, groove_rect.bottom())
-
-            # 次の1分へ
-            current_ms += tick_interval_ms
+        groove_rect = self._groove_rect
+
+        key = (self.minimum(), self.maximum(), groove_rect)
+        if key != self._tick_key:
+            self._tick_key = key
+            self._tick_xs = self._compute_tick_xs(groove_rect)
+            top, bottom = groove_rect.top(), groove_rect.bottom()
+            self._tick_lines = [QtCore.QLine(x, top, x, bottom) for x in self._tick_xs]
+
+        # 再描画を求められた範囲(ハンドルの移動なら数 px)にかかる目盛りだけを描く。
+        # 線の太さの半分だけ範囲を広げ、端にかかる線も取りこぼさない。
+        exposed = event.rect()
+        half_pen = pen.width() // 2 + 1
+        painter.setClipRect(exposed)
+        first = bisect_left(self._tick_xs, exposed.left() - half_pen)
+        last = bisect_right(self._tick_xs, exposed.right() + half_pen)
+        if first < last:
+            # 縦線は 1 本ずつではなく、まとめて 1 回で描画する
+            painter.drawLines(self._tick_lines[first:last])
+
+    def _compute_tick_xs(self, groove_rect: QtCore.QRect) -> list[int]:
+        """1分ごとの目盛りの X 座標を、動画の長さを超えない範囲で昇順に返す。
+
+        値から位置への変換は線形なので、目盛りごとに ``sliderPositionFromValue`` を
+        呼ばず整数演算で求める(四捨五入。Qt の変換との差は高々 1px)。
+        """
+        tick_interval_ms = 60 * 1000  # 1分 = 60000ミリ秒
+        minimum = self.minimum()
+        value_span = self.maximum() - minimum
+        width = groove_rect.width()
+        if value_span <= 0 or width <= 0:
+            return []
+        first_ms = max(tick_interval_ms, -(-minimum // tick_interval_ms) * tick_interval_ms)
+        left = groove_rect.x()
+        return [
+            left + (2 * (current_ms - minimum) * width + value_span) // (2 * value_span)
+            for current_ms in range(first_ms, self.maximum(), tick_interval_ms)
+        ]
 
     def _pos_to_value(self, event: QtGui.QMouseEvent) -> int:
         if self.orientation() == QtCore.Qt.Horizontal:
@@ -66,13 +134,16 @@ class SeekSlider(QtWidgets.QSlider):
         else:
             pos = self.height() - event.pos().y()
             span = max(1, self.height())
-        rng = self.maximum() - self.minimum()
-        val = self.minimum() + int(rng * pos / span)
-        return max(self.minimum(), min(self.maximum(), val))
+        # 範囲外の位置は最小/最大に丸められる
+        return QtWidgets.QStyle.sliderValueFromPosition(
+            self.minimum(), self.maximum(), pos, span, self.invertedAppearance()
+        )
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.LeftButton:
             val = self._pos_to_value(event)
+            self._coalesce_timer.stop()
+            self._pending_value = None
             self.setSliderDown(True)
             self.setValue(val)
             try:
@@ -89,17 +160,19 @@ class SeekSlider(QtWidgets.QSlider):
         if event.buttons() & QtCore.Qt.LeftButton and self.isSliderDown():
             val = self._pos_to_value(event)
             if val != self.value():
-                self.setValue(val)
-                try:
-                    self.sliderMoved.emit(val)
-                except Exception:
-                    pass
+                self._pending_value = val
+                if not self._coalesce_timer.isActive():
+                    self._coalesce_timer.start()
+            else:
+                self._pending_value = None
             event.accept()
             return
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.LeftButton and self.isSliderDown():
+            # 離した位置の値を反映してから release を通知する
+            self._flush_pending_value()
             self.setSliderDown(False)
             try:
                 self.sliderReleased.emit()
@@ -108,3 +181,15 @@ class SeekSlider(QtWidgets.QSlider):
             event.accept()
             return
         super().mouseReleaseEvent(event)
+
+    def _flush_pending_value(self) -> None:
+        self._coalesce_timer.stop()
+        val = self._pending_value
+        if val is None:
+            return
+        self._pending_value = None
+        self.setValue(val)
+        try:
+            self.sliderMoved.emit(val)
+        except Exception:
+            pass
@@ -1,3 +1,4 @@
+import functools
 import os
 import sys
 
@@ -9,10 +10,43 @@ try:
 except Exception:
     QtSvg = None  # type: ignore
 
+# resource_path の基準ディレクトリ。呼び出しのたびに abspath を取り直さない
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_DIR = os.path.dirname(_PACKAGE_DIR)
+# 読み込み済みのアプリアイコン。2 回目以降の apply_app_icon で SVG を読み直さない
+_app_icons: dict[str, QtGui.QIcon] = {}
 
-def apply_dark_theme(app: QtWidgets.QApplication) -> None:
-    app.setStyle("Fusion")
+_DARK_QSS = """
+QToolTip { color: #e6e6e6; background: #2a2a2a; border: 1px solid #3f3f3f; }
+QSlider::groove:horizontal { background: #3a3a3a; height: 6px; border-radius: 3px; }
+QSlider::sub-page:horizontal { background: #0078d7; height: 6px; border-radius: 3px; }
+QSlider::add-page:horizontal { background: #2a2a2a; height: 6px; border-radius: 3px; }
+QSlider::handle:horizontal {
+    background: #1e90ff;
+    width: 14px;
+    margin: -6px 0;
+    border-radius: 7px;
+}
+QMenuBar { background: #2d2d2d; color: #e6e6e6; }
+QMenuBar::item:selected { background: #3a3a3a; }
+QMenu { background: #2d2d2d; color: #e6e6e6; }
+QMenu::item:selected { background: #3a3a3a; }
+QPushButton {
+    background: #2d2d2d;
+    color: #e6e6e6;
+    border: 1px solid #3f3f3f;
+    padding: 4px 10px;
+}
+QPushButton:hover { background: #353535; }
+QPushButton:pressed { background: #2a2a2a; }
+QLabel { color: #e6e6e6; }
+QStatusBar { background: #2d2d2d; color: #e6e6e6; }
+"""
 
+
+@functools.cache
+def _dark_palette() -> QtGui.QPalette:
+    """ダークテーマのパレット。最初の呼び出しで一度だけ組み立てる。"""
     palette = QtGui.QPalette()
     base = QtGui.QColor(53, 53, 53)
     alt = QtGui.QColor(45, 45, 45)
@@ -32,50 +66,29 @@ def apply_dark_theme(app: QtWidgets.QApplication) -> None:
     palette.setColor(QtGui.QPalette.Link, hl)
     palette.setColor(QtGui.QPalette.Highlight, hl)
     palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor(255, 255, 255))
-    app.setPalette(palette)
-
-    app.setStyleSheet(
-        """
-        QToolTip { color: #e6e6e6; background: #2a2a2a; border: 1px solid #3f3f3f; }
-        QSlider::groove:horizontal { background: #3a3a3a; height: 6px; border-radius: 3px; }
-        QSlider::sub-page:horizontal { background: #0078d7; height: 6px; border-radius: 3px; }
-        QSlider::add-page:horizontal { background: #2a2a2a; height: 6px; border-radius: 3px; }
-        QSlider::handle:horizontal {
-            background: #1e90ff;
-            width: 14px;
-            margin: -6px 0;
-            border-radius: 7px;
-        }
-        QMenuBar { background: #2d2d2d; color: #e6e6e6; }
-        QMenuBar::item:selected { background: #3a3a3a; }
-        QMenu { background: #2d2d2d; color: #e6e6e6; }
-        QMenu::item:selected { background: #3a3a3a; }
-        QPushButton {
-            background: #2d2d2d;
-            color: #e6e6e6;
-            border: 1px solid #3f3f3f;
-            padding: 4px 10px;
-        }
-        QPushButton:hover { background: #353535; }
-        QPushButton:pressed { background: #2a2a2a; }
-        QLabel { color: #e6e6e6; }
-        QStatusBar { background: #2d2d2d; color: #e6e6e6; }
-        """
-    )
+    return palette
+
+
+def apply_dark_theme(app: QtWidgets.QApplication) -> None:
+    app.setStyle("Fusion")
+    app.setPalette(_dark_palette())
+    app.setStyleSheet(_DARK_QSS)
 
 
+@functools.lru_cache(maxsize=128)
 def resource_path(*parts: str) -> str:
-    base = os.path.dirname(os.path.abspath(__file__))
     return (
-        os.path.join(os.path.dirname(base), *parts)
+        os.path.join(_PROJECT_DIR, *parts)
         if parts and parts[0] == "resources"
-        else os.path.join(base, *parts)
+        else os.path.join(_PACKAGE_DIR, *parts)
     )
 
 
 def apply_app_icon(app: QtWidgets.QApplication) -> QtGui.QIcon:
     icon_path = resource_path("resources", "icons", "app.svg")
-    icon = QtGui.QIcon(icon_path)
+    icon = _app_icons.get(icon_path)
+    if icon is None:
+        icon = _app_icons[icon_path] = QtGui.QIcon(icon_path)
     app.setWindowIcon(icon)
     return icon
 
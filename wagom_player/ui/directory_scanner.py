@@ -0,0 +1,53 @@
+import threading
+
+from PyQt5 import QtCore
+
+from ..playlist import collect_video_files
+
+
+class DirectoryScanner(QtCore.QObject):
+    """動画ディレクトリの走査をワーカースレッドで行い、結果を signal で返す。
+
+    scanned は (token, directory, video_files, error) を運ぶ。ワーカースレッドから
+    emit されるため、受け手のスロットはメインスレッドで実行される。新しい走査を
+    始めると古い token は無効になり、受け手は is_current() で結果を捨てられる。
+    """
+
+    scanned = QtCore.pyqtSignal(int, str, object, object)
+
+    def __init__(self, parent=None, collect=collect_video_files):
+        super().__init__(parent)
+        self._collect = collect
+        self._token = 0
+
+    def start(self, directory: str) -> int:
+        self._token += 1
+        token = self._token
+        thread = threading.Thread(
+            target=self._run,
+            args=(token, directory),
+            name="wagom-directory-scan",
+            daemon=True,
+        )
+        thread.start()
+        return token
+
+    def cancel(self) -> None:
+        """走査中の結果をすべて無効にする。"""
+        self._token += 1
+
+    def is_current(self, token: int) -> bool:
+        return token == self._token
+
+    def _run(self, token: int, directory: str) -> None:
+        video_files = None
+        error = None
+        try:
+            video_files = self._collect(directory)
+        except OSError as e:
+            error = e
+        try:
+            self.scanned.emit(token, directory, video_files, error)
+        except RuntimeError:
+            # 受け手のウィンドウが先に破棄された場合
+            pass
@@ -1,8 +1,9 @@
 import os
+import random
 import re
 import sys
 import threading
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -12,7 +13,6 @@ from ..application.file_actions import (
     TargetFileExistsError,
     move_file_to_subfolder,
     move_file_to_subfolder_as_unique,
-    target_path_for_subfolder,
     validate_move_to_subfolder,
 )
 from ..application.playlist_controller import PlaylistController
@@ -20,22 +20,17 @@ from ..dialogs import MetadataDialog, ShortcutListDialog
 from ..domain.formatting import format_ms
 from ..domain.window_title import build_window_title
 from ..infrastructure import vlc_backend
+from ..infrastructure.prefetch import prefetch_in_background
 from ..infrastructure.settings_store import SettingsStore
 from ..infrastructure.trash import TrashService
 from ..infrastructure.windows_integration import apply_windows_dark_titlebar
 from ..logger import log_message
 from ..overlay import OverlayLabel
-from ..playlist import (
-    SUPPORTED_VIDEO_EXTENSIONS,
-    collect_video_files,
-)
+from ..playlist import SUPPORTED_VIDEO_EXTENSIONS
 from ..playlist import _create_windows_logical_key as _create_windows_logical_key
 from ..playlist import natural_key as natural_key
 from ..shortcuts import SHORTCUT_ROWS
-from ..ui_styles import (
-    SEEK_SLIDER_STYLE_NORMAL,
-    SEEK_SLIDER_STYLE_WARNING,
-)
+from .directory_scanner import DirectoryScanner
 from .player_view import apply_control_icons, build_player_view
 from .shortcut_binder import bind_shortcuts
 
@@ -49,15 +44,108 @@ except ImportError:
     send2trash = None  # type: ignore[assignment]
 
 
-def _create_vlc_instance() -> "vlc.Instance":
+_T = TypeVar("_T")
+
+# ファイルを開くダイアログの名前フィルタ。拡張子一覧は固定なので一度だけ組み立てる
+_VIDEO_FILE_FILTER = "動画ファイル ({});;すべてのファイル (*.*)".format(
+    " ".join(f"*{ext}" for ext in SUPPORTED_VIDEO_EXTENSIONS)
+)
+# last_dir が未保存のときの開始フォルダ。ダイアログを開くたびに解決し直さない
+_HOME_DIR = os.path.expanduser("~")
+# 音声トラック名から英数字のトークンを取り出す(トラックごとに何度も使う)
+_ASCII_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _index_by_path(paths: list[str]) -> dict[str, int]:
+    """パス -> 位置の対応表。重複があれば list.index と同じく先頭の位置を採る。"""
+    index: dict[str, int] = {}
+    for i, path in enumerate(paths):
+        index.setdefault(path, i)
+    return index
+
+
+def _pop_indexed(paths: list[str], index: dict[str, int], position: int) -> None:
+    """paths から position の要素を取り除き、_index_by_path の対応表を差分で直す。
+
+    対応表を作り直さず、取り除いた位置より後ろの要素だけを 1 つ前へずらす。
+    """
+    removed = paths.pop(position)
+    if index.get(removed) == position:
+        del index[removed]
+    for i in range(position, len(paths)):
+        path = paths[i]
+        first = index.get(path)
+        if first is None:
+            # 取り除いた要素と同じパスが後ろにもあれば、それが新しい先頭になる
+            index[path] = i
+        elif first == i + 1:
+            index[path] = i
+
+
+def _create_vlc_instance(*, fresh: bool = False) -> "vlc.Instance":
     vlc_backend.vlc = vlc
-    return vlc_backend.create_vlc_instance()
+    return vlc_backend.create_vlc_instance(fresh=fresh)
 
 
 class VideoPlayer(QtWidgets.QMainWindow):
     SEEK_SHORT_MS = 10_000
     SEEK_LONG_MS = 60_000
     FRAME_STEP_FALLBACK_MS = 33
+    # これ未満の移動しかしないシークは libVLC に渡さない(デコーダのフラッシュを避ける)
+    SEEK_EPSILON_MS = 250
+    # キーリピートによる連続シークを libVLC に渡す最小間隔
+    SEEK_COALESCE_MS = 30
+    # seek_by で直近の再生位置を get_time() の代わりに使ってよい鮮度(ミリ秒)
+    TIME_CACHE_TTL_MS = 200
+    # ステータス更新の間隔。再生位置は VLC の TimeChanged イベントで受け取るので、
+    # 定期処理は長さの確定と診断情報の更新だけを担う。シークバーのドラッグ中だけ細かく回す。
+    STATUS_INTERVAL_MS = 1000
+    STATUS_SEEKING_INTERVAL_MS = 50
+    # TimeChanged はフレームごとに届き得るため、この間隔未満の変化は UI スレッドへ送らない
+    TIME_EVENT_MIN_INTERVAL_MS = 200
+    # メタデータの非同期解析を打ち切るまでの時間。遅いネットワーク共有で解析スレッドを
+    # 長く占有させない(再生自体は解析の完了を待たない)
+    MEDIA_PARSE_TIMEOUT_MS = 3000
+    # 再生開始から次の曲のメディアを用意し始めるまでの時間。開始直後の読み込みと競合させない
+    NEXT_MEDIA_PREPARE_DELAY_MS = 2000
+    # 音量スライダーの操作が止まってから libVLC に音量を渡すまでの待ち時間
+    VOLUME_APPLY_DELAY_MS = 50
+    # stop() を省ける VLC の状態。(解決に使った vlc.State, 状態の集合) の組で、
+    # 最初の曲切替で一度だけ解決する(テストでは vlc モジュールが差し替わる)
+    _idle_vlc_states: Optional[tuple[Any, frozenset]] = None
+    # メタデータダイアログに出す項目。表示名と vlc.Meta の属性名の組で、表示順に並べる
+    METADATA_FIELDS = (
+        # --- 基本情報 ---
+        ("Title", "Title"),
+        ("Artist", "Artist"),
+        ("Album", "Album"),
+        ("Album Artist", "AlbumArtist"),
+        ("Genre", "Genre"),
+        ("Date", "Date"),
+        ("Description", "Description"),
+        # --- トラック/ディスク情報 ---
+        ("Track Number", "TrackNumber"),
+        ("Track Total", "TrackTotal"),
+        ("Disc Number", "DiscNumber"),
+        ("Disc Total", "DiscTotal"),
+        ("Track ID", "TrackID"),
+        # --- TV/映画情報 ---
+        ("Show Name", "ShowName"),
+        ("Season", "Season"),
+        ("Episode", "Episode"),
+        ("Director", "Director"),
+        ("Actors", "Actors"),
+        # --- その他 ---
+        ("Rating", "Rating"),
+        ("Language", "Language"),
+        ("Copyright", "Copyright"),
+        ("Publisher", "Publisher"),
+        ("Encoded By", "EncodedBy"),
+        ("Setting", "Setting"),
+        ("URL", "URL"),
+        ("Artwork URL", "ArtworkURL"),
+        ("Now Playing", "NowPlaying"),
+    )
     DEFAULT_AUDIO_LANGUAGE = "ja"
     AUDIO_LANGUAGE_ALIASES = {
         "ja": ("ja", "jpn", "jp", "japanese", "japan", "日本語", "日本", "日語"),
@@ -80,10 +168,16 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.playback_rate = 1.0
 
         self.setWindowTitle("wagom-player")
+        # 直近に設定したタイトル。同じ文字列での setWindowTitle(WM への往復)を省く
+        self._last_title = "wagom-player"
+        # 直近のタイトルを組み立てた入力。同じならファイルサイズの取得ごと省く
+        self._title_inputs: Optional[tuple] = None
         self.resize(960, 540)
         self.settings_store = SettingsStore(QtCore.QSettings())
         self.settings = self.settings_store.settings
         self.playlist_controller = PlaylistController()
+        # シャッフル順を作る乱数生成器。切り替えのたびに作り直さない
+        self._random = random.Random()
         self.trash_service = TrashService(send2trash)
 
         # VLC
@@ -91,13 +185,21 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.player: vlc.MediaPlayer = self.vlc_instance.media_player_new()
         self.vlc_player = VlcPlayerAdapter(self.player)
         self.vlc_events = VlcEvents()
+        self._current_media: Optional[vlc.Media] = None
+        # _current_media を作ったパス。同じ曲の再生し直しではメディアを作り直さない
+        self._current_media_path: Optional[str] = None
+        # 描画先のネイティブウィンドウ ID と、それを設定済みの player
+        self._video_wid: Optional[int] = None
+        self._video_surface_player: Optional[vlc.MediaPlayer] = None
         self._vlc_generation = 0
+        # VLC スレッドで最後に UI へ送った再生位置(TimeChanged の間引き用)
+        self._last_time_event_ms = -self.TIME_EVENT_MIN_INTERVAL_MS
         self._vlc_events_signal_connected = False
         self._attach_vlc_events(self._next_vlc_generation())
 
         self.repeat_enabled: bool = False
         self.shuffle_enabled: bool = False
-        self.shuffled_playlist: list[str] = []
+        self.shuffled_playlist = []
 
         # UI
         self._build_ui()
@@ -105,18 +207,25 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.overlay = OverlayLabel(self, self.video_frame)
         self.duration_overlay_label = self.overlay.label
         self.duration_overlay_timer = self.overlay.timer
+        # ウィンドウのドラッグ・リサイズ中は move/resize イベントが連続するので、
+        # オーバーレイの追従は 1 フレーム分まとめてから行う。
+        self._overlay_geometry_timer = QtCore.QTimer(self)
+        self._overlay_geometry_timer.setSingleShot(True)
+        self._overlay_geometry_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._overlay_geometry_timer.setInterval(16)
+        self._overlay_geometry_timer.timeout.connect(self.overlay.resize_to_frame_rect)
 
-        self.SEEK_SLIDER_STYLE_NORMAL = SEEK_SLIDER_STYLE_NORMAL
-        self.SEEK_SLIDER_STYLE_WARNING = SEEK_SLIDER_STYLE_WARNING
         # 現在のシークバーの状態を管理するフラグ
         self._is_seek_bar_warning = False
-        # 初期スタイルを適用
-        self.seek_slider.setStyleSheet(self.SEEK_SLIDER_STYLE_NORMAL)
 
         # プレイリスト
-        self.directory_playlist: list[str] = []  # ディレクトリ内の動画リスト
+        self.directory_playlist = []  # ディレクトリ内の動画リスト
         self.current_index: int = -1
         self._last_external_file_path: str = ""
+        # ディレクトリ走査はワーカースレッドで行い、結果だけをメインスレッドで受け取る
+        self.directory_scanner = DirectoryScanner(self)
+        self.directory_scanner.scanned.connect(self._on_directory_scanned)
+        self._pending_scan_file: str = ""
         self._last_external_file_msec: int = 0
         self.preferred_audio_language = self.DEFAULT_AUDIO_LANGUAGE
         self._pending_audio_language_apply = False
@@ -132,19 +241,71 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
         # タイマー
         self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.timer.setInterval(self.STATUS_INTERVAL_MS)
         self.timer.timeout.connect(self._update_status_time)
-        self.timer.start(200)
+        # 再生中だけ回す。開始は showEvent / Playing イベント / play_at が行う
         self._diagnostics_heartbeat_timer = diagnostics.start_heartbeat_timer(self)
 
         # シーク状態
         self._seeking_user: bool = False
         self._media_length: int = -1
+        # 現在のメディアで総再生時間のオーバーレイを表示済みか
+        self._overlay_shown_for_media: bool = False
+        # 総再生時間の表示文字列。長さはメディアごとに 1 回しか変わらないので使い回す。
+        self._total_str_ms: int = -1
+        self._total_str: str = "00:00"
+        # 再生位置ラベルに表示中の位置(秒, 総再生時間)。秒が変わらなければ整形しない。
+        self._time_label_key: Optional[tuple[int, int]] = None
+        # 直近に取得/設定した再生位置と、その記録時刻(エポックミリ秒)。-1 は不明。
+        self._last_time_ms: int = -1
+        self._last_time_at_msec: int = 0
         self._ending: bool = False
         self._last_long_seek_msec_by_key: dict[int, int] = {}
         self._file_operation_in_progress: bool = False
+        # 表示中の「開く」ダイアログ。開いている間の再度の呼び出しでは重ねて開かない
+        self._open_file_dialog: Optional[QtWidgets.QFileDialog] = None
         self._status_priority_until_msec: int = 0
+        # 連続シークは最初の 1 回をすぐ反映し、以降は SEEK_COALESCE_MS ごとに最新の
+        # 移動先だけを libVLC に渡す。
+        self._pending_seek_ms: int = -1
+        self._seek_flush_timer = QtCore.QTimer(self)
+        self._seek_flush_timer.setSingleShot(True)
+        self._seek_flush_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._seek_flush_timer.setInterval(self.SEEK_COALESCE_MS)
+        self._seek_flush_timer.timeout.connect(self._flush_pending_seek)
+        # 次/前の動画への切替は 1 本のタイマーで予約する。連打時は最後の予約だけが残る。
+        self._next_track_index: int = -1
+        self._next_track_reason: str = ""
+        self._next_track_timer = QtCore.QTimer(self)
+        self._next_track_timer.setSingleShot(True)
+        self._next_track_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._next_track_timer.timeout.connect(self._flush_next_track)
+        # 単曲リピートで頭から再生し直すパス。_restart_current が取り出して消す
+        self._repeat_restart_path: Optional[str] = None
+        # 再生中に先回りして作っておく次の曲のメディアと、そのパス・作成元インスタンス
+        self._next_media: Optional[vlc.Media] = None
+        self._next_media_path: Optional[str] = None
+        self._next_media_instance = None
+        self._next_media_timer = QtCore.QTimer(self)
+        self._next_media_timer.setSingleShot(True)
+        self._next_media_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._next_media_timer.setInterval(self.NEXT_MEDIA_PREPARE_DELAY_MS)
+        self._next_media_timer.timeout.connect(self._prepare_next_media)
 
         # 初期音量
+        # スライダーのドラッグ中は valueChanged が 1px ごとに届くため、動きが
+        # VOLUME_APPLY_DELAY_MS 止まったときとドラッグを離したときだけ libVLC に渡す。
+        self._pending_volume: Optional[int] = None
+        # 最後に受け付けた音量(スライダー値の写し)と、音量ラベルに表示中の値。
+        # 同じ値なら処理を省き、キー操作ではスライダーを読み直さずにこちらを使う。
+        self._last_volume: int = int(self.volume_slider.value())
+        self._volume_label_value: int = -1
+        self._volume_apply_timer = QtCore.QTimer(self)
+        self._volume_apply_timer.setSingleShot(True)
+        self._volume_apply_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self._volume_apply_timer.setInterval(self.VOLUME_APPLY_DELAY_MS)
+        self._volume_apply_timer.timeout.connect(self._apply_pending_volume)
         self.vlc_player.audio_set_volume(
             int(self.volume_slider.value()),
             context="initial_audio_set_volume",
@@ -159,8 +320,10 @@ class VideoPlayer(QtWidgets.QMainWindow):
         # ショートカット
         self._setup_shortcuts()
 
-        # 設定の復元（レイアウト構築・初期化後）
-        self._load_settings()
+        # 設定の復元（レイアウト構築・初期化後）。初回描画に不要な分はイベントループ
+        # 開始後に回す。
+        self._load_settings_critical()
+        QtCore.QTimer.singleShot(0, self._load_settings_deferred)
 
         # 起動時にファイルが渡された場合、そのファイルをロードする
         if file:
@@ -184,6 +347,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.seek_slider.clickedValue.connect(self._on_slider_clicked)
         self.volume_slider.valueChanged.connect(self._on_volume_changed)
         self.volume_slider.clickedValue.connect(self._on_volume_clicked)
+        self.volume_slider.sliderReleased.connect(self._apply_pending_volume)
         self.video_frame.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.video_frame.customContextMenuRequested.connect(self._show_video_context_menu)
 
@@ -298,32 +462,32 @@ class VideoPlayer(QtWidgets.QMainWindow):
     def showEvent(self, event: QtGui.QShowEvent) -> None:  # noqa: N802
         super().showEvent(event)
         self._apply_windows_dark_titlebar()
+        self._sync_status_timer(bool(self._last_playing_state))
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:  # noqa: N802
+        # 最小化・非表示の間はステータス表示を更新しても見えないので止めておく
+        super().hideEvent(event)
+        self.timer.stop()
 
     def _apply_windows_dark_titlebar(self) -> None:
         apply_windows_dark_titlebar(int(self.winId()))
 
     def _load_file_and_directory(self, file_path: str):
-        """指定されたファイルを開き、そのディレクトリ内の動画ファイルをリストアップする"""
+        """指定されたファイルを開き、そのディレクトリ内の動画ファイルをリストアップする
+
+        ディレクトリ走査はワーカースレッドで行い、指定ファイルの再生を先に始める。
+        走査結果は _on_directory_scanned でプレイリストに反映する。
+        """
         diagnostics.record_breadcrumb("load_file_and_directory", path=file_path)
         if not os.path.isfile(file_path):
             return
 
         directory = os.path.dirname(file_path)
-        log_message(f"Scanning directory: {directory}")
+        log_message("Scanning directory: %s", directory)
 
-        try:
-            video_files = collect_video_files(directory)
-        except OSError as e:
-            log_message(f"Error scanning directory: {e}")
-            self._show_status_message(f"ディレクトリのスキャンに失敗しました: {e}", 5000)
-            return
-
-        if not video_files:
-            log_message("No video files found in the directory.")
-            # 動画が1つも見つからない場合でも、指定されたファイルだけは再生する
-            video_files = [file_path]
-
-        self.directory_playlist = video_files
+        # 走査が終わるまでは指定されたファイルだけのプレイリストで再生する
+        self.directory_playlist = [file_path]
+        self.current_index = 0
 
         if self.shuffle_enabled:
             # シャッフルが有効な状態で新しいディレクトリを開いたら、一度無効にする
@@ -331,20 +495,113 @@ class VideoPlayer(QtWidgets.QMainWindow):
             self.shuffled_playlist = []
             self._update_shuffle_button()
 
-        # 渡されたファイルがリストの何番目にあるかを探す
-        try:
-            # パスを正規化して比較
-            normalized_path = os.path.normpath(file_path)
-            normalized_playlist = [os.path.normpath(p) for p in self.directory_playlist]
-            self.current_index = normalized_playlist.index(normalized_path)
-        except ValueError:
-            # 万が一見つからない場合は、最初のファイルを再生
-            log_message(f"Could not find '{file_path}' in scanned list. Defaulting to first file.")
-            self.current_index = 0
+        self._pending_scan_file = file_path
+        self.directory_scanner.start(directory)
 
         # 再生開始
         self.play_at(self.current_index)
 
+    def _on_directory_scanned(self, token: int, directory: str, video_files, error) -> None:
+        """ワーカースレッドのディレクトリ走査結果をプレイリストに反映する。"""
+        if not self.directory_scanner.is_current(token):
+            return
+        file_path = self._pending_scan_file
+        self._pending_scan_file = ""
+
+        if error is not None:
+            log_message("Error scanning directory: %s", error)
+            self._show_status_message(f"ディレクトリのスキャンに失敗しました: {error}", 5000)
+            return
+        if not video_files:
+            # 動画が1つも見つからない場合でも、指定されたファイルだけは再生を続ける
+            log_message("No video files found in the directory.")
+            return
+        if self.directory_playlist != [file_path]:
+            # 走査中に別のプレイリスト操作が入ったときは上書きしない
+            return
+
+        self.directory_playlist = video_files
+        # 渡されたファイルがリストの何番目にあるかを探す
+        index = self._find_playlist_index(file_path)
+        if index < 0:
+            log_message("Could not find '%s' in scanned list. Keeping it alone.", file_path)
+            self.directory_playlist = [file_path]
+            index = 0
+        self.current_index = index
+
+        if self.shuffle_enabled:
+            # 走査中にシャッフルが有効にされた場合は、揃ったリストで作り直す
+            self._create_or_clear_shuffled_playlist()
+        self._update_window_title()
+
+    @property
+    def directory_playlist(self) -> list[str]:
+        return self._directory_playlist
+
+    @directory_playlist.setter
+    def directory_playlist(self, files: list[str]) -> None:
+        # 件数と位置の対応表は曲送りのたびに使うので、リストを差し替えたときに作っておく
+        self._directory_playlist = files
+        self._playlist_len = len(files)
+        self._path_to_index = _index_by_path(files)
+        # 正規化したパスの対応表は、表記揺れのある検索が来たときに初めて作る
+        self._normalized_path_to_index: Optional[dict[str, int]] = None
+
+    @property
+    def shuffled_playlist(self) -> list[str]:
+        return self._shuffled_playlist
+
+    @shuffled_playlist.setter
+    def shuffled_playlist(self, files: list[str]) -> None:
+        self._shuffled_playlist = files
+        self._shuffled_path_to_index = _index_by_path(files)
+
+    def _remove_playlist_entry(self, index: int) -> None:
+        """directory_playlist から 1 件取り除く。リストの直接変更はここに集める。"""
+        _pop_indexed(self._directory_playlist, self._path_to_index, index)
+        self._playlist_len = len(self._directory_playlist)
+        self._normalized_path_to_index = None
+
+    def _remove_shuffled_entry(self, path: str) -> None:
+        """shuffled_playlist から path を取り除く。含まれていなければ何もしない。"""
+        position = self._shuffled_path_to_index.get(path)
+        if position is None:
+            return
+        _pop_indexed(self._shuffled_playlist, self._shuffled_path_to_index, position)
+
+    def _adjacent_index(self, offset: int) -> Optional[int]:
+        """再生順で offset 先の曲の directory_playlist 上の位置。なければ None。
+
+        曲送りのたびに両リストを線形探索しないよう、位置の対応表を引く。
+        """
+        if not (0 <= self.current_index < self._playlist_len):
+            return None
+        if not self.shuffle_enabled:
+            target = self.current_index + offset
+            return target if 0 <= target < self._playlist_len else None
+        current_path = self._directory_playlist[self.current_index]
+        position = self._shuffled_path_to_index.get(current_path)
+        if position is None:
+            return None
+        target = position + offset
+        if not (0 <= target < len(self._shuffled_playlist)):
+            return None
+        return self._path_to_index.get(self._shuffled_playlist[target])
+
+    def _find_playlist_index(self, file_path: str) -> int:
+        """directory_playlist 内の file_path の位置を返す。見つからなければ -1。"""
+        # スキャン結果は dirname(file_path) と名前の join なので、通常は完全一致する
+        index = self._path_to_index.get(file_path)
+        if index is not None:
+            return index
+        # 表記揺れ(区切り文字・大文字小文字など)があるときだけ正規化して引く。
+        # 正規化はリストが変わるまでに 1 回だけ行う。
+        if self._normalized_path_to_index is None:
+            self._normalized_path_to_index = _index_by_path(
+                [os.path.normcase(os.path.normpath(path)) for path in self._directory_playlist]
+            )
+        return self._normalized_path_to_index.get(os.path.normcase(os.path.normpath(file_path)), -1)
+
     def open_external_file(self, file_path: str) -> None:
         """別プロセスから渡されたファイルを既存ウィンドウで開く。"""
         diagnostics.record_breadcrumb("open_external_file", path=file_path)
@@ -354,7 +611,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
             return
 
         if not os.path.isfile(file_path):
-            log_message(f"External open ignored because file does not exist: {file_path}")
+            log_message("External open ignored because file does not exist: %s", file_path)
             self._show_status_message(f"ファイルが見つかりません: {file_path}", 5000)
             return
 
@@ -364,7 +621,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
             normalized == self._last_external_file_path
             and now - self._last_external_file_msec < 3000
         ):
-            log_message(f"Duplicate external open ignored: {file_path}")
+            log_message("Duplicate external open ignored: %s", file_path)
             self._show_status_message("同じファイルの連続起動を無視しました", 2500)
             return
 
@@ -387,43 +644,49 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.activateWindow()
 
     # --------------- 設定保存/復元 ---------------
-    def _load_settings(self) -> None:
+    def _load_settings_critical(self) -> None:
+        """最初の表示と再生開始に必要な設定(音量・配置・優先言語)を復元する。"""
+        # 設定値はウィジェット操作を挟まずにまとめて読み、バックエンドへの問い合わせを続ける
+        s = self.settings
         vol = self.settings_store.volume()
+        geom = s.value("geometry")
+        language = s.value("preferred_audio_language", self.DEFAULT_AUDIO_LANGUAGE, type=str)
+        subtitle_enabled = s.value("subtitle_enabled", False, type=bool)
+        subtitle_language = s.value(
+            "preferred_subtitle_language",
+            self.DEFAULT_AUDIO_LANGUAGE,
+            type=str,
+        )
+
         if vol != int(self.volume_slider.value()):
             self.volume_slider.setValue(vol)
+            self._apply_pending_volume()
 
         # ミュート状態は保存しない（常に起動時はミュートOFF）
         self._muted = False
-        self.vlc_player.audio_set_mute(False, context="load_settings_audio_set_mute")
         self._update_volume_label()
 
         # ウィンドウ配置
-        geom = self.settings.value("geometry")
         if isinstance(geom, QtCore.QByteArray):
             self.restoreGeometry(geom)
+
+        self.preferred_audio_language = self._normalize_audio_language(language)
+        self.subtitle_enabled = bool(subtitle_enabled)
+        self.preferred_subtitle_language = self._normalize_audio_language(subtitle_language)
+
+    def _load_settings_deferred(self) -> None:
+        """初回描画後でよい設定(最大化・リピート・ミュート解除)を復元する。"""
         is_max = bool(self.settings.value("isMaximized", False, type=bool))
-        if is_max:
-            self.setWindowState(self.windowState() | QtCore.Qt.WindowMaximized)
         # リピート状態（デフォルトOFF）
         repeat = self.settings_store.repeat_enabled()
+
+        self.vlc_player.audio_set_mute(False, context="load_settings_audio_set_mute")
+        if is_max:
+            self.setWindowState(self.windowState() | QtCore.Qt.WindowMaximized)
         self.btn_repeat.setChecked(repeat)
         self.repeat_enabled = repeat
         self._update_repeat_button()
 
-        language = self.settings.value(
-            "preferred_audio_language",
-            self.DEFAULT_AUDIO_LANGUAGE,
-            type=str,
-        )
-        self.preferred_audio_language = self._normalize_audio_language(language)
-        self.subtitle_enabled = bool(self.settings.value("subtitle_enabled", False, type=bool))
-        subtitle_language = self.settings.value(
-            "preferred_subtitle_language",
-            self.DEFAULT_AUDIO_LANGUAGE,
-            type=str,
-        )
-        self.preferred_subtitle_language = self._normalize_audio_language(subtitle_language)
-
     def _save_settings(self) -> None:
         def _save() -> None:
             self.settings_store.set_value("volume", int(self.volume_slider.value()))
@@ -449,6 +712,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
     # --------------- VLC ---------------
     def _next_vlc_generation(self) -> int:
         self._vlc_generation += 1
+        self._reset_time_event_throttle()
         return self._vlc_generation
 
     def _attach_vlc_events(self, generation: int) -> None:
@@ -461,54 +725,116 @@ class VideoPlayer(QtWidgets.QMainWindow):
             vlc.EventType.MediaPlayerPlaying,
             lambda event, gen=generation: self._on_vlc_playing_for_generation(event, gen),
         )
+        # 再生ボタンの表示は状態遷移イベントで更新し、定期的な is_playing() 問い合わせを避ける
+        for event_type in (vlc.EventType.MediaPlayerPaused, vlc.EventType.MediaPlayerStopped):
+            em.event_attach(
+                event_type,
+                lambda event, gen=generation: self._on_vlc_paused_for_generation(event, gen),
+            )
+        # 再生位置も get_time() で問い合わせず、VLC から届く値を使う
+        em.event_attach(
+            vlc.EventType.MediaPlayerTimeChanged,
+            lambda event, gen=generation: self._on_vlc_time_for_generation(event, gen),
+        )
         if not self._vlc_events_signal_connected:
-            self.vlc_events.media_ended.connect(self._on_media_end)
+            # EndReached は VLC のスレッドから届く。UI スレッドで 1 件ずつ処理されるよう
+            # キュー接続を明示し、_on_media_end 内のフラグ操作を UI スレッドだけに閉じ込める
+            self.vlc_events.media_ended.connect(self._on_media_end, QtCore.Qt.QueuedConnection)
             self.vlc_events.media_playing.connect(self._on_media_playing)
+            self.vlc_events.playing_state_changed.connect(self._set_play_state)
+            self.vlc_events.playing_state_changed.connect(self._sync_status_timer)
+            self.vlc_events.time_changed.connect(self._on_time_changed)
             self._vlc_events_signal_connected = True
 
     def _create_fresh_vlc_player(self) -> None:
         """現在の VLC player を破棄し、新しい player/adapter に差し替える。"""
-        self.vlc_instance = _create_vlc_instance()
+        # 停止できなかった古い player と同じ Instance は使わず、別の Instance で作り直す
+        self.vlc_instance = _create_vlc_instance(fresh=True)
         self.player = self.vlc_instance.media_player_new()
         self.vlc_player = VlcPlayerAdapter(self.player)
+        # 古い player が握るメディアは遅延 stop と共に捨てる。ここでは release しない。
+        self._current_media = None
+        self._current_media_path = None
+        self._discard_next_media()
         self._bind_video_surface()
         self._attach_vlc_events(self._next_vlc_generation())
 
     def _on_vlc_end_for_generation(self, event, generation: int) -> None:
         if generation != self._vlc_generation:
             log_message(
-                f"Ignoring stale VLC EndReached event: "
-                f"generation={generation}, current={self._vlc_generation}"
+                "Ignoring stale VLC EndReached event: generation=%s, current=%s",
+                generation,
+                self._vlc_generation,
             )
             return
         self._on_vlc_end(event)
 
     def _on_vlc_end(self, event) -> None:
-        log_message(f"_on_vlc_end(): VLC EndReached fired, current_index={self.current_index}")
+        log_message("_on_vlc_end(): VLC EndReached fired, current_index=%s", self.current_index)
         self.vlc_events.media_ended.emit()
 
     def _on_vlc_playing_for_generation(self, event, generation: int) -> None:
         # VLC スレッドから呼ばれるため、Qt/VLC 操作はメインスレッドへ marshal する。
         if generation != self._vlc_generation:
             return
+        self.vlc_events.playing_state_changed.emit(True)
         self.vlc_events.media_playing.emit()
 
+    def _on_vlc_paused_for_generation(self, event, generation: int) -> None:
+        # Paused/Stopped 共通。VLC スレッドから呼ばれるため signal 経由でメインスレッドへ渡す。
+        if generation != self._vlc_generation:
+            return
+        self.vlc_events.playing_state_changed.emit(False)
+
+    def _on_vlc_time_for_generation(self, event, generation: int) -> None:
+        # VLC スレッドから呼ばれる。ここでは間引きだけ行い、表示はメインスレッドに任せる
+        if generation != self._vlc_generation:
+            return
+        new_time = event.u.new_time
+        if abs(new_time - self._last_time_event_ms) < self.TIME_EVENT_MIN_INTERVAL_MS:
+            return
+        self._last_time_event_ms = new_time
+        self.vlc_events.time_changed.emit(new_time)
+
+    def _reset_time_event_throttle(self) -> None:
+        """曲の切替やシークの直後に届く TimeChanged を間引かないようにする。
+
+        前の位置との差で間引いているため、記録を残したままだと新しい位置が前の位置に
+        近いとき最初の通知が捨てられる。0ms の通知も通るよう、間隔ぶん負の値にする。
+        """
+        self._last_time_event_ms = -self.TIME_EVENT_MIN_INTERVAL_MS
+
+    def _on_time_changed(self, cur: int) -> None:
+        """VLC から届いた再生位置をシークバーとステータスへ反映する。"""
+        # ドラッグ中はシークバーの値をユーザーが握っているので、短周期タイマー側に任せる
+        if self._seeking_user or cur < 0:
+            return
+        self._remember_time(cur)
+        total = self._media_length
+        if total <= 0:
+            # 長さが確定するまでだけ問い合わせる
+            total = self.vlc_player.get_length()
+            if total <= 0:
+                return
+            self._apply_media_length(total)
+        self._show_playback_position(cur, total)
+
     def _on_media_playing(self) -> None:
         # 入力が有効化（Playing 到達）した時点で、現在の世代の pending を適用する。
         self._apply_preferred_tracks_if_pending(self._track_apply_generation)
 
     def _on_media_end(self) -> None:
         log_message(
-            f"_on_media_end(): ENTER, "
-            f"_ending={getattr(self, '_ending', False)}, "
-            f"current_index={self.current_index}, "
-            f"dir_len={len(self.directory_playlist)}, "
-            f"plist_len={len(self._get_current_playlist())}"
+            "_on_media_end(): ENTER, _ending=%s, current_index=%s, dir_len=%s, plist_len=%s",
+            self._ending,
+            self.current_index,
+            self._playlist_len,
+            len(self._get_current_playlist()),
         )
 
-        # 再生切替中なら無視
-        if getattr(self, "_is_changing_media", False):
-            log_message("_on_media_end(): ignored because _is_changing_media")
+        # 再生切替中、または次の動画への切替を予約済みなら、重複した終了イベントとして捨てる
+        if self._is_changing_media or self._ending:
+            log_message("_on_media_end(): ignored because media change is already in progress")
             return
         if getattr(self, "_file_operation_in_progress", False):
             log_message("_on_media_end(): ignored because file operation is in progress")
@@ -520,8 +846,8 @@ class VideoPlayer(QtWidgets.QMainWindow):
             return
 
         # index が変になってないか一応チェック
-        if not (0 <= self.current_index < len(self.directory_playlist)):
-            log_message(f"_on_media_end(): current_index out of range: {self.current_index}")
+        if not (0 <= self.current_index < self._playlist_len):
+            log_message("_on_media_end(): current_index out of range: %s", self.current_index)
             return
 
         # ============================
@@ -530,156 +856,274 @@ class VideoPlayer(QtWidgets.QMainWindow):
         if self.repeat_enabled:
             path = self.directory_playlist[self.current_index]
             log_message(
-                f"_on_media_end(): repeat_enabled=True -> reload same media "
-                f"index={self.current_index}, path={path}"
+                "_on_media_end(): repeat_enabled=True -> reload same media index=%s, path=%s",
+                self.current_index,
+                path,
             )
 
-            def _restart_current() -> None:
-                try:
-                    # VLC の状態をログしておくと後で分析しやすい
-                    try:
-                        state_before = self.vlc_player.get_state()
-                        t_before = self.vlc_player.get_time()
-                    except Exception:
-                        state_before = None
-                        t_before = None
-                    log_message(
-                        f"_restart_current(): BEFORE reload state={state_before}, time={t_before}"
-                    )
-
-                    # ★ 同じパスでメディアを作り直す（stop は呼ばない）
-                    media = self.vlc_instance.media_new(path)
-                    media.parse()
-                    if not self.vlc_player.set_media(
-                        media,
-                        context="restart_current_set_media",
-                        path=path,
-                    ):
-                        return
-                    self.vlc_player.play(context="restart_current_play", path=path)
-
-                    # シークバー状態を軽くリセットしておく
-                    self._media_length = -1
-                    self.seek_slider.blockSignals(True)
-                    self.seek_slider.setEnabled(True)
-                    self.seek_slider.setRange(0, 0)
-                    self.seek_slider.setValue(0)
-                    self.seek_slider.blockSignals(False)
-
-                    try:
-                        state_after = self.vlc_player.get_state()
-                        t_after = self.vlc_player.get_time()
-                    except Exception:
-                        state_after = None
-                        t_after = None
-                    log_message(
-                        f"_restart_current(): AFTER reload state={state_after}, time={t_after}"
-                    )
-
-                except Exception as e:
-                    log_message(f"_restart_current(): error: {e!r}")
-
-            QtCore.QTimer.singleShot(80, _restart_current)
+            # 数 ms の誤差は問題にならないので、省電力な CoarseTimer で待つ
+            self._repeat_restart_path = path
+            QtCore.QTimer.singleShot(80, QtCore.Qt.CoarseTimer, self._restart_current)
             return
 
         # ============================
         # ★ 通常モード（repeat_enabled=False）：次のファイルへ
         # ============================
 
-        if getattr(self, "_ending", False):
-            log_message("_on_media_end(): ignored because _ending already True")
-            return
         self._ending = True
 
-        try:
-            next_original_idx = self.playlist_controller.adjacent_index(
-                self.directory_playlist,
-                playlist,
-                self.current_index,
-                1,
-            )
-        except Exception as e:
-            log_message(f"_on_media_end(): adjacent_index error: {e}")
-            self._ending = False
-            return
+        next_original_idx = self._adjacent_index(1)
 
         if next_original_idx is not None:
             next_track_path = self.directory_playlist[next_original_idx]
             log_message(
-                "_on_media_end(): moving to next track "
-                f"idx={next_original_idx}, path={next_track_path}"
+                "_on_media_end(): moving to next track idx=%s, path=%s",
+                next_original_idx,
+                next_track_path,
             )
-            # _ending は _end_after が実行されるまで True のまま保持し、
+            # _ending は予約した切替が実行されるまで True のまま保持し、
             # その間に届く重複 EndReached イベントを抑制する
-            QtCore.QTimer.singleShot(80, lambda idx=next_original_idx: self._end_after(idx))
+            self._schedule_play_at(next_original_idx, 80, "from_end")
         else:
             log_message("_on_media_end(): reached end of playlist (repeat off) -> stop()")
             self._ending = False
             self.stop()
 
+    def _restart_current(self) -> None:
+        """リピート再生: 予約したパスのメディアを作り直して頭から再生する。"""
+        path = self._repeat_restart_path
+        if path is None:
+            return
+        self._repeat_restart_path = None
+        try:
+            # VLC の状態をログしておくと後で分析しやすい
+            try:
+                state_before = self.vlc_player.get_state()
+                t_before = self.vlc_player.get_time()
+            except Exception:
+                state_before = None
+                t_before = None
+            log_message(
+                "_restart_current(): BEFORE reload state=%s, time=%s",
+                state_before,
+                t_before,
+            )
+
+            # ★ 同じパスのメディアを設定し直す（stop は呼ばない）。解析済みの今のメディアを使い回す
+            media = self._take_media_for(path)
+            if not self._set_current_media(
+                media,
+                context="restart_current_set_media",
+                path=path,
+            ):
+                return
+            self.vlc_player.play(context="restart_current_play", path=path)
+
+            # シークバー状態を軽くリセットしておく
+            self._media_length = -1
+            self._overlay_shown_for_media = False
+            self._remember_time(-1)
+            self._reset_time_event_throttle()
+            self.seek_slider.blockSignals(True)
+            self.seek_slider.setEnabled(True)
+            self.seek_slider.setRange(0, 0)
+            self.seek_slider.setValue(0)
+            self.seek_slider.blockSignals(False)
+
+            try:
+                state_after = self.vlc_player.get_state()
+                t_after = self.vlc_player.get_time()
+            except Exception:
+                state_after = None
+                t_after = None
+            log_message(
+                "_restart_current(): AFTER reload state=%s, time=%s",
+                state_after,
+                t_after,
+            )
+
+        except Exception as e:
+            log_message("_restart_current(): error: %r", e)
+
     def _end_after(self, idx: int) -> None:
-        log_message(f"_end_after(): idx={idx}, current_index(before)={self.current_index}")
+        log_message("_end_after(): idx=%s, current_index(before)=%s", idx, self.current_index)
         try:
             self._play_at_with_reason(idx, "from_end")
         finally:
             self._ending = False
 
+    def _schedule_play_at(self, index: int, delay_ms: int, reason: str) -> None:
+        """delay_ms 後に index の動画へ切り替える。既存の予約は上書きする。"""
+        self._next_track_index = index
+        self._next_track_reason = reason
+        # 待ち時間と前の動画の後始末の間に、次の動画の先頭をページキャッシュへ載せておく
+        if 0 <= index < self._playlist_len:
+            prefetch_in_background(self.directory_playlist[index])
+        self._next_track_timer.start(delay_ms)
+
+    def _flush_next_track(self) -> None:
+        index, reason = self._next_track_index, self._next_track_reason
+        self._next_track_index = -1
+        if index < 0:
+            return
+        if reason == "from_end":
+            self._end_after(index)
+            return
+        try:
+            self._play_at_with_reason(index, reason)
+        finally:
+            # 終端からの切替予約を上書きした場合も、重複 EndReached の抑制を解く
+            self._ending = False
+
+    def _player_needs_stop(self) -> bool:
+        """停止済み・再生終了後なら stop() を省く。set_media だけで差し替えられる。"""
+        state = self.vlc_player.get_state()
+        return state is None or state not in self._resolve_idle_vlc_states()
+
+    @classmethod
+    def _resolve_idle_vlc_states(cls) -> frozenset:
+        cached = cls._idle_vlc_states
+        if cached is None or cached[0] is not vlc.State:
+            names = ("NothingSpecial", "Stopped", "Ended")
+            states = (getattr(vlc.State, name, None) for name in names)
+            cached = (vlc.State, frozenset(state for state in states if state is not None))
+            cls._idle_vlc_states = cached
+        return cached[1]
+
+    def _new_media(self, path: str) -> "vlc.Media":
+        """メディアを作成し、ローカルのメタデータ解析を非同期で開始する。
+
+        同期の parse() は解析が終わるまでメインスレッドを止めるため使わない。
+        長さはステータス更新タイマーが get_length() で拾う。
+        """
+        media = self.vlc_instance.media_new(path)
+        diagnostics.record_breadcrumb("media_new", path=path)
+        diagnostics.run_safely(
+            "media_parse_with_options",
+            lambda: media.parse_with_options(vlc.MediaParseFlag.local, self.MEDIA_PARSE_TIMEOUT_MS),
+            path=path,
+        )
+        return media
+
+    def _prepare_next_media(self) -> None:
+        """再生順で次の曲のメディアを作り、解析を先に済ませておく。"""
+        index = self._adjacent_index(1)
+        if index is None:
+            self._discard_next_media()
+            return
+        path = self._directory_playlist[index]
+        if self._next_media_path == path and self._next_media_instance is self.vlc_instance:
+            return
+        self._discard_next_media()
+        self._next_media = self._new_media(path)
+        self._next_media_path = path
+        self._next_media_instance = self.vlc_instance
+
+    def _take_media_for(self, path: str) -> "vlc.Media":
+        """path 用に用意済みのメディアがあればそれを返し、なければ新しく作る。"""
+        if self._current_media is not None and self._current_media_path == path:
+            # 同じ曲の再生し直し(リピートなど)。先読み中の次の曲はそのまま残す
+            diagnostics.record_breadcrumb("media_current_reused", path=path)
+            return self._current_media
+        media = self._next_media
+        if (
+            media is not None
+            and self._next_media_path == path
+            and self._next_media_instance is self.vlc_instance
+        ):
+            self._next_media = None
+            self._next_media_path = None
+            self._next_media_instance = None
+            diagnostics.record_breadcrumb("media_prepared_hit", path=path)
+            return media
+        self._discard_next_media()
+        return self._new_media(path)
+
+    def _discard_next_media(self) -> None:
+        self._next_media_timer.stop()
+        media, self._next_media = self._next_media, None
+        self._next_media_path = None
+        self._next_media_instance = None
+        if media is not None:
+            diagnostics.run_safely("media_release", media.release)
+
+    def _set_current_media(self, media: "vlc.Media", context: str, path: str) -> bool:
+        """player にメディアを設定し、前のメディアへの参照を即座に解放する。"""
+        if not self.vlc_player.set_media(media, context=context, path=path):
+            return False
+        previous, self._current_media = self._current_media, media
+        self._current_media_path = path
+        if previous is not None and previous is not media:
+            # player は set_media の時点で前のメディアを手放している。
+            # こちらの参照も GC 任せにせず、ここで返す。
+            diagnostics.run_safely("media_release", previous.release)
+        return True
+
     def _bind_video_surface(self) -> None:
-        wid = int(self.video_frame.winId())
+        # 描画先は player に一度設定すれば曲を替えても残るので、player ごとに 1 回だけ行う。
+        # video_frame は付け替えないため、ネイティブウィンドウ ID も使い回せる。
+        if self._video_surface_player is self.player:
+            return
+        if self._video_wid is None:
+            self._video_wid = int(self.video_frame.winId())
+        wid = self._video_wid
         if sys.platform.startswith("win"):
             self.player.set_hwnd(wid)
         elif sys.platform == "darwin":
             self.player.set_nsobject(wid)  # type: ignore[attr-defined]
         else:
             self.player.set_xwindow(wid)  # type: ignore[attr-defined]
+        self._video_surface_player = self.player
 
     # ------------- プレイリスト -------------
 
     def play_at(self, index: int) -> None:
         diagnostics.record_breadcrumb("play_at_requested", index=index)
 
-        if not (0 <= index < len(self.directory_playlist)):
+        if not (0 <= index < self._playlist_len):
             log_message("play_at(): index out of range")
             return
 
         if getattr(self, "_is_changing_media", False):
-            log_message(f"play_at(): SKIP index={index} because _is_changing_media is True")
+            log_message("play_at(): SKIP index=%s because _is_changing_media is True", index)
             return
         self._is_changing_media = True
+        if self._next_track_timer.isActive():
+            # 直接の再生指示が予約済みの切替より優先する
+            self._next_track_timer.stop()
+            self._next_track_index = -1
+            self._ending = False
 
         try:
             old = self.current_index
-            log_message(f"play_at(): START index={index}, old_index={old}")
+            log_message("play_at(): START index=%s, old_index=%s", index, old)
             self.current_index = index
             path = self.directory_playlist[index]
-            log_message(f"play_at(): path={path}")
+            log_message("play_at(): path=%s", path)
             diagnostics.record_breadcrumb("play_at_start", index=index, old_index=old, path=path)
 
-            try:
-                log_message("play_at(): before player.stop()")
-                diagnostics.record_breadcrumb("play_at_before_player_stop", path=path)
-                self.vlc_player.stop(context="play_at_player_stop", path=path)
-                log_message("play_at(): after player.stop()")
-                diagnostics.record_breadcrumb("play_at_after_player_stop", path=path)
-            except Exception as e:
-                log_message(f"play_at(): player.stop() error: {e}")
-                diagnostics.record_breadcrumb("play_at_player_stop_error", error=str(e))
+            if self._player_needs_stop():
+                try:
+                    log_message("play_at(): before player.stop()")
+                    diagnostics.record_breadcrumb("play_at_before_player_stop", path=path)
+                    self.vlc_player.stop(context="play_at_player_stop", path=path)
+                    log_message("play_at(): after player.stop()")
+                    diagnostics.record_breadcrumb("play_at_after_player_stop", path=path)
+                except Exception as e:
+                    log_message("play_at(): player.stop() error: %s", e)
+                    diagnostics.record_breadcrumb("play_at_player_stop_error", error=str(e))
 
             try:
                 log_message("play_at(): before media_new/parse")
                 diagnostics.record_breadcrumb("play_at_before_media_new", path=path)
-                media = self.vlc_instance.media_new(path)
-                diagnostics.record_breadcrumb("play_at_after_media_new", path=path)
-                diagnostics.record_breadcrumb("play_at_before_media_parse", path=path)
-                media.parse()  # ← ここで固まるか確認したい
-                log_message("play_at(): after media.parse()")
-                diagnostics.record_breadcrumb("play_at_after_media_parse", path=path)
+                media = self._take_media_for(path)
+                log_message("play_at(): after media parse request")
                 diagnostics.record_breadcrumb("play_at_before_set_media", path=path)
-                if not self.vlc_player.set_media(media, context="play_at_set_media", path=path):
+                if not self._set_current_media(media, context="play_at_set_media", path=path):
                     return
                 diagnostics.record_breadcrumb("play_at_after_set_media", path=path)
             except Exception as e:
-                log_message(f"play_at(): media setup error: {e}")
+                log_message("play_at(): media setup error: %s", e)
                 diagnostics.record_breadcrumb("play_at_media_setup_error", error=str(e))
                 return
 
@@ -689,24 +1133,29 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
             diagnostics.record_breadcrumb("play_at_before_player_play", path=path)
             self.vlc_player.play(context="play_at_player_play", path=path)
+            # Playing イベントを待たずに、長さと位置の取得を始めておく
+            self._sync_status_timer(True)
             self._schedule_preferred_track_apply()
+            self._next_media_timer.start()
             diagnostics.record_breadcrumb("play_at_after_player_play", path=path)
             log_message(
-                f"play_at(): player.play() done, current_index={self.current_index}, path={path}"
+                "play_at(): player.play() done, current_index=%s, path=%s",
+                self.current_index,
+                path,
             )
+            # 同じファイルの再生し直しでも、サイズは取り直す
+            self._invalidate_title_cache()
             self._update_window_title(os.path.basename(path))
-            # 優先メッセージ（移動完了など）の表示中は上書きしない。
-            # 期限が切れれば _update_status_time が再生時間表示へ引き継ぐ。
-            now_msec = QtCore.QDateTime.currentMSecsSinceEpoch()
-            if now_msec >= self._status_priority_until_msec:
-                self.status.showMessage(f"再生中: {path}")
+            self._show_persistent_status_message(f"再生中: {path}")
 
             # 新しい動画を再生する際に、シークバーの色を通常に戻す
-            if self._is_seek_bar_warning:
-                self.seek_slider.setStyleSheet(self.SEEK_SLIDER_STYLE_NORMAL)
-                self._is_seek_bar_warning = False
+            self._set_seek_bar_warning(False)
 
             self._media_length = -1
+            self._overlay_shown_for_media = False
+            self._remember_time(-1)
+            self._reset_time_event_throttle()
+            self._cancel_pending_seek()
             self.seek_slider.blockSignals(True)
             self.seek_slider.setEnabled(True)
             self.seek_slider.setRange(0, 0)
@@ -798,6 +1247,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
         for delay_ms in (150, 500, 1200):
             QtCore.QTimer.singleShot(
                 delay_ms,
+                QtCore.Qt.CoarseTimer,
                 lambda gen=generation: self._apply_preferred_tracks_if_pending(gen),
             )
 
@@ -871,11 +1321,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     def _audio_track_language_key(self, name: str) -> str:
         text = str(name or "").casefold()
-        tokens = set(re.findall(r"[a-z0-9]+", text))
+        tokens = set(_ASCII_TOKEN_RE.findall(text))
         for language, aliases in self.AUDIO_LANGUAGE_ALIASES.items():
             for alias in aliases:
                 normalized_alias = alias.casefold()
-                if re.search(r"[a-z0-9]", normalized_alias):
+                if _ASCII_TOKEN_RE.search(normalized_alias):
                     if normalized_alias in tokens:
                         return language
                 elif normalized_alias in text:
@@ -990,51 +1440,38 @@ class VideoPlayer(QtWidgets.QMainWindow):
         return any(spu_id >= 0 for spu_id, _name in self._subtitle_tracks())
 
     def _get_current_playlist(self) -> list[str]:
-        """現在の再生モードに応じたプレイリストを返すヘルパーメソッド"""
-        return self.playlist_controller.active(
-            self.directory_playlist,
-            self.shuffled_playlist,
-            self.shuffle_enabled,
-        )
+        """現在の再生モードに応じたプレイリストを返すヘルパーメソッド
+
+        呼び出し側は件数と空判定にしか使わないので、コピーせずに保持中のリストを
+        そのまま返す。変更はしないこと。
+        """
+        return self._shuffled_playlist if self.shuffle_enabled else self._directory_playlist
 
     def play_next(self) -> None:
         diagnostics.record_breadcrumb("play_next_requested")
         playlist = self._get_current_playlist()
         log_message(
-            f"play_next(): current_index={self.current_index}, playlist_len={len(playlist)}"
-        )
-        next_original_idx = self.playlist_controller.adjacent_index(
-            self.directory_playlist,
-            playlist,
-            self.current_index,
-            1,
+            "play_next(): current_index=%s, playlist_len=%s", self.current_index, len(playlist)
         )
+        next_original_idx = self._adjacent_index(1)
         if next_original_idx is None:
             return
         current_path = self.directory_playlist[self.current_index]
-        log_message(f"play_next(): current_path={current_path}")
-        QtCore.QTimer.singleShot(
-            50, lambda: self._play_at_with_reason(next_original_idx, "from_next")
-        )
-        log_message(f"play_next(): scheduling play_at({next_original_idx}) in 50ms")
+        log_message("play_next(): current_path=%s", current_path)
+        self._schedule_play_at(next_original_idx, 50, "from_next")
+        log_message("play_next(): scheduling play_at(%s) in 50ms", next_original_idx)
 
     def _play_at_with_reason(self, index: int, reason: str) -> None:
-        log_message(f"_play_at_with_reason(): index={index}, reason={reason}")
+        log_message("_play_at_with_reason(): index=%s, reason=%s", index, reason)
         diagnostics.record_breadcrumb("play_at_with_reason", index=index, reason=reason)
         self.play_at(index)
 
     def play_previous(self) -> None:
         diagnostics.record_breadcrumb("play_previous_requested")
-        playlist = self._get_current_playlist()
-        prev_original_idx = self.playlist_controller.adjacent_index(
-            self.directory_playlist,
-            playlist,
-            self.current_index,
-            -1,
-        )
+        prev_original_idx = self._adjacent_index(-1)
         if prev_original_idx is None:
             return
-        QtCore.QTimer.singleShot(50, lambda: self.play_at(prev_original_idx))
+        self._schedule_play_at(prev_original_idx, 50, "from_previous")
 
     # ------------- 再生操作 -------------
     def toggle_play(self) -> None:
@@ -1045,7 +1482,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
         # プレイヤーが完全に停止または終了している場合
         if player_state in (vlc.State.Stopped, vlc.State.Ended, vlc.State.Error):
             # 再生可能なファイルがプレイリストにあれば、現在のファイルを最初から再生する
-            if 0 <= self.current_index < len(self.directory_playlist):
+            if 0 <= self.current_index < self._playlist_len:
                 self.play_at(self.current_index)
         # 再生中または一時停止中の場合
         elif self.vlc_player.is_playing():
@@ -1063,10 +1500,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
     def _apply_stopped_ui_state(self) -> None:
         """再生停止に伴うUI（オーバーレイ・シークバー・再生ボタン）の更新。"""
         self.overlay.hide()
+        self._remember_time(-1)
+        self._time_label_key = None
+        self.time_label.clear()
         # 停止時にシークバーの色を通常に戻す
-        if self._is_seek_bar_warning:
-            self.seek_slider.setStyleSheet(self.SEEK_SLIDER_STYLE_NORMAL)
-            self._is_seek_bar_warning = False
+        self._set_seek_bar_warning(False)
 
         self.seek_slider.blockSignals(True)
         self.seek_slider.setEnabled(False)
@@ -1075,11 +1513,24 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.seek_slider.blockSignals(False)
         self._update_play_button()
 
+    def _remember_time(self, time_ms: int) -> None:
+        """直近の再生位置を記録する。-1 を渡すと記録を無効化する。"""
+        self._last_time_ms = time_ms
+        self._last_time_at_msec = QtCore.QDateTime.currentMSecsSinceEpoch()
+
+    def _current_time_ms(self) -> int:
+        """再生位置を返す。十分新しい記録があれば libVLC への問い合わせを省く。"""
+        if self._last_time_ms >= 0:
+            age = QtCore.QDateTime.currentMSecsSinceEpoch() - self._last_time_at_msec
+            if 0 <= age < self.TIME_CACHE_TTL_MS:
+                return self._last_time_ms
+        return self.vlc_player.get_time()
+
     def seek_by(self, delta_ms: int) -> None:
         diagnostics.record_breadcrumb("seek_by", delta_ms=delta_ms)
         try:
-            t = self.vlc_player.get_time()
-            length = self.vlc_player.get_length()
+            t = self._current_time_ms()
+            length = self._media_length if self._media_length > 0 else self.vlc_player.get_length()
             if t == -1 or length <= 0:
                 return
 
@@ -1094,12 +1545,38 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
             if length > 0:
                 new_t = max(min(new_t, length - 1000), 0)
-            self.vlc_player.set_time(new_t, context="seek_by_set_time", delta_ms=delta_ms)
+            if abs(new_t - t) >= self.SEEK_EPSILON_MS:
+                # キーリピートで連続シークしても直前の移動先を起点に積み上がるようにする
+                self._remember_time(new_t)
+                self._show_playback_position(new_t, length)
+                if self._seek_flush_timer.isActive():
+                    self._pending_seek_ms = new_t
+                else:
+                    self._apply_seek(new_t)
+                    self._seek_flush_timer.start()
             percent = int(round(new_t / length * 100)) if length > 0 else 0
             self._show_overlay(f"[{self._format_ms(new_t)} ({percent}%)]")
         except Exception as e:
             diagnostics.record_exception("seek_by", e, delta_ms=delta_ms)
 
+    def _apply_seek(self, new_t: int) -> None:
+        self._reset_time_event_throttle()
+        if not self.vlc_player.set_time(new_t, context="seek_by_set_time"):
+            self._remember_time(-1)
+
+    def _flush_pending_seek(self) -> None:
+        """保留中のシーク先を libVLC に渡す。渡した場合は次の間隔の計測を始める。"""
+        new_t = self._pending_seek_ms
+        if new_t < 0:
+            return
+        self._pending_seek_ms = -1
+        self._apply_seek(new_t)
+        self._seek_flush_timer.start()
+
+    def _cancel_pending_seek(self) -> None:
+        self._seek_flush_timer.stop()
+        self._pending_seek_ms = -1
+
     def _frame_step_ms(self) -> int:
         fps = self.vlc_player.get_fps()
         if fps > 0:
@@ -1108,6 +1585,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     def step_frame(self, direction: int) -> None:
         diagnostics.record_breadcrumb("step_frame", direction=direction)
+        self._flush_pending_seek()
         try:
             t = self.vlc_player.get_time()
             length = self.vlc_player.get_length()
@@ -1117,12 +1595,16 @@ class VideoPlayer(QtWidgets.QMainWindow):
             step_ms = self._frame_step_ms()
             delta_ms = step_ms if direction > 0 else -step_ms
             new_t = max(0, min(t + delta_ms, length - 1))
-            self.vlc_player.set_time(
+            self._reset_time_event_throttle()
+            if self.vlc_player.set_time(
                 new_t,
                 context="step_frame_set_time",
                 direction=direction,
                 step_ms=step_ms,
-            )
+            ):
+                # コマ送りは一時停止中に使うことが多く、そのときタイマーは位置を更新しない
+                self._show_playback_position(new_t, length)
+            self._remember_time(-1)
             percent = int(round(new_t / length * 100)) if length > 0 else 0
             self._show_overlay(f"[{self._format_ms(new_t)} ({percent}%)]")
         except Exception as e:
@@ -1139,8 +1621,31 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self._last_long_seek_msec_by_key[key] = now
         return False
 
-    def _should_ignore_long_seek(self, event: QtGui.QKeyEvent) -> bool:
-        return self._should_ignore_long_seek_key(int(event.key()))
+    # 矢印キー等の長押しで連続して呼ばれるショートカット用。lambda を介さず
+    # bound method を直接 activated に接続する。
+    def _short_seek_backward(self) -> None:
+        self.seek_by(-self.SEEK_SHORT_MS)
+
+    def _short_seek_forward(self) -> None:
+        self.seek_by(self.SEEK_SHORT_MS)
+
+    def _frame_step_backward(self) -> None:
+        self.step_frame(-1)
+
+    def _frame_step_forward(self) -> None:
+        self.step_frame(1)
+
+    def _volume_up(self) -> None:
+        self._adjust_volume(+10)
+
+    def _volume_down(self) -> None:
+        self._adjust_volume(-10)
+
+    def _speed_up(self) -> None:
+        self._change_playback_rate(+0.1)
+
+    def _speed_down(self) -> None:
+        self._change_playback_rate(-0.1)
 
     def _long_seek_forward(self) -> None:
         # Ctrl+→: 60秒進む(QShortcut から呼ばれる。フォーカス位置に依存しない)
@@ -1156,26 +1661,8 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     # ------------- キー操作 -------------
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:  # noqa: N802
+        qt = QtCore.Qt
         key = event.key()
-        mods = event.modifiers()
-        is_keypad = bool(mods & QtCore.Qt.KeypadModifier)
-
-        if is_keypad and key == QtCore.Qt.Key_4:
-            # Num4: 60秒進む
-            if self._should_ignore_long_seek(event):
-                event.accept()
-                return
-            self.seek_by(self.SEEK_LONG_MS)
-            event.accept()
-            return
-        if is_keypad and key == QtCore.Qt.Key_1:
-            # Num1: 60秒戻る
-            if self._should_ignore_long_seek(event):
-                event.accept()
-                return
-            self.seek_by(-self.SEEK_LONG_MS)
-            event.accept()
-            return
 
         # if key == QtCore.Qt.Key_PageUp:
         #     self.play_previous()
@@ -1186,22 +1673,41 @@ class VideoPlayer(QtWidgets.QMainWindow):
         #     event.accept()
         #     return
 
-        if is_keypad and key == QtCore.Qt.Key_8:
-            self.close()
-            event.accept()
+        # ここで扱うのはテンキーだけなので、それ以外は表を引かずに既定処理へ回す
+        handler = self._keypad_handlers.get(key) if event.modifiers() & qt.KeypadModifier else None
+        if handler is None:
+            super().keyPressEvent(event)
             return
+        handler()
+        event.accept()
 
-        if is_keypad and key == QtCore.Qt.Key_0:
-            # Num0 は常に最大化
-            self.showMaximized()
-            event.accept()
-            return
+    def _keypad_long_seek_forward(self) -> None:
+        # Num4: 60秒進む
+        if not self._should_ignore_long_seek_key(int(QtCore.Qt.Key_4)):
+            self.seek_by(self.SEEK_LONG_MS)
 
-        super().keyPressEvent(event)
+    def _keypad_long_seek_backward(self) -> None:
+        # Num1: 60秒戻る
+        if not self._should_ignore_long_seek_key(int(QtCore.Qt.Key_1)):
+            self.seek_by(-self.SEEK_LONG_MS)
 
     # ------------- グローバルショートカット -------------
     def _setup_shortcuts(self) -> None:
         bind_shortcuts(self, SHORTCUT_ROWS)
+        # keyPressEvent で扱うテンキー操作。キーごとの分岐を重ねず、表を 1 回引く
+        self._keypad_handlers: dict[int, Callable[[], object]] = {
+            QtCore.Qt.Key_4: self._keypad_long_seek_forward,
+            QtCore.Qt.Key_1: self._keypad_long_seek_backward,
+            QtCore.Qt.Key_8: self.close,
+            # Num0 は常に最大化
+            QtCore.Qt.Key_0: self.showMaximized,
+        }
+
+    def _move_current_file_to_ok(self) -> None:
+        self._move_current_file_and_play_next("_ok")
+
+    def _move_current_file_to_ng(self) -> None:
+        self._move_current_file_and_play_next("_ng")
 
     def _release_current_media_for_file_operation(self) -> bool:
         """ファイル操作のため再生を止め、メディアを解放する。
@@ -1237,6 +1743,8 @@ class VideoPlayer(QtWidgets.QMainWindow):
         戻り値は stop 完了を確認できたら ``True``、``timeout_ms`` 以内に完了を確認
         できなければ ``False``。
         """
+        # 先回りして開いた次の曲もファイルを掴み得るので、ファイル操作の前に手放す
+        self._discard_next_media()
         done = threading.Event()
         vlc_player = self.vlc_player
         generation = self._vlc_generation
@@ -1270,13 +1778,17 @@ class VideoPlayer(QtWidgets.QMainWindow):
         # stop 完了をメインスレッドで確認してから、メインスレッドでメディアを解放する。
         if self.vlc_player is vlc_player and self._vlc_generation == generation:
             vlc_player.set_media(None, context="move_current_file_clear_media")
+            if self._current_media is not None:
+                diagnostics.run_safely("media_release", self._current_media.release)
+                self._current_media = None
+                self._current_media_path = None
             log_message("[release] VLC stop finished; media cleared")
         else:
             log_message("[release] player changed while releasing; skip clear_media")
         return True
 
     def _current_file_path(self) -> str:
-        if 0 <= self.current_index < len(self.directory_playlist):
+        if 0 <= self.current_index < self._playlist_len:
             return self.directory_playlist[self.current_index]
         return ""
 
@@ -1344,70 +1856,109 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self._status_priority_until_msec = QtCore.QDateTime.currentMSecsSinceEpoch() + timeout_ms
         self.status.showMessage(msg, timeout_ms)
 
+    def _show_persistent_status_message(self, msg: str) -> None:
+        """タイムアウトなしのステータス文言を表示する。"""
+        # 優先メッセージ（移動完了など）の表示中は上書きしない。
+        now_msec = QtCore.QDateTime.currentMSecsSinceEpoch()
+        if now_msec < self._status_priority_until_msec:
+            return
+        # 同じ文字列なら再描画を省く
+        if msg != self.status.currentMessage():
+            self.status.showMessage(msg)
+
     # ------------- ステータス更新 -------------
     def _update_status_time(self) -> None:
         if not self.player:
             self._update_diagnostics_snapshot()
             return
+        # 一時停止中は位置が動かないので問い合わせない。一時停止中のシークは
+        # seek_by/step_frame 側で表示を更新する。
+        state = self.vlc_player.get_state()
+        if state == vlc.State.Paused:
+            return
         cur = self.vlc_player.get_time()
         total = self.vlc_player.get_length()
 
+        if cur >= 0:
+            self._remember_time(cur)
         if cur >= 0 and total > 0:
-            now_msec = QtCore.QDateTime.currentMSecsSinceEpoch()
-            if now_msec >= self._status_priority_until_msec:
-                self.status.showMessage(f"{self._format_ms(cur)} / {self._format_ms(total)}")
             if total != self._media_length:
-                self._media_length = total
-                self.seek_slider.blockSignals(True)
-                self.seek_slider.setEnabled(True)
-                self.seek_slider.setRange(0, total)
-                self.seek_slider.blockSignals(False)
-                self._update_window_title()
-                formatted_time = self._format_ms(total)
-                self._show_overlay(formatted_time)
-
-            if not self._seeking_user:
-                self.seek_slider.blockSignals(True)
-                self.seek_slider.setValue(cur)
-                self.seek_slider.blockSignals(False)
-
-            is_near_end = cur > total - 12_000  # 10秒だと判定が微妙なので12秒に余裕を持たせる
-            if is_near_end and not self._is_seek_bar_warning:
-                # 黄色に変更
-                self.seek_slider.setStyleSheet(self.SEEK_SLIDER_STYLE_WARNING)
-                self._is_seek_bar_warning = True
-            elif not is_near_end and self._is_seek_bar_warning:
-                # 青色に戻す
-                self.seek_slider.setStyleSheet(self.SEEK_SLIDER_STYLE_NORMAL)
-                self._is_seek_bar_warning = False
-        # 再生ボタン表示
-        self._update_play_button()
-        self._update_diagnostics_snapshot()
-
-    def _update_diagnostics_snapshot(self) -> None:
+                self._apply_media_length(total)
+            self._show_playback_position(cur, total)
+        # 問い合わせた値は診断情報にもそのまま使い、libVLC への往復を重ねない
+        self._update_diagnostics_snapshot((state, cur, total))
+
+    def _apply_media_length(self, total: int) -> None:
+        """確定した動画の長さをシークバーの範囲とタイトルに反映する。"""
+        self._media_length = total
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setEnabled(True)
+        self.seek_slider.setRange(0, total)
+        self.seek_slider.blockSignals(False)
+        self._update_window_title()
+        # 長さがメタデータの確定に合わせて何度か変わる動画でも、表示は 1 回だけ
+        if not self._overlay_shown_for_media:
+            self._overlay_shown_for_media = True
+            self._show_overlay(self._format_total(total))
+
+    def _format_total(self, total: int) -> str:
+        """総再生時間の表示文字列を返す。長さが変わったときだけ整形し直す。"""
+        if total != self._total_str_ms:
+            self._total_str_ms = total
+            self._total_str = self._format_ms(total)
+        return self._total_str
+
+    def _show_playback_position_text(self, cur: int, total: int) -> None:
+        """再生位置ラベルを更新する。表示は秒単位なので、秒が変わったときだけ書き換える。"""
+        pos_key = (cur // 1000, total)
+        if pos_key != self._time_label_key:
+            self._time_label_key = pos_key
+            self.time_label.setText(f"{format_ms(cur)} / {self._format_total(total)}")
+
+    def _show_playback_position(self, cur: int, total: int) -> None:
+        """再生位置をラベル・シークバー・終端警告色に反映する。"""
+        self._show_playback_position_text(cur, total)
+
+        if not self._seeking_user:
+            # 範囲はミリ秒単位なので、1px 未満の移動では値を更新せず再描画を省く
+            ms_per_pixel = max(1, total // max(1, self.seek_slider.width()))
+            if abs(cur - self.seek_slider.value()) >= ms_per_pixel:
+                # 再生位置の反映はユーザー操作ではないので、シグナルは出さない
+                with QtCore.QSignalBlocker(self.seek_slider):
+                    self.seek_slider.setValue(cur)
+
+        # 終端が近ければ黄色、そうでなければ青色。10秒だと判定が微妙なので12秒に余裕を持たせる
+        self._set_seek_bar_warning(cur > total - 12_000)
+
+    def _set_seek_bar_warning(self, warning: bool) -> None:
+        """シークバーの終端警告色を切り替える。状態が変わったときだけ再ポリッシュする。"""
+        if warning == self._is_seek_bar_warning:
+            return
+        self._is_seek_bar_warning = warning
+        self.seek_slider.setProperty("warning", warning)
+        style = self.seek_slider.style()
+        style.unpolish(self.seek_slider)
+        style.polish(self.seek_slider)
+        self.seek_slider.update()
+
+    def _update_diagnostics_snapshot(self, polled: Optional[tuple] = None) -> None:
+        """診断情報を更新する。polled は取得済みの (state, time, length)。"""
         current_path = self._current_file_path()
-        try:
-            player_state = str(self.vlc_player.get_state("")) if self.player else ""
-        except Exception as e:
-            player_state = f"error: {e!r}"
-        try:
-            player_time = self.vlc_player.get_time() if self.player else -1
-        except Exception:
-            player_time = -1
-        try:
-            player_length = self.vlc_player.get_length() if self.player else -1
-        except Exception:
-            player_length = -1
-        try:
-            player_rate = (
-                self.vlc_player.get_rate(self.playback_rate) if self.player else self.playback_rate
-            )
-        except Exception:
-            player_rate = self.playback_rate
-        try:
-            playing = self.vlc_player.is_playing() if self.player else False
-        except Exception:
-            playing = False
+        # VlcPlayerAdapter が例外を記録して既定値を返すので、ここでは包まない
+        if polled is not None:
+            state, player_time, player_length = polled
+            player_state = "" if state is None else str(state)
+        elif self.player:
+            player_state = str(self.vlc_player.get_state(""))
+            player_time = self.vlc_player.get_time()
+            player_length = self.vlc_player.get_length()
+        else:
+            player_state, player_time, player_length = "", -1, -1
+        player_rate = (
+            self.vlc_player.get_rate(self.playback_rate) if self.player else self.playback_rate
+        )
+        # 再生中フラグは VLC の Playing/Paused/Stopped イベントで更新済みの値を使う
+        playing = bool(getattr(self, "_last_playing_state", False))
         try:
             vlc_version = vlc.libvlc_get_version().decode("utf-8", errors="ignore")
         except Exception:
@@ -1416,7 +1967,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
         diagnostics.update_state_snapshot(
             current_file=current_path,
             current_index=self.current_index,
-            playlist_len=len(self.directory_playlist),
+            playlist_len=self._playlist_len,
             current_playlist_len=len(self._get_current_playlist()),
             shuffle_enabled=self.shuffle_enabled,
             repeat_enabled=self.repeat_enabled,
@@ -1430,26 +1981,49 @@ class VideoPlayer(QtWidgets.QMainWindow):
             player_rate=player_rate,
             playing=playing,
             media_length=self._media_length,
-            window_title=self.windowTitle(),
+            window_title=self._last_title,
             vlc_version=vlc_version,
         )
 
     def _update_window_title(self, filename: Optional[str] = None) -> None:
         current_path = (
             self.directory_playlist[self.current_index]
-            if 0 <= self.current_index < len(self.directory_playlist)
+            if 0 <= self.current_index < self._playlist_len
             else ""
         )
-        self.setWindowTitle(
-            build_window_title(
-                playlist=self._get_current_playlist(),
-                current_path=current_path,
-                shuffle_enabled=self.shuffle_enabled,
-                media_length_ms=self._media_length,
-                filename=filename,
-                file_size_bytes=self._current_file_size_bytes(current_path),
-            )
+        if self.shuffle_enabled:
+            playlist = self._shuffled_playlist
+            position = self._shuffled_path_to_index.get(current_path, -1) if current_path else -1
+        else:
+            playlist = self._directory_playlist
+            position = self.current_index if current_path else -1
+        inputs = (
+            current_path,
+            filename,
+            self.shuffle_enabled,
+            self._media_length,
+            len(playlist),
+            position,
         )
+        if inputs == self._title_inputs:
+            return
+        self._title_inputs = inputs
+        title = build_window_title(
+            playlist=playlist,
+            current_path=current_path,
+            shuffle_enabled=self.shuffle_enabled,
+            media_length_ms=self._media_length,
+            filename=filename,
+            file_size_bytes=self._current_file_size_bytes(current_path),
+            position=position,
+        )
+        if title != self._last_title:
+            self._last_title = title
+            self.setWindowTitle(title)
+
+    def _invalidate_title_cache(self) -> None:
+        """次の _update_window_title でファイルサイズも含めて組み立て直させる。"""
+        self._title_inputs = None
 
     def _current_file_size_bytes(self, current_path: str) -> int:
         """現在のファイルサイズ(バイト)を返す。取得できない場合は -1。"""
@@ -1461,10 +2035,10 @@ class VideoPlayer(QtWidgets.QMainWindow):
             return -1
 
     def _update_play_button(self) -> None:
-        try:
-            playing = self.vlc_player.is_playing()
-        except Exception:
-            playing = False
+        self._set_play_state(self.vlc_player.is_playing())
+
+    def _set_play_state(self, playing: bool) -> None:
+        """再生/一時停止アイコンを状態が変わったときだけ切り替える。"""
         if (
             getattr(self, "_last_playing_state", None) is None
             or self._last_playing_state != playing
@@ -1473,27 +2047,53 @@ class VideoPlayer(QtWidgets.QMainWindow):
             self.btn_play.setToolTip("一時停止" if playing else "再生")
             self._last_playing_state = playing
 
+    def _sync_status_timer(self, playing: bool) -> None:
+        """再生中かつ表示中のときだけステータス更新タイマーを回す。
+
+        一時停止・停止中は再生位置が動かないので、定期的な libVLC への問い合わせを
+        止める。ドラッグ中の短周期はシークバー操作側が管理する。
+        """
+        if self._seeking_user:
+            return
+        if playing and self.isVisible():
+            if not self.timer.isActive():
+                self.timer.start()
+        else:
+            self.timer.stop()
+
     # ------------- シークバー操作 -------------
     def _on_seek_pressed(self) -> None:
         diagnostics.record_breadcrumb("seek_pressed")
         self._seeking_user = True
+        # ドラッグ中だけ高精度・短周期にして、ステータス表示の追従を良くする
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.start(self.STATUS_SEEKING_INTERVAL_MS)
 
     def _on_seek_released(self) -> None:
         self._seeking_user = False
+        self.timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.timer.setInterval(self.STATUS_INTERVAL_MS)
+        self._sync_status_timer(bool(self._last_playing_state))
         val = self.seek_slider.value()
         diagnostics.record_breadcrumb("seek_released", value=val)
+        self._cancel_pending_seek()
+        self._reset_time_event_throttle()
         self.vlc_player.set_time(val, context="seek_released_set_time")
+        self._remember_time(-1)
 
     def _on_slider_moved(self, value: int) -> None:
         diagnostics.record_breadcrumb("slider_moved", value=value)
-        total = self._media_length if self._media_length > 0 else self.vlc_player.get_length()
-
+        # ドラッグ中はマウス移動ごとに呼ばれるため、長さは記録済みの値だけを使う
+        total = self._media_length
         if total > 0:
-            self.status.showMessage(f"{self._format_ms(value)} / {self._format_ms(total)}")
+            self._show_playback_position_text(value, total)
 
     def _on_slider_clicked(self, value: int) -> None:
         diagnostics.record_breadcrumb("slider_clicked", value=value)
+        self._cancel_pending_seek()
+        self._reset_time_event_throttle()
         self.vlc_player.set_time(value, context="slider_clicked_set_time")
+        self._remember_time(-1)
 
     # ------------- 再生速度操作 -------------
     def _change_playback_rate(self, delta: float) -> None:
@@ -1509,17 +2109,31 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     # ------------- 音量操作 -------------
     def _on_volume_changed(self, value: int) -> None:
-        diagnostics.record_breadcrumb("volume_changed", value=int(value))
+        value = int(value)
+        if value == self._last_volume:
+            return
+        self._last_volume = value
+        self._pending_volume = value
+        self._volume_apply_timer.start()
+        self._update_volume_label()
+        self._show_overlay(f"[ボリューム:{value}%]")
+
+    def _apply_pending_volume(self) -> None:
+        """保留中の音量を 1 回の audio_set_volume でまとめて反映する。"""
+        self._volume_apply_timer.stop()
+        value = self._pending_volume
+        if value is None:
+            return
+        self._pending_volume = None
+        diagnostics.record_breadcrumb("volume_changed", value=value)
         self.vlc_player.audio_set_volume(
-            int(value),
+            value,
             context="volume_changed_audio_set_volume",
         )
-        self._update_volume_label()
-        self._show_overlay(f"[ボリューム:{int(value)}%]")
 
     def _adjust_volume(self, delta: int) -> None:
         diagnostics.record_breadcrumb("adjust_volume", delta=delta)
-        v = int(self.volume_slider.value())
+        v = self._last_volume
         nv = max(0, min(100, v + delta))
         if nv != v:
             self.volume_slider.setValue(nv)
@@ -1532,20 +2146,24 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     def _update_volume_label(self) -> None:
         v = int(self.volume_slider.value())
-        self.volume_label.setText(f"音量: {v}%")
-        # アイコン切り替え
-        icon = self._icon_mute if self._muted else self._icon_volume
-        if hasattr(self, "volume_icon"):
-            self.volume_icon.setPixmap(icon.pixmap(18, 18))
+        if v != self._volume_label_value:
+            self.volume_label.setText(f"音量: {v}%")
+            self._volume_label_value = v
+        # アイコン切り替え(描画済み pixmap の差し替えはミュート状態が変わったときだけ)
+        if self._volume_icon_muted != self._muted:
+            self.volume_icon.setPixmap(self._pix_mute if self._muted else self._pix_volume)
+            self._volume_icon_muted = self._muted
 
     def _on_repeat_toggled(self, checked: bool) -> None:
         self.repeat_enabled = bool(checked)
         self._update_repeat_button()
 
     def _update_repeat_button(self) -> None:
-        self.btn_repeat.setIcon(
-            self._icon_repeat_on if self.repeat_enabled else self._icon_repeat_off
-        )
+        if self._repeat_icon_state != self.repeat_enabled:
+            self.btn_repeat.setIcon(
+                self._icon_repeat_on if self.repeat_enabled else self._icon_repeat_off
+            )
+            self._repeat_icon_state = self.repeat_enabled
         # 押下状態の視覚フィードバック
         self.btn_repeat.setChecked(self.repeat_enabled)
 
@@ -1557,14 +2175,12 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     def _create_or_clear_shuffled_playlist(self):
         """シャッフルリストを作成またはクリアする"""
-        import random
-
         if self.shuffle_enabled and self.directory_playlist:
             log_message("Shuffle mode enabled. Creating shuffled playlist.")
             self.shuffled_playlist = self.playlist_controller.shuffled(
                 self.directory_playlist,
                 self.current_index,
-                random.shuffle,
+                self._random.shuffle,
             )
         else:
             log_message("Shuffle mode disabled.")
@@ -1572,9 +2188,12 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
     # _toggle_shuffleから_update_shuffle_buttonに名前を変更したものを流用
     def _update_shuffle_button(self):
-        self.btn_shuffle.setIcon(
-            self._icon_shuffle_on if self.shuffle_enabled else self._icon_shuffle_off
-        )
+        # 読み込み済みのアイコンを、状態が変わったときだけ差し替える
+        if self._shuffle_icon_state != self.shuffle_enabled:
+            self.btn_shuffle.setIcon(
+                self._icon_shuffle_on if self.shuffle_enabled else self._icon_shuffle_off
+            )
+            self._shuffle_icon_state = self.shuffle_enabled
         self.btn_shuffle.setChecked(self.shuffle_enabled)
 
     def _toggle_mute(self) -> None:
@@ -1590,22 +2209,35 @@ class VideoPlayer(QtWidgets.QMainWindow):
     # ------------- ファイルダイアログ -------------
     def open_files_dialog(self) -> None:
         diagnostics.record_breadcrumb("open_files_dialog")
-        start_dir = self.settings.value("last_dir", os.path.expanduser("~"))
-        supported_patterns = " ".join(f"*{ext}" for ext in SUPPORTED_VIDEO_EXTENSIONS)
-        file_filter = f"動画ファイル ({supported_patterns});;すべてのファイル (*.*)"
-        file, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self,
-            "動画ファイルを選択",
-            start_dir,
-            file_filter,
-        )
-        if file:
-            diagnostics.record_breadcrumb("open_files_dialog_selected", path=file)
-            try:
-                self.settings.setValue("last_dir", os.path.dirname(file))
-            except Exception as e:
-                diagnostics.record_exception("open_files_dialog_save_last_dir", e, path=file)
-            self._load_file_and_directory(file)
+        if self._open_file_dialog is not None:
+            self._open_file_dialog.raise_()
+            self._open_file_dialog.activateWindow()
+            return
+        start_dir = self.settings.value("last_dir", _HOME_DIR)
+        # 静的な getOpenFileName は閉じるまで入れ子のイベントループで待つため、
+        # open() で表示して選択結果は fileSelected で受け取る。
+        dialog = QtWidgets.QFileDialog(self, "動画ファイルを選択", start_dir, _VIDEO_FILE_FILTER)
+        dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+        dialog.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_file_selected)
+        # WA_DeleteOnClose で閉じると削除されるので、参照は閉じた時点で手放す
+        dialog.finished.connect(self._on_open_file_dialog_finished)
+        self._open_file_dialog = dialog
+        dialog.open()
+
+    def _on_open_file_dialog_finished(self, _result: int) -> None:
+        self._open_file_dialog = None
+
+    def _on_file_selected(self, file: str) -> None:
+        if not file:
+            return
+        diagnostics.record_breadcrumb("open_files_dialog_selected", path=file)
+        # QSettings は書き込みをまとめて後で保存するので、ここでは値を更新するだけ。
+        # 同じフォルダから続けて開いたときは書き込み自体を省く。
+        last_dir = os.path.dirname(file)
+        if self.settings_store.value("last_dir") != last_dir:
+            self.settings_store.set_value("last_dir", last_dir)
+        self._load_file_and_directory(file)
 
     # ------------- ファイル移動と次の動画再生 -------------
     def _prompt_target_file_exists(self, file_name: str, subfolder_name: str) -> str:
@@ -1632,7 +2264,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
         rename_button = box.addButton("別名で移動保存", QtWidgets.QMessageBox.AcceptRole)
         cancel_button = box.addButton("キャンセル", QtWidgets.QMessageBox.RejectRole)
         box.setDefaultButton(cancel_button)
-        log_message(f"[DEBUG move] Showing target-exists dialog for '{file_name}'.")
+        log_message("[DEBUG move] Showing target-exists dialog for '%s'.", file_name)
         box.exec_()
         log_message("[DEBUG move] target-exists dialog closed.")
 
@@ -1646,10 +2278,37 @@ class VideoPlayer(QtWidgets.QMainWindow):
         log_message("[DEBUG move] dialog choice = cancel")
         return "cancel"
 
+    def _run_file_io_without_blocking_ui(self, func: Callable[[], _T]) -> _T:
+        """ファイル移動などの I/O をワーカースレッドで実行し、完了までイベントループを回す。
+
+        別ドライブへの移動はコピー + 削除になり、リトライ待ちも含めると数秒かかる。
+        ``_stop_and_clear_media_without_blocking_ui`` と同じく、メインスレッドは
+        ユーザー入力を除くイベントを処理しながら待つ。``func`` は Qt オブジェクトに
+        触れないこと。例外はメインスレッドで送出し直す。
+        """
+        done = threading.Event()
+        outcome: dict[str, object] = {}
+
+        def _worker() -> None:
+            try:
+                outcome["result"] = func()
+            except BaseException as e:  # noqa: BLE001 - 呼び出し元で送出し直す
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        thread = threading.Thread(target=_worker, name="wagom-file-io", daemon=True)
+        thread.start()
+        while not done.wait(0.01):
+            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.ExcludeUserInputEvents, 50)
+        if "error" in outcome:
+            raise outcome["error"]  # type: ignore[misc]
+        return outcome["result"]  # type: ignore[return-value]
+
     def _discard_current_file(self, file_path: str) -> None:
         """現在のファイルをごみ箱へ移動する。ごみ箱が使えない場合は削除しない。"""
         self.trash_service.discard(file_path)
-        log_message(f"Moved source file to trash: '{file_path}' (target already existed).")
+        log_message("Moved source file to trash: '%s' (target already existed).", file_path)
 
     def _move_current_file_and_play_next(self, subfolder_name: str):
         """現在再生中のファイルを指定されたサブフォルダに移動し、次の曲を再生する"""
@@ -1659,7 +2318,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
             return
 
         # 再生中でない、またはプレイリストが空の場合は何もしない
-        if not (0 <= self.current_index < len(self.directory_playlist)):
+        if not (0 <= self.current_index < self._playlist_len):
             log_message("Move requested, but no file is playing.")
             return
 
@@ -1676,12 +2335,6 @@ class VideoPlayer(QtWidgets.QMainWindow):
         try:
             self._file_operation_in_progress = True
 
-            # ★ シャッフル時に「シャッフル順の次」を覚えておく
-            next_path = None
-            if self.shuffle_enabled:
-                playlist = self._get_current_playlist()
-                next_path = self.playlist_controller.next_path(playlist, current_file_path)
-
             # --- ファイルパスの準備 ---
             file_name = os.path.basename(current_file_path)
             # 移動先に同名ファイルがあった場合の解決方法。
@@ -1690,10 +2343,14 @@ class VideoPlayer(QtWidgets.QMainWindow):
             #   "delete" : 現在のファイルをごみ箱へ移動（移動はしない）
             collision_resolution = None
             try:
-                target_file_path = validate_move_to_subfolder(current_file_path, subfolder_name)
-            except TargetFileExistsError:
-                existing_target = target_path_for_subfolder(current_file_path, subfolder_name)
-                log_message(f"File '{file_name}' already exists in target directory. Asking user.")
+                # 存在確認もネットワーク共有では遅いことがあるので、移動と同じく UI を止めない
+                target_file_path = self._run_file_io_without_blocking_ui(
+                    lambda: validate_move_to_subfolder(current_file_path, subfolder_name)
+                )
+            except TargetFileExistsError as e:
+                # 検証で組み立て済みの移動先パスを使い、同じ計算をやり直さない
+                existing_target = e.args[0]
+                log_message("File '%s' already exists in target directory. Asking user.", file_name)
                 diagnostics.record_breadcrumb(
                     "move_current_file_target_exists", target=existing_target
                 )
@@ -1703,11 +2360,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 )
                 target_file_path = None  # 実際の移動先は解決方法に応じて後で決める
                 if collision_resolution not in ("rename", "delete"):  # "cancel"
-                    log_message(f"Move of '{file_name}' cancelled by user (target exists).")
+                    log_message("Move of '%s' cancelled by user (target exists).", file_name)
                     self._show_status_message("移動をキャンセルしました", 4000)
                     return
             except (FileNotFoundError, InvalidMoveTargetError) as e:
-                log_message(f"Move validation failed: {e}")
+                log_message("Move validation failed: %s", e)
                 self._show_status_message(f"移動失敗: {e}", 5000)
                 diagnostics.record_breadcrumb("move_current_file_validation_error", error=str(e))
                 return
@@ -1727,9 +2384,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
             try:
                 if collision_resolution == "delete":
                     try:
-                        self._discard_current_file(current_file_path)
+                        self._run_file_io_without_blocking_ui(
+                            lambda: self._discard_current_file(current_file_path)
+                        )
                     except Exception as e:
-                        log_message(f"Failed to move source to trash: {e}")
+                        log_message("Failed to move source to trash: %s", e)
                         self._show_status_message(
                             f"ごみ箱への移動に失敗: {e}（再生は停止しました）",
                             5000,
@@ -1745,33 +2404,40 @@ class VideoPlayer(QtWidgets.QMainWindow):
                     )
                 elif collision_resolution == "rename":
                     log_message(
-                        f"Attempting to move '{file_name}' to '{subfolder_name}' "
-                        "folder under a unique name."
-                    )
-                    target_file_path = move_file_to_subfolder_as_unique(
-                        current_file_path,
+                        "Attempting to move '%s' to '%s' folder under a unique name.",
+                        file_name,
                         subfolder_name,
-                        retry_delays=(0.2, 0.5, 1.0, 2.0),
+                    )
+                    target_file_path = self._run_file_io_without_blocking_ui(
+                        lambda: move_file_to_subfolder_as_unique(
+                            current_file_path,
+                            subfolder_name,
+                            retry_delays=(0.2, 0.5, 1.0, 2.0),
+                        )
                     )
                     moved_name = os.path.basename(target_file_path)
                     self._show_status_message(
                         f"別名で移動完了: {file_name} -> {subfolder_name}/{moved_name}", 4000
                     )
-                    log_message(f"Successfully moved file to '{target_file_path}'")
+                    log_message("Successfully moved file to '%s'", target_file_path)
                     diagnostics.record_breadcrumb(
                         "move_current_file_success",
                         source=current_file_path,
                         target=target_file_path,
                     )
                 else:
-                    log_message(f"Attempting to move '{file_name}' to '{subfolder_name}' folder.")
-                    target_file_path = move_file_to_subfolder(
-                        current_file_path,
-                        subfolder_name,
-                        retry_delays=(0.2, 0.5, 1.0, 2.0),
+                    log_message(
+                        "Attempting to move '%s' to '%s' folder.", file_name, subfolder_name
+                    )
+                    target_file_path = self._run_file_io_without_blocking_ui(
+                        lambda: move_file_to_subfolder(
+                            current_file_path,
+                            subfolder_name,
+                            retry_delays=(0.2, 0.5, 1.0, 2.0),
+                        )
                     )
                     self._show_status_message(f"移動完了: {file_name} -> {subfolder_name}", 4000)
-                    log_message(f"Successfully moved file to '{target_file_path}'")
+                    log_message("Successfully moved file to '%s'", target_file_path)
                     diagnostics.record_breadcrumb(
                         "move_current_file_success",
                         source=current_file_path,
@@ -1780,7 +2446,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
             except TargetFileExistsError:
                 log_message(
-                    f"File '{file_name}' already exists in target directory. Skipping move."
+                    "File '%s' already exists in target directory. Skipping move.", file_name
                 )
                 self._show_status_message(f"移動失敗: {file_name}は移動先に既に存在します", 5000)
                 diagnostics.record_breadcrumb(
@@ -1789,7 +2455,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 # ファイルが存在した場合、次の曲の再生は行わずに待機する
                 return
             except Exception as e:
-                log_message(f"Error moving file: {e}")
+                log_message("Error moving file: %s", e)
                 self._show_status_message(f"ファイル移動中にエラーが発生しました: {e}", 5000)
                 diagnostics.record_breadcrumb("move_current_file_error", error=str(e))
                 # エラーが発生した場合も、次の曲の再生は行わずに待機する
@@ -1797,11 +2463,26 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
             # --- プレイリストの更新と次の曲の再生 ---
 
+            # 解放とファイル I/O の間はイベントを処理しているため、ディレクトリ走査の
+            # 結果などでプレイリストが差し替わっていることがある。位置は引き直す
+            index_to_remove = self._find_playlist_index(current_file_path)
+            if index_to_remove < 0:
+                log_message("Moved file is no longer in the playlist. Playback remains stopped.")
+                self._update_window_title()
+                return
+
+            # ★ シャッフル時に「シャッフル順の次」を覚えておく
+            next_path = None
+            if self.shuffle_enabled:
+                next_original_idx = self._adjacent_index(1)
+                if next_original_idx is not None:
+                    next_path = self.directory_playlist[next_original_idx]
+
             # プレイリストから該当ファイルを削除
-            self.directory_playlist.pop(index_to_remove)
+            self._remove_playlist_entry(index_to_remove)
             # 2. シャッフルリストからも削除
-            if self.shuffle_enabled and current_file_path in self.shuffled_playlist:
-                self.shuffled_playlist.remove(current_file_path)
+            if self.shuffle_enabled:
+                self._remove_shuffled_entry(current_file_path)
 
             # ウィンドウタイトルの表示を更新
             self._update_window_title()
@@ -1818,14 +2499,15 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 index_to_remove,
                 self.shuffle_enabled,
                 next_path,
+                self._path_to_index,
             )
 
             if next_index is None:
                 log_message("No next item to play after move. Playback remains stopped.")
                 self.stop()
             else:
-                log_message(f"Playing next item at index {next_index}.")
-                QtCore.QTimer.singleShot(50, lambda idx=next_index: self.play_at(idx))
+                log_message("Playing next item at index %d.", next_index)
+                self._schedule_play_at(next_index, 50, "from_move")
         finally:
             self._file_operation_in_progress = False
 
@@ -1839,21 +2521,22 @@ class VideoPlayer(QtWidgets.QMainWindow):
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         """ウィンドウのリサイズに合わせてオーバーレイラベルのサイズを調整する"""
         super().resizeEvent(event)
-        # video_frameの現在の大きさにラベルをぴったり合わせる
-        self.overlay.resize_to_frame_rect()
+        # video_frameの現在の大きさにラベルをぴったり合わせる(表示中のみ、まとめて)
+        if self.duration_overlay_label.isVisible():
+            self._overlay_geometry_timer.start()
 
     def moveEvent(self, event: QtGui.QMoveEvent) -> None:
         """メインウィンドウの移動に合わせてオーバーレイの位置を更新する"""
         super().moveEvent(event)
         # 表示されている場合のみ、位置を更新する
         if self.duration_overlay_label.isVisible():
-            self._update_overlay_geometry()
+            self._overlay_geometry_timer.start()
 
     def _show_metadata_dialog(self):
         """現在再生中の動画のメタデータを抽出し、ダイアログで表示する"""
         diagnostics.record_breadcrumb("show_metadata_dialog")
         # 再生中でなければ何もしない
-        if not (0 <= self.current_index < len(self.directory_playlist)):
+        if not (0 <= self.current_index < self._playlist_len):
             self._show_status_message("再生中のファイルがありません", 3000)
             return
 
@@ -1875,50 +2558,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
         metadata_lines.append("-" * 20)
 
         # 2. VLCから取得できるメタデータ
-        # 取得したいメタデータの種類を定義
-        # 表示したいメタデータの種類を、表示名とvlc.Meta enumのマッピングで定義
-        meta_fields = {
-            # --- 基本情報 ---
-            "Title": vlc.Meta.Title,
-            "Artist": vlc.Meta.Artist,
-            "Album": vlc.Meta.Album,
-            "Album Artist": vlc.Meta.AlbumArtist,
-            "Genre": vlc.Meta.Genre,
-            "Date": vlc.Meta.Date,
-            "Description": vlc.Meta.Description,
-            # --- トラック/ディスク情報 ---
-            "Track Number": vlc.Meta.TrackNumber,
-            "Track Total": vlc.Meta.TrackTotal,
-            "Disc Number": vlc.Meta.DiscNumber,
-            "Disc Total": vlc.Meta.DiscTotal,
-            "Track ID": vlc.Meta.TrackID,
-            # --- TV/映画情報 ---
-            "Show Name": vlc.Meta.ShowName,
-            "Season": vlc.Meta.Season,
-            "Episode": vlc.Meta.Episode,
-            "Director": vlc.Meta.Director,
-            "Actors": vlc.Meta.Actors,
-            # --- その他 ---
-            "Rating": vlc.Meta.Rating,
-            "Language": vlc.Meta.Language,
-            "Copyright": vlc.Meta.Copyright,
-            "Publisher": vlc.Meta.Publisher,
-            "Encoded By": vlc.Meta.EncodedBy,
-            "Setting": vlc.Meta.Setting,
-            "URL": vlc.Meta.URL,
-            "Artwork URL": vlc.Meta.ArtworkURL,
-            "Now Playing": vlc.Meta.NowPlaying,
-        }
-
-        for name, field_enum in meta_fields.items():
-            # media.get_meta() は値がなければ None を返す
-            value = media.get_meta(field_enum)
-
-            # valueがNoneなら空文字列に変換し、そうでなければそのままの値を使う
-            # これにより、値がなくても "項目名: " という行が必ず追加される
-            display_value = value or ""
-
-            metadata_lines.append(f"{name}: {display_value}")
+        # media.get_meta() は値がなければ None を返す。値がなくても "項目名: " の行は必ず出す
+        metadata_lines.extend(
+            f"{name}: {media.get_meta(getattr(vlc.Meta, attr)) or ''}"
+            for name, attr in self.METADATA_FIELDS
+        )
 
         # --- ダイアログの表示 ---
         final_text = "\n".join(metadata_lines)
@@ -4,7 +4,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 
 from ..seek_slider import SeekSlider
 from ..theme import resource_path
-from ..ui_styles import VOLUME_SLIDER_STYLE
+from ..ui_styles import SEEK_SLIDER_STYLE, VOLUME_SLIDER_STYLE
 
 
 def build_player_view(window: Any) -> None:
@@ -16,9 +16,15 @@ def build_player_view(window: Any) -> None:
     window.video_frame = QtWidgets.QFrame(window)
     window.video_frame.setFrameShape(QtWidgets.QFrame.NoFrame)
     window.video_frame.setStyleSheet("background: #000;")
+    # VLC の描画先になるネイティブウィンドウを構築時に作っておき、最初の再生時に
+    # ネイティブ化とそれに伴う再レイアウトが走らないようにする
+    window.video_frame.setAttribute(QtCore.Qt.WA_NativeWindow, True)
     layout.addWidget(window.video_frame, 1)
 
     window.seek_slider = SeekSlider(QtCore.Qt.Horizontal, window)
+    window.seek_slider.setObjectName("SeekSlider")
+    window.seek_slider.setProperty("warning", False)
+    window.seek_slider.setStyleSheet(SEEK_SLIDER_STYLE)
     window.seek_slider.setMinimumHeight(22)
     window.seek_slider.setRange(0, 0)
     window.seek_slider.setEnabled(False)
@@ -55,6 +61,8 @@ def build_player_view(window: Any) -> None:
     window.volume_label = QtWidgets.QLabel("音量")
     window.volume_slider = SeekSlider(QtCore.Qt.Horizontal, window)
     window.volume_slider.setObjectName("VolumeSlider")
+    # シークバーと同じく、スタイルはスライダー自身にだけ設定する(ウィンドウ全体を再スタイルしない)
+    window.volume_slider.setStyleSheet(VOLUME_SLIDER_STYLE)
     window.volume_slider.setMinimumHeight(22)
     window.volume_slider.setRange(0, 100)
     window.volume_slider.setFixedWidth(140)
@@ -63,11 +71,26 @@ def build_player_view(window: Any) -> None:
     controls.addWidget(window.volume_label)
     controls.addWidget(window.volume_slider)
 
-    window.setStyleSheet(window.styleSheet() + VOLUME_SLIDER_STYLE)
     window.status = window.statusBar()
+    # 再生位置は毎秒変わるので、一時メッセージ欄ではなく常設のラベルに出す。
+    # 幅を固定しておけば、文字が変わってもステータスバーのレイアウトは動かない。
+    window.time_label = QtWidgets.QLabel(window)
+    window.time_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+    window.time_label.setFixedWidth(
+        window.time_label.fontMetrics().horizontalAdvance("00:00:00 / 00:00:00") + 8
+    )
+    window.status.addPermanentWidget(window.time_label)
     window.status.showMessage("準備完了")
 
 
+def _prerendered_icon(*parts: str) -> QtGui.QIcon:
+    """SVG を 18x18 で一度だけラスタライズした pixmap ベースの QIcon を返す。
+
+    状態に応じて差し替えるアイコン用。差し替えのたびに SVG を描き直さずに済む。
+    """
+    return QtGui.QIcon(QtGui.QIcon(resource_path(*parts)).pixmap(18, 18))
+
+
 def apply_control_icons(window: Any) -> None:
     def style_button(button: QtWidgets.QPushButton, icon_path: str, tooltip: str) -> None:
         button.setIcon(QtGui.QIcon(icon_path))
@@ -80,8 +103,8 @@ def apply_control_icons(window: Any) -> None:
     style_button(window.btn_prev, resource_path("resources", "icons", "prev.svg"), "前へ")
     style_button(window.btn_next, resource_path("resources", "icons", "next.svg"), "次へ")
 
-    window._icon_play = QtGui.QIcon(resource_path("resources", "icons", "play.svg"))
-    window._icon_pause = QtGui.QIcon(resource_path("resources", "icons", "pause.svg"))
+    window._icon_play = _prerendered_icon("resources", "icons", "play.svg")
+    window._icon_pause = _prerendered_icon("resources", "icons", "pause.svg")
     window.btn_play.setFixedSize(36, 28)
     window.btn_play.setIconSize(QtCore.QSize(18, 18))
     window._last_playing_state = None
@@ -89,19 +112,25 @@ def apply_control_icons(window: Any) -> None:
 
     window._icon_volume = QtGui.QIcon(resource_path("resources", "icons", "volume.svg"))
     window._icon_mute = QtGui.QIcon(resource_path("resources", "icons", "mute.svg"))
-    window.volume_icon.setPixmap(window._icon_volume.pixmap(18, 18))
-
-    window._icon_repeat_on = QtGui.QIcon(resource_path("resources", "icons", "repeat.svg"))
-    window._icon_repeat_off = QtGui.QIcon(resource_path("resources", "icons", "repeat_off.svg"))
+    # 音量アイコンは切替が多いので、描画済みの pixmap を使い回す
+    window._pix_volume = window._icon_volume.pixmap(18, 18)
+    window._pix_mute = window._icon_mute.pixmap(18, 18)
+    window.volume_icon.setPixmap(window._pix_volume)
+    window._volume_icon_muted = False
+
+    window._icon_repeat_on = _prerendered_icon("resources", "icons", "repeat.svg")
+    window._icon_repeat_off = _prerendered_icon("resources", "icons", "repeat_off.svg")
     window.btn_repeat.setFixedSize(36, 28)
     window.btn_repeat.setIconSize(QtCore.QSize(18, 18))
     window.btn_repeat.setToolTip("リピート再生")
     window.repeat_enabled = False
+    window._repeat_icon_state = None
     window._update_repeat_button()
 
-    window._icon_shuffle_on = QtGui.QIcon(resource_path("resources", "icons", "shuffle.svg"))
-    window._icon_shuffle_off = QtGui.QIcon(resource_path("resources", "icons", "shuffle_off.svg"))
+    window._icon_shuffle_on = _prerendered_icon("resources", "icons", "shuffle.svg")
+    window._icon_shuffle_off = _prerendered_icon("resources", "icons", "shuffle_off.svg")
     window.btn_shuffle.setFixedSize(36, 28)
     window.btn_shuffle.setIconSize(QtCore.QSize(18, 18))
     window.btn_shuffle.setToolTip("シャッフル再生")
+    window._shuffle_icon_state = None
     window._update_shuffle_button()
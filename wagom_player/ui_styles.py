@@ -1,12 +1,13 @@
-SEEK_SLIDER_STYLE_NORMAL = """
-    QSlider::groove:horizontal {
+# 終端警告色は動的プロパティ warning で切り替える(スタイルシートの再設定を避けるため)
+SEEK_SLIDER_STYLE = """
+    #SeekSlider::groove:horizontal {
         border: none;
         height: 4px;
         background: #555;
         border-radius: 2px;
         margin: 0px 4px;
     }
-    QSlider::handle:horizontal {
+    #SeekSlider::handle:horizontal {
         background: #4a90e2;
         border: none;
         width: 8px;
@@ -14,33 +15,16 @@ SEEK_SLIDER_STYLE_NORMAL = """
         border-radius: 4px;
         margin: -5px -4px;
     }
-    QSlider::sub-page:horizontal {
+    #SeekSlider::sub-page:horizontal {
         background: #4a90e2;
         border: none;
         border-radius: 2px;
     }
-"""
-
-SEEK_SLIDER_STYLE_WARNING = """
-    QSlider::groove:horizontal {
-        border: none;
-        height: 4px;
-        background: #555;
-        border-radius: 2px;
-        margin: 0px 4px;
-    }
-    QSlider::handle:horizontal {
+    #SeekSlider[warning="true"]::handle:horizontal {
         background: #f5a623;
-        border: none;
-        width: 8px;
-        height: 14px;
-        border-radius: 4px;
-        margin: -5px -4px;
     }
-    QSlider::sub-page:horizontal {
+    #SeekSlider[warning="true"]::sub-page:horizontal {
         background: #f5a623;
-        border: none;
-        border-radius: 2px;
     }
 """
 